@@ -7,5 +7,19 @@ This module contains base classes and abstractions for managing Docker resources
 from .resource_manager import ResourceManager
 from .resource_view import ResourceView
 from .base_operations import BaseOperations
+from .cache_policy import CachePolicy
+from .query import CompiledQuery, QueryError, QueryField, compile_query
+from .relation_graph import RelationGraph
+from .scheduler import Priority, TaskScheduler, scheduler
+from .search_index import SearchIndex
+from .search_pipeline import SearchPipeline
+from .single_flight import SingleFlight
+from .snapshot import Snapshot
+from .sorting import SortCache
 
-__all__ = ['ResourceManager', 'ResourceView', 'BaseOperations'] 
\ No newline at end of file
+__all__ = [
+    'ResourceManager', 'ResourceView', 'BaseOperations', 'CachePolicy',
+    'CompiledQuery', 'QueryError', 'QueryField', 'compile_query', 'RelationGraph',
+    'Priority', 'TaskScheduler', 'scheduler', 'SearchIndex',
+    'SearchPipeline', 'SingleFlight', 'Snapshot', 'SortCache'
+] 
\ No newline at end of file
@@ -0,0 +1,53 @@
+from typing import Optional
+
+
+class CachePolicy:
+    """
+    Stale-while-revalidate freshness rules for one resource listing.
+
+    A snapshot younger than revalidate_interval is fresh and served as is.
+    After that it is stale: it is still served at once while a background
+    revalidation replaces it. Only a snapshot older than max_staleness (or
+    none at all) makes callers wait for a load.
+    """
+
+    FRESH = "fresh"
+    STALE = "stale"
+    EXPIRED = "expired"
+
+    def __init__(self, revalidate_interval: float, max_staleness: Optional[float] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            revalidate_interval: Age in seconds after which a snapshot is revalidated
+            max_staleness: Age in seconds after which a snapshot is no longer
+                shown while revalidating (None to always show it)
+        """
+        if max_staleness is not None and max_staleness < revalidate_interval:
+            raise ValueError("max_staleness must not be less than revalidate_interval")
+
+        self.revalidate_interval = revalidate_interval
+        self.max_staleness = max_staleness
+
+    def get_state(self, age: Optional[float], valid: bool = True) -> str:
+        """
+        Classify a snapshot.
+
+        Args:
+            age: Age of the snapshot in seconds (None if there is none)
+            valid: False if the snapshot was invalidated by a change
+
+        Returns:
+            FRESH, STALE or EXPIRED
+        """
+        if age is None:
+            return self.EXPIRED
+        if self.max_staleness is not None and age >= self.max_staleness:
+            return self.EXPIRED
+        if not valid or age >= self.revalidate_interval:
+            return self.STALE
+        return self.FRESH
+
+    def __repr__(self) -> str:
+        return f"CachePolicy(revalidate_interval={self.revalidate_interval}, max_staleness={self.max_staleness})"
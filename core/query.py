@@ -0,0 +1,260 @@
+import fnmatch
+import re
+import shlex
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+class QueryError(ValueError):
+    """Invalid term in a resource query."""
+
+
+TRUE_VALUES = {"true", "yes", "1"}
+FALSE_VALUES = {"false", "no", "0"}
+
+# Docker's container status filter rejects anything else
+CONTAINER_STATES = {"created", "restarting", "running", "removing", "paused", "exited", "dead"}
+
+
+class QueryField:
+    """
+    A field that query terms ("field:value") can test.
+
+    The value is read from the resource by get_value. Text values are
+    compared case-insensitively and may use glob patterns (nginx*); label
+    terms take "key" or "key=value". A field with a daemon_filter can also
+    be evaluated by the Docker API's filters= parameter.
+    """
+
+    TEXT = "text"
+    BOOL = "bool"
+    LABELS = "labels"
+
+    def __init__(self, get_value: Callable[[Any], Any], kind: str = TEXT,
+                 daemon_filter: Optional[str] = None, daemon_values: Optional[Set[str]] = None):
+        """
+        Initialize the field.
+
+        Args:
+            get_value: Function returning the value of a resource (a string or a
+                list of strings, a bool, or a labels dict depending on kind)
+            kind: TEXT, BOOL or LABELS
+            daemon_filter: Name of the Docker API filter for this field
+                (None if only the client can evaluate it)
+            daemon_values: Values the daemon accepts for the filter (None for any)
+        """
+        self.get_value = get_value
+        self.kind = kind
+        self.daemon_filter = daemon_filter
+        self.daemon_values = daemon_values
+
+
+class CompiledQuery:
+    """
+    A query compiled into predicate closures and Docker API filters.
+
+    The free text is matched by the resource search; the predicates hold
+    every field term. The daemon filters select a superset of the matches,
+    so the predicates still apply to what the daemon returns.
+    """
+
+    def __init__(self, source: str, text: str = "",
+                 predicates: Optional[List[Callable[[Any], bool]]] = None,
+                 daemon_filters: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the compiled query.
+
+        Args:
+            source: Query as typed
+            text: Lowercased free text (terms without a known field)
+            predicates: Functions every matching resource satisfies
+            daemon_filters: Docker API filters, e.g. {"status": ["running"]}
+        """
+        self.source = source
+        self.text = text
+        self.predicates = predicates or []
+        self.daemon_filters = daemon_filters or {}
+
+    def matches(self, resource: Any) -> bool:
+        """
+        Check the field terms against a resource.
+
+        Args:
+            resource: Resource to check
+
+        Returns:
+            True if every field term matches (the free text is not checked)
+        """
+        for predicate in self.predicates:
+            if not predicate(resource):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"CompiledQuery({self.source!r}, text={self.text!r}, daemon_filters={self.daemon_filters!r})"
+
+
+def _split_terms(query: str) -> List[str]:
+    """Split a query into terms, honouring quotes once they are closed."""
+    try:
+        return shlex.split(query)
+    except ValueError:
+        # Unbalanced quote while the user is still typing
+        return query.split()
+
+
+def _is_glob(value: str) -> bool:
+    return any(char in value for char in "*?[")
+
+
+def _compile_matcher(pattern: str) -> Callable[[str], bool]:
+    """Case-insensitive exact or glob match against one string."""
+    if _is_glob(pattern):
+        regex = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+        return lambda value: regex.match(value) is not None
+    pattern = pattern.lower()
+    return lambda value: value.lower() == pattern
+
+
+def _compile_text(field: QueryField, value: str) -> Callable[[Any], bool]:
+    match = _compile_matcher(value)
+    get_value = field.get_value
+
+    def predicate(resource):
+        current = get_value(resource)
+        if isinstance(current, (list, tuple)):
+            return any(match(str(item)) for item in current)
+        return match(str(current or ""))
+    return predicate
+
+
+def _compile_bool(field: QueryField, value: str) -> Callable[[Any], bool]:
+    lowered = value.lower()
+    if lowered in TRUE_VALUES:
+        expected = True
+    elif lowered in FALSE_VALUES:
+        expected = False
+    else:
+        raise QueryError(f"Expected true or false, got {value!r}")
+    get_value = field.get_value
+    return lambda resource: bool(get_value(resource)) is expected
+
+
+def _compile_labels(field: QueryField, value: str) -> Callable[[Any], bool]:
+    key, sep, label_value = value.partition("=")
+    if not key:
+        raise QueryError("Label key is empty")
+    get_value = field.get_value
+    if not sep:
+        return lambda resource: key in (get_value(resource) or {})
+
+    match = _compile_matcher(label_value)
+
+    def predicate(resource):
+        labels = get_value(resource) or {}
+        return key in labels and match(str(labels[key]))
+    return predicate
+
+
+_COMPILERS = {
+    QueryField.TEXT: _compile_text,
+    QueryField.BOOL: _compile_bool,
+    QueryField.LABELS: _compile_labels,
+}
+
+
+def _daemon_value(field: QueryField, value: str) -> Optional[str]:
+    """Value to push down for a term, or None if the daemon cannot evaluate it."""
+    if field.daemon_filter is None:
+        return None
+    if field.kind == QueryField.LABELS:
+        # The daemon matches label values exactly; the client does not, so
+        # only the key is pushed down and the value is matched locally
+        value = value.partition("=")[0]
+    if _is_glob(value):
+        return None
+    if field.kind == QueryField.BOOL:
+        return "true" if value.lower() in TRUE_VALUES else "false"
+    if field.kind == QueryField.TEXT:
+        if field.daemon_values is not None:
+            value = value.lower()
+            return value if value in field.daemon_values else None
+        # The daemon compares case-sensitively; the client does not, so
+        # only a lowercase value keeps the daemon result a superset
+        if value != value.lower():
+            return None
+    return value
+
+
+def compile_query(query: str, fields: Dict[str, QueryField]) -> CompiledQuery:
+    """
+    Compile a query such as "status:running image:nginx* label:team=core web".
+
+    Terms "field:value" for a known field become predicates; "-field:value"
+    negates a term. Any other word is free text.
+
+    Args:
+        query: Query as typed
+        fields: Fields of the resource type by name
+
+    Returns:
+        CompiledQuery
+
+    Raises:
+        QueryError: If a term has a value its field cannot take
+    """
+    words = []
+    predicates = []
+    daemon_filters: Dict[str, List[str]] = {}
+
+    for term in _split_terms(query):
+        negated = term.startswith("-") and len(term) > 1
+        name, sep, value = (term[1:] if negated else term).partition(":")
+        field = fields.get(name.lower()) if sep else None
+        if field is None:
+            words.append(term)
+            continue
+
+        predicate = _COMPILERS[field.kind](field, value)
+        if negated:
+            predicates.append(lambda resource, predicate=predicate: not predicate(resource))
+            continue
+        predicates.append(predicate)
+
+        daemon_value = _daemon_value(field, value)
+        if daemon_value is not None:
+            values = daemon_filters.setdefault(field.daemon_filter, [])
+            if daemon_value not in values:
+                values.append(daemon_value)
+
+    return CompiledQuery(query, " ".join(words).lower(), predicates, daemon_filters)
+
+
+def text_query(query: str) -> CompiledQuery:
+    """
+    Treat the whole query as free text (used when it does not compile).
+
+    Args:
+        query: Query as typed
+
+    Returns:
+        CompiledQuery without field terms
+    """
+    return CompiledQuery(query, query.lower())
+
+
+def get_labels(resource: Any) -> Dict[str, str]:
+    """Labels of a resource for LABELS fields."""
+    return resource.get('Labels') or {}
+
+
+def label_field(daemon_filter: Optional[str] = "label") -> QueryField:
+    """
+    Field for "label:key" and "label:key=value" terms.
+
+    Args:
+        daemon_filter: Docker API filter name (None for client-side only)
+
+    Returns:
+        QueryField over the resource labels
+    """
+    return QueryField(get_labels, QueryField.LABELS, daemon_filter)
@@ -0,0 +1,121 @@
+from typing import Any, Dict, List, Tuple
+
+
+def get_image_edges(container: Any) -> Tuple[str, ...]:
+    """Index key function for the image ID a container runs."""
+    image_id = container.get('ImageID')
+    return (image_id,) if image_id else ()
+
+
+def get_volume_edges(container: Any) -> Tuple[str, ...]:
+    """Index key function for the named volumes a container mounts."""
+    return tuple(container.get('VolumeNames') or ())
+
+
+def get_network_edges(container: Any) -> Tuple[str, ...]:
+    """Index key function for the networks a container is attached to."""
+    return tuple(container.get('NetworkIDs') or ())
+
+
+class RelationGraph:
+    """
+    Which containers use which images, volumes and networks.
+
+    The edges come from the container listing (image ID, mounts, network
+    settings) and are kept as secondary indexes of the container manager,
+    patched once per container snapshot. "Used by" and "is used" are
+    therefore dictionary lookups, and counting the used resources of a
+    type only visits the resources that have users.
+    """
+
+    # Resource type -> container index holding the edges to it
+    EDGES = {
+        'images': 'image_id',
+        'volumes': 'volume',
+        'networks': 'network',
+    }
+
+    def __init__(self, container_manager, managers: Dict[str, Any]):
+        """
+        Initialize the graph.
+
+        Args:
+            container_manager: ContainerManager with the relation indexes
+            managers: Managers of the related resource types by type name
+                ("images", "volumes", "networks"); each gets the graph as
+                its relations
+        """
+        self.container_manager = container_manager
+        self.managers = managers
+        for manager in managers.values():
+            manager.set_relations(self)
+
+    def get_users(self, kind: str, resource_id: str) -> List[Any]:
+        """
+        Get the containers using a resource.
+
+        Args:
+            kind: Resource type ("images", "volumes" or "networks")
+            resource_id: ID of the resource as its manager reports it
+
+        Returns:
+            List of containers
+        """
+        return self.container_manager.get_indexed_resources(self.EDGES[kind], resource_id)
+
+    def count_users(self, kind: str, resource_id: str) -> int:
+        """
+        Count the containers using a resource.
+
+        Args:
+            kind: Resource type
+            resource_id: ID of the resource
+
+        Returns:
+            Number of containers
+        """
+        return self.container_manager.count_indexed_resources(self.EDGES[kind], resource_id)
+
+    def is_used(self, kind: str, resource_id: str) -> bool:
+        """
+        Check if any container uses a resource.
+
+        Args:
+            kind: Resource type
+            resource_id: ID of the resource
+
+        Returns:
+            True if the resource has users
+        """
+        return self.count_users(kind, resource_id) > 0
+
+    def count_used(self, kind: str) -> int:
+        """
+        Count the resources of a type that have users.
+
+        Args:
+            kind: Resource type
+
+        Returns:
+            Number of used resources present in the manager's snapshot
+        """
+        manager = self.managers[kind]
+        used = self.container_manager.get_index_counts(self.EDGES[kind])
+        return sum(1 for resource_id in used if manager.get_resource(resource_id) is not None)
+
+    def get_unused(self, kind: str) -> List[Any]:
+        """
+        Get the resources of a type that no container uses.
+
+        Args:
+            kind: Resource type
+
+        Returns:
+            Unused resources in snapshot order
+        """
+        manager = self.managers[kind]
+        used = self.container_manager.get_index_counts(self.EDGES[kind])
+        return [
+            resource for resource in manager.get_resources()
+            if manager.get_resource_id(resource) not in used
+        ]
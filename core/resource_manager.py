@@ -1,31 +1,163 @@
+import itertools
 import threading
 import time
-from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from abc import ABC, abstractmethod
 import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib
 
+from .cache_policy import CachePolicy
+from .query import CompiledQuery, QueryError, QueryField, compile_query, text_query
+from .scheduler import Priority, scheduler
+from .search_index import SearchIndex, build_search_text
+from .search_pipeline import SearchPipeline
+from .single_flight import SingleFlight
+from .snapshot import Snapshot
+from .sorting import SortCache, sort_resources
+
 
 class ResourceManager(ABC):
-    def __init__(self, docker_api, cache_ttl: int = 30):
+    # Secondary indexes: index name -> function returning the key of a resource
+    # (a tuple of keys for multi-valued fields such as label keys)
+    INDEXES: Dict[str, Callable[[Any], Any]] = {}
+    
+    # Totals kept with the indexes: total name -> function returning the value
+    TOTALS: Dict[str, Callable[[Any], float]] = {}
+    
+    # Fields of the query language ("status:running label:team=core")
+    QUERY_FIELDS: Dict[str, QueryField] = {}
+    
+    # Sort keys: column name -> function returning a typed key (numbers for sizes)
+    SORT_KEYS: Dict[str, Callable[[Any], Any]] = {}
+    
+    # Columns kept as tie-breakers behind the one clicked last
+    MAX_SORT_COLUMNS = 3
+    
+    def __init__(self, docker_api, cache_ttl: int = 30, cache_policy: Optional[CachePolicy] = None):
         self.docker_api = docker_api
-        self.resources = []
-        self.filtered_resources = []
         self.current_filters = {}
         self.current_search = ""
+        self.current_sort: List[Tuple[str, bool]] = []
         self.is_loading = False
         self._callbacks = []
         
-        # Caching system
-        self.cache_ttl = cache_ttl
+        # Caching system (stale-while-revalidate)
+        self.cache_policy = cache_policy or CachePolicy(revalidate_interval=cache_ttl)
+        self.cache_ttl = self.cache_policy.revalidate_interval
         self.last_cache_time = 0
         self.cache_valid = False
+        self.is_revalidating = False
         
         # UI updates optimization
         self._update_timer = None
         self._pending_updates = False
         
+        # Concurrent refreshes share one load
+        self._flights = SingleFlight()
+        self._refresh_future = None
+        self._refresh_lock = threading.Lock()
+        
+        # Scheduler lane for refreshes; the visible section is served first
+        self.priority = Priority.NORMAL
+        
+        # Keyed changes between snapshots, delivered on the main loop
+        self._pending_changes = []
+        self._changes_lock = threading.Lock()
+        
+        # Resources added, removed or changed since the manager was created
+        self.change_count = 0
+        
+        # Published state: immutable, replaced as a whole so readers need no lock
+        self._snapshot = Snapshot()
+        self._publish_lock = threading.Lock()
+        
+        # Refreshes and local changes take increasing generations. A listing
+        # keeps the resources changed locally after it started (by the
+        # generation of each one's last local change), and a listing older
+        # than the last one applied is discarded
+        self._generations = itertools.count(1)
+        self.latest_generation = 0
+        self._listed_generation = 0
+        self._local_changes: Dict[str, int] = {}
+        self.discarded_refreshes = 0
+        self.kept_local_changes = 0
+        
+        # Primary index by ID and secondary indexes, patched on each load
+        self._by_id: Dict[str, Any] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[str, Any]]] = {name: {} for name in self.INDEXES}
+        self._totals: Dict[str, float] = {name: 0 for name in self.TOTALS}
+        self._index_lock = threading.RLock()
+        
+        # Substring index over the current snapshot, built on first search
+        self._search_index: Optional[SearchIndex] = None
+        self._search_index_lock = threading.Lock()
+        
+        # Sorted orders of the current snapshot, built on first sort
+        self._sort_cache: Optional[SortCache] = None
+        self._sort_cache_lock = threading.Lock()
+        
+        # Containers using the resources of this type (RelationGraph), if attached
+        self.relations = None
+        
+        # Last compiled search query as (query, CompiledQuery)
+        self._compiled_query = ("", text_query(""))
+        
+        # Debounced search and filtering for the UI, off the main loop
+        self._search_pipeline = SearchPipeline(self._run_search_request, self._on_search_request_done)
+        
+    @property
+    def snapshot(self) -> Snapshot:
+        """Current published state; hold one reference to read a consistent pair of resources and view."""
+        return self._snapshot
+    
+    @property
+    def resources(self) -> Tuple[Any, ...]:
+        """All resources of the current snapshot."""
+        return self._snapshot.resources
+    
+    @property
+    def filtered_resources(self) -> Tuple[Any, ...]:
+        """Resources of the current snapshot matching the search and filters, in display order."""
+        return self._snapshot.filtered
+    
+    def _publish(self, resources: Optional[List[Any]] = None, filtered: Optional[List[Any]] = None,
+                 view: Optional[tuple] = None, base: Optional[Tuple[Any, ...]] = None,
+                 generation: Optional[int] = None) -> bool:
+        """
+        Publish the next snapshot with one reference swap.
+        
+        Args:
+            resources: New resources (kept if None)
+            filtered: New filtered view (kept if None)
+            view: Search, filters and sort of the filtered view (see _get_view)
+            base: Resources the filtered view was computed from; nothing is
+                published if another snapshot replaced them meanwhile
+            generation: Generation of the new resources (kept if None)
+            
+        Returns:
+            True if the snapshot was published
+        """
+        with self._publish_lock:
+            current = self._snapshot
+            if base is not None and current.resources is not base:
+                return False
+            self._snapshot = current.replace(resources, filtered, view, generation)
+            return True
+    
+    def _next_generation(self) -> int:
+        """Take the generation of a new refresh or local change."""
+        generation = next(self._generations)
+        self.latest_generation = generation
+        return generation
+    
+    def _get_view(self, query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None) -> tuple:
+        """Key of the search, filters and sort a filtered view is computed for."""
+        query = self.current_search if query is None else query
+        filters = self.current_filters if filters is None else filters
+        return (query, tuple(sorted(filters.items())), tuple(self.current_sort))
+    
     def add_callback(self, callback: Callable):
         """
         Add a callback for notifications of changes.
@@ -60,6 +192,27 @@ class ResourceManager(ABC):
             except Exception as e:
                 print(f"Error in callback: {e}")
     
+    def get_cache_state(self) -> str:
+        """
+        Classify the current snapshot by the cache policy.
+        
+        Returns:
+            CachePolicy.FRESH, CachePolicy.STALE or CachePolicy.EXPIRED
+        """
+        if not self.last_cache_time:
+            return CachePolicy.EXPIRED
+        
+        # Data kept current by the Docker event stream does not expire
+        if self.cache_valid and self._is_live():
+            return CachePolicy.FRESH
+        
+        return self.cache_policy.get_state(time.time() - self.last_cache_time, self.cache_valid)
+    
+    def _is_live(self) -> bool:
+        """Check if the Docker event stream keeps this resource type current."""
+        is_live = getattr(self.docker_api, 'is_live', None)
+        return bool(is_live and is_live(self.resource_type))
+    
     def is_cache_valid(self) -> bool:
         """
         Check if the cache is valid.
@@ -67,46 +220,376 @@ class ResourceManager(ABC):
         Returns:
             True if the cache is valid, False otherwise
         """
-        if not self.cache_valid:
-            return False
-        
-        current_time = time.time()
-        return (current_time - self.last_cache_time) < self.cache_ttl
+        return self.get_cache_state() == CachePolicy.FRESH
     
     def invalidate_cache(self):
-        """Invalidate the cache."""
+        """Invalidate the cache; the snapshot stays available while it is revalidated."""
         self.cache_valid = False
-        self.last_cache_time = 0
     
-    def refresh(self, force: bool = False):
+    def set_cache_policy(self, cache_policy: CachePolicy):
+        """
+        Set the cache policy.
+        
+        Args:
+            cache_policy: Freshness rules for this resource type
+        """
+        self.cache_policy = cache_policy
+        self.cache_ttl = cache_policy.revalidate_interval
+    
+    def set_visible(self, visible: bool):
+        """
+        Mark the section of this manager as visible or hidden.
+        
+        Args:
+            visible: True if the section is shown
+        """
+        self.priority = Priority.FOREGROUND if visible else Priority.NORMAL
+    
+    def refresh(self, callback: Optional[Callable] = None, force: bool = False,
+                priority: Optional[Priority] = None) -> Future:
         """
         Update the resources asynchronously.
         
+        Concurrent callers share one load. A forced refresh never reuses a
+        load that is already running, since it may predate the change the
+        caller wants to see; it waits for one trailing load instead. A stale
+        snapshot stays on screen while it is revalidated ('revalidating'
+        instead of 'loading_started').
+        
         Args:
+            callback: Function called on the main loop once the resources are loaded
             force: Force update, ignoring the cache
+            priority: Scheduler lane for a new load (the manager's lane if None)
+            
+        Returns:
+            Future resolved with the loaded resources
         """
-        if self.is_loading:
-            return
+        state = self.get_cache_state()
         
         # Check the cache, if not forced update
-        if not force and self.is_cache_valid():
+        if not force and not self._flights.in_flight('refresh') and state == CachePolicy.FRESH:
             self._notify_callbacks('cache_hit')
-            return
+            future = Future()
+            future.set_result(self.resources)
+        else:
+            with self._refresh_lock:
+                lane = self.priority if priority is None else priority
+                future = self._flights.submit(
+                    'refresh', self._run_refresh, fresh=force,
+                    spawn=lambda run: scheduler.submit_with_priority(lane, run)
+                )
+                started = future is not self._refresh_future
+                self._refresh_future = future
             
-        self.is_loading = True
-        self._notify_callbacks('loading_started')
+            if started:
+                self.is_loading = True
+                self.is_revalidating = not force and state == CachePolicy.STALE
+                self._notify_callbacks('revalidating' if self.is_revalidating else 'loading_started')
+                future.add_done_callback(lambda done: GLib.idle_add(self._on_refresh_finished, done))
         
-        def _refresh():
-            try:
-                self._load_resources()
-                self.last_cache_time = time.time()
-                self.cache_valid = True
-                GLib.idle_add(self._on_refresh_complete)
-            except Exception as e:
-                GLib.idle_add(self._on_refresh_error, str(e))
+        if callback:
+            future.add_done_callback(lambda done: self._call_on_success(done, callback))
+        return future
+    
+    def _run_refresh(self) -> Tuple[Any, ...]:
+        """Load resources in a worker thread (one shared flight)."""
+        generation = self._next_generation()
+        resources = tuple(self._load_resources())
+        
+        # Build once per snapshot, off the main loop and before publishing
+        self._get_search_index(resources)
+        if self.current_sort:
+            self._get_sort_cache(resources).get_permutation(tuple(self.current_sort))
+        
+        with self._index_lock:
+            if generation < self._listed_generation:
+                # A newer listing is already applied
+                self.discarded_refreshes += 1
+                changes = None
+                resources = self.resources
+            else:
+                # Resources changed locally after the listing started (e.g. a
+                # confirmed action) keep their state instead of rolling back
+                local_ids = {
+                    resource_id for resource_id, changed in self._local_changes.items()
+                    if changed > generation
+                }
+                if local_ids:
+                    resources = self._merge_local_changes(resources, local_ids)
+                    self.kept_local_changes += len(local_ids)
+                self._local_changes = {resource_id: self._local_changes[resource_id] for resource_id in local_ids}
+                self._listed_generation = generation
+                
+                # Diff against the indexed state
+                changes = self._diff_resources(list(self._by_id.values()), resources)
+                changes['initial'] = not self.last_cache_time
+                self._patch_indexes(changes)
+                
+                # The snapshot is published together with its filtered view
+                query, filters = self.current_search, self.current_filters
+                filtered = self._filter_snapshot(resources, query, filters)
+                self._publish(resources, filtered, self._get_view(query, filters),
+                              generation=max(generation, self._snapshot.generation))
         
-        thread = threading.Thread(target=_refresh, daemon=True)
-        thread.start()
+        if changes is not None:
+            with self._changes_lock:
+                self._pending_changes.append(changes)
+        self.last_cache_time = time.time()
+        self.cache_valid = True
+        return resources
+    
+    def _merge_local_changes(self, resources: Tuple[Any, ...], local_ids: set) -> Tuple[Any, ...]:
+        """
+        Replace listed resources by their locally changed state.
+        
+        Args:
+            resources: Listing in daemon order
+            local_ids: IDs of the resources changed locally after the listing started
+            
+        Returns:
+            Listing with the indexed state of those resources (dropped if
+            removed locally, appended if added locally)
+        """
+        merged = []
+        listed = set()
+        for resource in resources:
+            resource_id = self._get_resource_id(resource)
+            if resource_id in local_ids:
+                listed.add(resource_id)
+                resource = self._by_id.get(resource_id)
+                if resource is None:
+                    continue
+            merged.append(resource)
+        for resource_id in local_ids - listed:
+            resource = self._by_id.get(resource_id)
+            if resource is not None:
+                merged.append(resource)
+        return tuple(merged)
+    
+    def _diff_resources(self, previous: List[Any], current: List[Any]) -> Dict[str, List[Any]]:
+        """
+        Compare two snapshots by resource ID.
+        
+        Args:
+            previous: Snapshot before the load
+            current: Snapshot after the load
+            
+        Returns:
+            Dictionary with 'added' and 'changed' resources and 'removed' IDs
+        """
+        previous_by_id = {self._get_resource_id(resource): resource for resource in previous}
+        added = []
+        changed = []
+        for resource in current:
+            resource_id = self._get_resource_id(resource)
+            old = previous_by_id.pop(resource_id, None)
+            if old is None:
+                added.append(resource)
+            elif old is not resource and old != resource:
+                changed.append(resource)
+        
+        return {'added': added, 'removed': list(previous_by_id), 'changed': changed}
+    
+    def _patch_indexes(self, changes: Dict[str, List[Any]]):
+        """
+        Apply the changes between two snapshots to the indexes.
+        
+        Args:
+            changes: Result of _diff_resources
+        """
+        with self._index_lock:
+            for resource_id in changes['removed']:
+                self._unindex_resource(self._by_id[resource_id])
+            for resource in changes['changed']:
+                self._unindex_resource(self._by_id[self._get_resource_id(resource)])
+                self._index_resource(resource)
+            for resource in changes['added']:
+                self._index_resource(resource)
+    
+    def apply_local_change(self, resource_id: str, resource: Optional[Any]) -> Optional[Any]:
+        """
+        Replace, add or remove one resource without reloading the snapshot.
+        
+        Used for the expected result of an action before the daemon confirms
+        it, and for the confirmed state afterwards. A new snapshot is
+        published, since readers may still hold the current one; views are
+        told through the keyed change events.
+        
+        Args:
+            resource_id: ID of the resource
+            resource: New state of the resource (None to remove it)
+            
+        Returns:
+            Previous state of the resource (None if it was not in the snapshot)
+        """
+        with self._index_lock:
+            previous = self._by_id.get(resource_id)
+            if previous is None and resource is None:
+                # Removing a resource the snapshot does not have
+                return None
+            if previous is resource:
+                return previous
+            
+            snapshot = self._snapshot
+            if previous is None:
+                changes = {'added': [resource], 'removed': [], 'changed': []}
+                resources = snapshot.resources + (resource,)
+            elif resource is None:
+                changes = {'added': [], 'removed': [resource_id], 'changed': []}
+                resources = [item for item in snapshot.resources if item is not previous]
+            else:
+                changes = {'added': [], 'removed': [], 'changed': [resource]}
+                resources = [resource if item is previous else item for item in snapshot.resources]
+            
+            filtered = snapshot.filtered
+            visible = resource is not None and self.is_resource_visible(resource)
+            if previous is not None and any(item is previous for item in filtered):
+                if visible:
+                    filtered = [resource if item is previous else item for item in filtered]
+                else:
+                    filtered = [item for item in filtered if item is not previous]
+            elif visible:
+                filtered = filtered + (resource,)
+            if self.current_sort:
+                filtered = sort_resources(filtered, tuple(self.current_sort), self.SORT_KEYS)
+            
+            self._patch_indexes(changes)
+            generation = self._next_generation()
+            self._local_changes[resource_id] = generation
+            self._publish(resources, filtered, generation=generation)
+        
+        with self._changes_lock:
+            self._pending_changes.append(changes)
+        self._emit_changes()
+        return previous
+    
+    def _index_resource(self, resource: Any):
+        """Add a resource to the indexes."""
+        resource_id = self._get_resource_id(resource)
+        self._by_id[resource_id] = resource
+        for name, get_key in self.INDEXES.items():
+            index = self._indexes[name]
+            for key in self._get_index_keys(get_key(resource)):
+                index.setdefault(key, {})[resource_id] = resource
+        for name, get_value in self.TOTALS.items():
+            self._totals[name] += get_value(resource) or 0
+    
+    def _unindex_resource(self, resource: Any):
+        """Remove a resource from the indexes."""
+        resource_id = self._get_resource_id(resource)
+        self._by_id.pop(resource_id, None)
+        for name, get_key in self.INDEXES.items():
+            index = self._indexes[name]
+            for key in self._get_index_keys(get_key(resource)):
+                bucket = index.get(key)
+                if bucket is not None:
+                    bucket.pop(resource_id, None)
+                    if not bucket:
+                        del index[key]
+        for name, get_value in self.TOTALS.items():
+            self._totals[name] -= get_value(resource) or 0
+    
+    @staticmethod
+    def _get_index_keys(key: Any) -> tuple:
+        """Normalize an index key to a tuple of keys."""
+        return key if isinstance(key, tuple) else (key,)
+    
+    @staticmethod
+    def _get_label_keys(resource: Any) -> tuple:
+        """Index key function for the label keys of a resource."""
+        return tuple(resource.get('Labels') or ())
+    
+    def get_indexed_resources(self, index: str, key: Any) -> List[Any]:
+        """
+        Get the resources with a key in a secondary index.
+        
+        Args:
+            index: Name of the index (see INDEXES)
+            key: Indexed value, e.g. a status or a driver
+            
+        Returns:
+            List of matching resources
+        """
+        with self._index_lock:
+            return list(self._indexes[index].get(key, {}).values())
+    
+    def count_indexed_resources(self, index: str, key: Any) -> int:
+        """
+        Count the resources with a key in a secondary index.
+        
+        Args:
+            index: Name of the index (see INDEXES)
+            key: Indexed value
+            
+        Returns:
+            Number of matching resources
+        """
+        return len(self._indexes[index].get(key, ()))
+    
+    def get_index_counts(self, index: str) -> Dict[Any, int]:
+        """
+        Count the resources per key of a secondary index.
+        
+        Args:
+            index: Name of the index (see INDEXES)
+            
+        Returns:
+            Dictionary key -> number of resources
+        """
+        with self._index_lock:
+            return {key: len(bucket) for key, bucket in self._indexes[index].items()}
+    
+    def get_total(self, name: str) -> float:
+        """
+        Get a total kept with the indexes.
+        
+        Args:
+            name: Name of the total (see TOTALS)
+            
+        Returns:
+            Sum over all resources
+        """
+        return self._totals[name]
+    
+    def _emit_changes(self):
+        """Notify 'items_removed', 'items_added' and 'items_changed' for finished loads."""
+        with self._changes_lock:
+            pending, self._pending_changes = self._pending_changes, []
+        
+        for changes in pending:
+            if not changes.get('initial'):
+                self.change_count += len(changes['added']) + len(changes['removed']) + len(changes['changed'])
+        
+        if self.current_sort and any(changes['added'] or changes['changed'] for changes in pending):
+            # New and changed rows may move: the views rebuild in sorted order
+            self._notify_callbacks('ui_update')
+            return
+        
+        for changes in pending:
+            if changes['removed']:
+                self._notify_callbacks('items_removed', changes['removed'])
+            if changes['added']:
+                self._notify_callbacks('items_added', changes['added'])
+            if changes['changed']:
+                self._notify_callbacks('items_changed', changes['changed'])
+    
+    def _on_refresh_finished(self, future: Future):
+        """Dispatch the result of a refresh flight on the main loop."""
+        self.is_loading = self._flights.in_flight('refresh')
+        if not self.is_loading:
+            self.is_revalidating = False
+        error = future.exception()
+        if error is not None:
+            self._on_refresh_error(str(error))
+        else:
+            self._on_refresh_complete()
+        return False
+    
+    @staticmethod
+    def _call_on_success(future: Future, callback: Callable):
+        """Call a refresh callback on the main loop if the refresh succeeded."""
+        if not future.cancelled() and future.exception() is None:
+            GLib.idle_add(callback)
     
     def schedule_ui_update(self):
         """
@@ -133,23 +616,27 @@ class ResourceManager(ABC):
         return False  # Stop the timer
     
     @abstractmethod
-    def _load_resources(self):
+    def _load_resources(self) -> List[Any]:
         """
-        Load resources from Docker API.
+        Load resources from Docker API (in a worker thread).
         Must be implemented in subclasses.
+        
+        Returns:
+            List of resources; the manager publishes it as the next snapshot,
+            so implementations must not change the manager's state
         """
         pass
     
     def _on_refresh_complete(self):
-        """Handler for the completion of the update."""
-        self.is_loading = False
-        self._apply_filters_and_search()
+        """Handler for the completion of the update (views patch the changed rows)."""
+        if self._snapshot.view != self._get_view():
+            # The search or filters changed while the snapshot was filtered
+            self._apply_filters_and_search()
+        self._emit_changes()
         self._notify_callbacks('loading_complete')
-        self.schedule_ui_update()
     
     def _on_refresh_error(self, error_message: str):
         """Handler for the error of the update."""
-        self.is_loading = False
         self._notify_callbacks('loading_error', error_message)
         print(f"Error refreshing resources: {error_message}")
     
@@ -160,6 +647,7 @@ class ResourceManager(ABC):
         Args:
             query: Search query
         """
+        self._search_pipeline.cancel()
         self.current_search = query
         self._apply_filters_and_search()
         self.schedule_ui_update()
@@ -171,18 +659,149 @@ class ResourceManager(ABC):
         Args:
             filters: Dictionary with filtering criteria
         """
+        self._search_pipeline.cancel()
         self.current_filters = filters.copy()
         self._apply_filters_and_search()
         self.schedule_ui_update()
     
+    def request_search(self, query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None):
+        """
+        Search and filter in a worker thread, debounced for typing.
+        
+        The result replaces the filtered resources on the main loop and is
+        announced with 'ui_update'; requests superseded by a newer one are
+        dropped without being delivered.
+        
+        Args:
+            query: Search query (None to keep the current one)
+            filters: Dictionary with filtering criteria (None to keep the current ones)
+        """
+        if query is not None:
+            self.current_search = query
+        if filters is not None:
+            self.current_filters = filters.copy()
+        self._search_pipeline.request(self.current_search, self.current_filters)
+    
+    def _run_search_request(self, query: str, filters: Dict[str, Any],
+                            is_cancelled: Callable[[], bool]):
+        """Filter the current snapshot in a worker thread."""
+        if self.get_cache_state() == CachePolicy.EXPIRED:
+            compiled = self._get_compiled_query(query)
+            if compiled.daemon_filters:
+                # The daemon selects the candidates; they are merged into the
+                # snapshot, so the result belongs to the published resources,
+                # and the full listing follows once the result is shown
+                candidates = self._merge_candidates(self._list_resources(compiled.daemon_filters))
+                GLib.idle_add(self._emit_changes)
+                return self.resources, self._filter_snapshot(candidates, query, filters, is_cancelled)
+            # No snapshot worth filtering: load one (or join the load in
+            # flight) so the result belongs to the published resources
+            self._flights.do('refresh', self._run_refresh)
+            GLib.idle_add(self._emit_changes)
+        resources = self.resources
+        return resources, self._filter_snapshot(resources, query, filters, is_cancelled)
+    
+    def _list_resources(self, daemon_filters: Dict[str, List[str]]) -> List[Any]:
+        """
+        List resources filtered by the daemon.
+        
+        Args:
+            daemon_filters: Docker API filters
+            
+        Returns:
+            Resources matching the filters
+        """
+        return getattr(self.docker_api, f"get_{self.resource_type}")(filters=daemon_filters)
+    
+    def _merge_candidates(self, candidates: List[Any]) -> List[Any]:
+        """
+        Add or replace the resources listed by a daemon-filtered listing.
+        
+        The merged resources count as local changes, so a refresh that
+        started earlier does not roll them back.
+        
+        Args:
+            candidates: Resources listed with daemon filters
+            
+        Returns:
+            The candidates as published (unchanged ones keep their snapshot objects)
+        """
+        with self._index_lock:
+            added = []
+            changed = []
+            merged = []
+            for candidate in candidates:
+                resource_id = self._get_resource_id(candidate)
+                previous = self._by_id.get(resource_id)
+                if previous is None:
+                    added.append(candidate)
+                elif previous != candidate:
+                    changed.append(candidate)
+                else:
+                    candidate = previous
+                merged.append(candidate)
+            if not added and not changed:
+                return merged
+            
+            replaced = {self._get_resource_id(resource): resource for resource in changed}
+            snapshot = self._snapshot
+            resources = tuple(
+                replaced.get(self._get_resource_id(resource), resource) for resource in snapshot.resources
+            ) + tuple(added)
+            filtered = [replaced.get(self._get_resource_id(resource), resource) for resource in snapshot.filtered]
+            changes = {'added': added, 'removed': [], 'changed': changed}
+            self._patch_indexes(changes)
+            generation = self._next_generation()
+            for resource in added + changed:
+                self._local_changes[self._get_resource_id(resource)] = generation
+            self._publish(resources, filtered, generation=generation)
+        
+        with self._changes_lock:
+            self._pending_changes.append(changes)
+        return merged
+    
+    def _get_compiled_query(self, query: str) -> CompiledQuery:
+        """
+        Compile a search query once and reuse it until the query changes.
+        
+        Args:
+            query: Search query in the query language
+            
+        Returns:
+            CompiledQuery (plain free text if the query does not compile)
+        """
+        last_query, compiled = self._compiled_query
+        if query == last_query:
+            return compiled
+        
+        try:
+            compiled = compile_query(query, self.QUERY_FIELDS)
+        except QueryError:
+            compiled = text_query(query)
+        self._compiled_query = (query, compiled)
+        return compiled
+    
+    def _on_search_request_done(self, result):
+        """Apply a search result on the main loop."""
+        resources, filtered = result
+        # A refresh that replaced the snapshot meanwhile filtered it itself
+        if filtered is None or not self._publish(filtered=filtered, view=self._get_view(), base=resources):
+            return
+        self._notify_callbacks('ui_update')
+        if self.get_cache_state() == CachePolicy.EXPIRED:
+            # Only the daemon-selected candidates are current
+            self.refresh()
+    
     def clear_filters(self):
         """Clear all filters."""
+        self._search_pipeline.cancel()
         self.current_filters = {}
         self._apply_filters_and_search()
         self.schedule_ui_update()
     
     def clear_search(self):
         """Clear the search query."""
+        self._search_pipeline.cancel()
         self.current_search = ""
         self._apply_filters_and_search()
         self.schedule_ui_update()
@@ -191,18 +810,119 @@ class ResourceManager(ABC):
         """
         Apply filters and search to resources.
         """
-        # Start with the full list of resources
-        filtered = self.resources.copy()
+        view = self._get_view()
+        while True:
+            resources = self.resources
+            filtered = self._filter_snapshot(resources, self.current_search, self.current_filters)
+            if self._publish(filtered=filtered, view=view, base=resources):
+                return
+    
+    def _filter_snapshot(self, resources: List[Any], query: str, filters: Dict[str, Any],
+                         is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[List[Any]]:
+        """
+        Apply search and filters to a snapshot.
         
-        # Apply the search
-        if self.current_search:
-            filtered = self._apply_search(filtered, self.current_search)
+        Args:
+            resources: Snapshot of resources (not modified)
+            query: Search query
+            filters: Dictionary with filtering criteria
+            is_cancelled: Function telling the work is no longer needed
+            
+        Returns:
+            Filtered list (the snapshot itself if nothing is applied),
+            or None if cancelled
+        """
+        filtered = resources
+        if query:
+            compiled = self._get_compiled_query(query)
+            if compiled.text:
+                filtered = self._apply_search(filtered, compiled.text)
+            if compiled.predicates:
+                filtered = self._select(filtered, compiled.matches, is_cancelled)
+        if filters and filtered is not None:
+            filtered = self._apply_filters(filtered, filters, is_cancelled)
+        if self.current_sort and filtered is not None:
+            filtered = self._apply_sort(filtered, resources)
+        return filtered
+    
+    def sort_by(self, column: str, descending: Optional[bool] = None):
+        """
+        Sort by a column, keeping the previous sort columns as tie-breakers.
+        
+        Args:
+            column: Name of the sort key (see SORT_KEYS)
+            descending: Direction (None to toggle if the column is already
+                the primary one, ascending otherwise)
+        """
+        if column not in self.SORT_KEYS:
+            raise ValueError(f"Unknown sort column: {column}")
         
-        # Apply the filters
-        if self.current_filters:
-            filtered = self._apply_filters(filtered, self.current_filters)
+        if descending is None:
+            descending = bool(self.current_sort) and self.current_sort[0] == (column, False)
         
-        self.filtered_resources = filtered
+        others = [entry for entry in self.current_sort if entry[0] != column]
+        self.set_sort([(column, descending)] + others[:self.MAX_SORT_COLUMNS - 1])
+    
+    def set_sort(self, sort: List[Tuple[str, bool]]):
+        """
+        Set the sort order.
+        
+        Args:
+            sort: (column, descending) pairs, most significant first (empty for
+                the order of the Docker API)
+        """
+        for column, _ in sort:
+            if column not in self.SORT_KEYS:
+                raise ValueError(f"Unknown sort column: {column}")
+        
+        self.current_sort = list(sort)
+        snapshot = self._snapshot
+        if not self.current_sort or not self._publish(
+            # A cached permutation: no need to filter again
+            filtered=self._apply_sort(snapshot.filtered, snapshot.resources),
+            view=self._get_view(), base=snapshot.resources
+        ):
+            self._apply_filters_and_search()
+        self._notify_callbacks('ui_update')
+    
+    def _apply_sort(self, resources: List[Any], snapshot: List[Any]) -> List[Any]:
+        """
+        Apply the current sort order.
+        
+        Args:
+            resources: The snapshot or resources selected from it
+            snapshot: Snapshot the resources come from
+            
+        Returns:
+            Sorted list of resources
+        """
+        sort_cache = self._sort_cache
+        if sort_cache is None or sort_cache.resources is not snapshot:
+            if snapshot is self.resources:
+                sort_cache = self._get_sort_cache()
+            else:
+                # Resources listed by the daemon or a snapshot replaced meanwhile
+                sort_cache = SortCache(snapshot, self.SORT_KEYS)
+        return sort_cache.sort(resources, tuple(self.current_sort))
+    
+    def _get_sort_cache(self, resources: Optional[Tuple[Any, ...]] = None) -> SortCache:
+        """
+        Get the sort cache of a snapshot, creating it if needed.
+        
+        Args:
+            resources: Snapshot resources (the current ones if None)
+            
+        Returns:
+            SortCache over the resources
+        """
+        with self._sort_cache_lock:
+            if resources is None:
+                resources = self.resources
+            sort_cache = self._sort_cache
+            if sort_cache is None or sort_cache.resources is not resources:
+                sort_cache = SortCache(resources, self.SORT_KEYS)
+                self._sort_cache = sort_cache
+            return sort_cache
     
     def _apply_search(self, resources: List[Any], query: str) -> List[Any]:
         """
@@ -218,32 +938,119 @@ class ResourceManager(ABC):
         if not query:
             return resources
         
+        # A snapshot is searched through its index
+        index = self._search_index
+        if index is not None and index.resources is resources:
+            return index.search(query)
+        if resources is self.resources:
+            return self._get_search_index().search(query)
+        
         query = query.lower()
         return [
             resource for resource in resources
             if self._resource_matches_search(resource, query)
         ]
     
-    def _apply_filters(self, resources: List[Any], filters: Dict[str, Any]) -> List[Any]:
+    def _get_search_index(self, resources: Optional[Tuple[Any, ...]] = None) -> SearchIndex:
+        """
+        Get the search index of a snapshot, building it if needed.
+        
+        Args:
+            resources: Snapshot resources (the current ones if None)
+            
+        Returns:
+            SearchIndex over the resources
+        """
+        with self._search_index_lock:
+            if resources is None:
+                resources = self.resources
+            index = self._search_index
+            if index is None or index.resources is not resources:
+                index = SearchIndex(resources, self._get_search_text)
+                self._search_index = index
+            return index
+    
+    def _get_search_text(self, resource: Any) -> str:
+        """
+        Get the lowercased text searched for a resource.
+        
+        Args:
+            resource: Resource
+            
+        Returns:
+            Searchable fields and labels joined into one text
+        """
+        labels = resource.get('Labels') or {}
+        return build_search_text(
+            tuple(self._get_search_fields(resource)) +
+            tuple(f"{key}={value}" for key, value in labels.items())
+        )
+    
+    def _apply_filters(self, resources: List[Any], filters: Dict[str, Any],
+                       is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[List[Any]]:
         """
         Apply filters to the list of resources.
         
         Args:
             resources: List of resources to filter
             filters: Dictionary with filtering criteria
+            is_cancelled: Function checked every few hundred resources
             
         Returns:
-            Filtered list of resources
+            Filtered list of resources, or None if cancelled
         """
         if not filters:
             return resources
         
-        return [
-            resource for resource in resources
-            if self._resource_matches_filters(resource, filters)
-        ]
+        return self._select(
+            resources, lambda resource: self._resource_matches_filters(resource, filters), is_cancelled
+        )
+    
+    @staticmethod
+    def _select(resources: List[Any], predicate: Callable[[Any], bool],
+                is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[List[Any]]:
+        """
+        Select the resources satisfying a predicate.
+        
+        Args:
+            resources: List of resources
+            predicate: Function returning True for the resources to keep
+            is_cancelled: Function checked every few hundred resources
+            
+        Returns:
+            Selected resources, or None if cancelled
+        """
+        if is_cancelled is None:
+            return [resource for resource in resources if predicate(resource)]
+        
+        selected = []
+        for position, resource in enumerate(resources):
+            if not position % 512 and is_cancelled():
+                return None
+            if predicate(resource):
+                selected.append(resource)
+        return selected
+    
+    def is_resource_visible(self, resource: Any) -> bool:
+        """
+        Check if the resource passes the current search and filters.
+        
+        Args:
+            resource: Resource to check
+            
+        Returns:
+            True if the resource belongs to the filtered resources
+        """
+        if self.current_search:
+            compiled = self._get_compiled_query(self.current_search)
+            if compiled.text and not self._resource_matches_search(resource, compiled.text):
+                return False
+            if not compiled.matches(resource):
+                return False
+        if self.current_filters and not self._resource_matches_filters(resource, self.current_filters):
+            return False
+        return True
     
-    @abstractmethod
     def _resource_matches_search(self, resource: Any, query: str) -> bool:
         """
         Check if the resource matches the search query.
@@ -255,6 +1062,19 @@ class ResourceManager(ABC):
         Returns:
             True if the resource matches the query
         """
+        return query.lower() in self._get_search_text(resource)
+    
+    @abstractmethod
+    def _get_search_fields(self, resource: Any) -> tuple:
+        """
+        Get the fields matched by the search.
+        
+        Args:
+            resource: Resource
+            
+        Returns:
+            Tuple of field values (lists are flattened)
+        """
         pass
     
     @abstractmethod
@@ -281,10 +1101,80 @@ class ResourceManager(ABC):
         Returns:
             Resource or None if not found
         """
-        for resource in self.resources:
-            if self._get_resource_id(resource) == resource_id:
-                return resource
-        return None
+        return self._by_id.get(resource_id)
+    
+    def get_resource_id(self, resource: Any) -> str:
+        """
+        Get the ID that keys the resource in change events.
+        
+        Args:
+            resource: Resource
+            
+        Returns:
+            ID of the resource
+        """
+        return self._get_resource_id(resource)
+    
+    def set_relations(self, relations):
+        """
+        Attach the graph of containers using resources of this type.
+        
+        Args:
+            relations: RelationGraph
+        """
+        self.relations = relations
+    
+    def get_users(self, resource_id: str) -> List[Any]:
+        """
+        Get the containers using a resource.
+        
+        Args:
+            resource_id: ID of the resource
+            
+        Returns:
+            List of containers (empty without a relation graph)
+        """
+        if self.relations is None:
+            return []
+        return self.relations.get_users(self.resource_type, resource_id)
+    
+    def count_users(self, resource_id: str) -> int:
+        """
+        Count the containers using a resource.
+        
+        Args:
+            resource_id: ID of the resource
+            
+        Returns:
+            Number of containers (0 without a relation graph)
+        """
+        if self.relations is None:
+            return 0
+        return self.relations.count_users(self.resource_type, resource_id)
+    
+    def is_used(self, resource_id: str) -> bool:
+        """
+        Check if any container uses a resource.
+        
+        Args:
+            resource_id: ID of the resource
+            
+        Returns:
+            True if the resource has users
+        """
+        return self.count_users(resource_id) > 0
+    
+    def get_unused_resources(self) -> List[Any]:
+        """
+        Get the resources no container uses.
+        
+        Returns:
+            List of unused resources (empty without a relation graph, since
+            usage is unknown until then)
+        """
+        if self.relations is None:
+            return []
+        return self.relations.get_unused(self.resource_type)
     
     @abstractmethod
     def _get_resource_id(self, resource: Any) -> str:
@@ -314,8 +1204,7 @@ class ResourceManager(ABC):
             except Exception as e:
                 GLib.idle_add(self._on_delete_error, resource_id, str(e))
         
-        thread = threading.Thread(target=_delete, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _delete)
     
     @abstractmethod
     def _perform_delete(self, resource_id: str):
@@ -337,23 +1226,23 @@ class ResourceManager(ABC):
         self._notify_callbacks('delete_error', {'id': resource_id, 'error': error_message})
         print(f"Error deleting resource {resource_id}: {error_message}")
     
-    def get_resources(self) -> List[Any]:
+    def get_resources(self) -> Tuple[Any, ...]:
         """
         Get all resources.
         
         Returns:
-            List of all resources
+            Immutable tuple of all resources (no copy is made)
         """
-        return self.resources.copy()
+        return self._snapshot.resources
     
-    def get_filtered_resources(self) -> List[Any]:
+    def get_filtered_resources(self) -> Tuple[Any, ...]:
         """
         Get filtered resources.
         
         Returns:
-            List of filtered resources
+            Immutable tuple of filtered resources (no copy is made)
         """
-        return self.filtered_resources.copy()
+        return self._snapshot.filtered
     
     def get_loading_status(self) -> bool:
         """
@@ -372,9 +1261,18 @@ class ResourceManager(ABC):
             Dictionary with information about the cache
         """
         current_time = time.time()
+        state = self.get_cache_state()
         return {
-            'valid': self.is_cache_valid(),
+            'valid': state == CachePolicy.FRESH,
+            'state': state,
+            'revalidating': self.is_revalidating,
             'last_update': self.last_cache_time,
+            'version': self._snapshot.version,
+            'generation': self._snapshot.generation,
+            'latest_generation': self.latest_generation,
+            'discarded_refreshes': self.discarded_refreshes,
+            'kept_local_changes': self.kept_local_changes,
             'age': current_time - self.last_cache_time,
-            'ttl': self.cache_ttl
+            'ttl': self.cache_ttl,
+            'max_staleness': self.cache_policy.max_staleness
         }
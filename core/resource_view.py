@@ -342,7 +342,7 @@ class ResourceView(ABC):
             entry: Search entry
         """
         query = entry.get_text()
-        self.resource_manager.search(query)
+        self.resource_manager.request_search(query)  # Debounced, off the main loop
     
     def _on_clear_search_clicked(self, button):
         """
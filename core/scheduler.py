@@ -0,0 +1,250 @@
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future
+from enum import IntEnum
+from typing import Any, Callable, Dict
+
+
+class Priority(IntEnum):
+    """Scheduling lanes, served in this order."""
+    FOREGROUND = 0  # Visible section and user actions
+    NORMAL = 1
+    BACKGROUND = 2  # Prefetch and other speculative work
+
+
+class _LaneStats:
+    """Counters for one priority lane."""
+
+    __slots__ = ("depth", "max_depth", "submitted", "completed", "failed",
+                 "wait_total", "wait_max", "run_total")
+
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+
+
+class _WorkItem:
+    """A queued task."""
+
+    __slots__ = ("future", "fn", "args", "kwargs", "priority", "enqueued_at")
+
+    def __init__(self, future: Future, fn: Callable, args: tuple, kwargs: dict, priority: Priority):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.enqueued_at = time.perf_counter()
+
+
+class TaskScheduler(Executor):
+    """
+    Application-wide worker pool with priority lanes.
+
+    Tasks are served foreground first, background last, by at most
+    max_workers threads started on demand. Per-lane queue depth and wait/run
+    latency are collected for get_metrics().
+    """
+
+    _SHUTDOWN = len(Priority)
+
+    def __init__(self, max_workers: int = 4, name: str = "scheduler"):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of worker threads
+            name: Prefix for worker thread names
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.max_workers = max_workers
+        self.name = name
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._idle = threading.Semaphore(0)
+        self._workers = []
+        self._active = 0
+        self._shutdown = False
+        self._stats: Dict[Priority, _LaneStats] = {lane: _LaneStats() for lane in Priority}
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Schedule a task on the normal lane.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Future with the result of the task
+        """
+        return self.submit_with_priority(Priority.NORMAL, fn, *args, **kwargs)
+
+    def submit_with_priority(self, priority: Priority, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Schedule a task on a priority lane.
+
+        Args:
+            priority: Lane to queue the task on
+            fn: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Future with the result of the task
+        """
+        future = Future()
+        item = _WorkItem(future, fn, args, kwargs, Priority(priority))
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            lane = self._stats[item.priority]
+            lane.submitted += 1
+            lane.depth += 1
+            lane.max_depth = max(lane.max_depth, lane.depth)
+            self._queue.put((item.priority, next(self._sequence), item))
+            self._adjust_workers()
+
+        return future
+
+    def _adjust_workers(self):
+        """Start a worker if none is idle and the limit allows it (lock held)."""
+        if self._idle.acquire(blocking=False):
+            return
+        if len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker,
+                name=f"{self.name}-{len(self._workers)}",
+                daemon=True
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker(self):
+        """Serve queued tasks until shutdown."""
+        while True:
+            _, _, item = self._queue.get()
+            if item is None:
+                return
+
+            started = time.perf_counter()
+            wait_time = started - item.enqueued_at
+            with self._lock:
+                lane = self._stats[item.priority]
+                lane.depth -= 1
+                lane.wait_total += wait_time
+                lane.wait_max = max(lane.wait_max, wait_time)
+                self._active += 1
+
+            failed = False
+            if item.future.set_running_or_notify_cancel():
+                try:
+                    result = item.fn(*item.args, **item.kwargs)
+                except BaseException as e:
+                    failed = True
+                    item.future.set_exception(e)
+                else:
+                    item.future.set_result(result)
+            del item.fn, item.args, item.kwargs
+
+            with self._lock:
+                lane.run_total += time.perf_counter() - started
+                lane.completed += 1
+                lane.failed += failed
+                self._active -= 1
+            self._idle.release()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Stop accepting tasks and stop the workers once the queue is drained.
+
+        Args:
+            wait: Wait for the workers to exit
+            cancel_futures: Cancel tasks that have not started yet
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        _, _, item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item.future.cancel()
+                        self._stats[item.priority].depth -= 1
+            workers = list(self._workers)
+            for _ in workers:
+                self._queue.put((self._SHUTDOWN, next(self._sequence), None))
+
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def get_queue_depth(self) -> int:
+        """
+        Get the number of tasks waiting in all lanes.
+
+        Returns:
+            Number of queued tasks
+        """
+        with self._lock:
+            return sum(lane.depth for lane in self._stats.values())
+
+    def has_capacity(self) -> bool:
+        """
+        Check if a new task would start at once.
+
+        Returns:
+            True if no task is queued and a worker is free
+        """
+        with self._lock:
+            queued = sum(lane.depth for lane in self._stats.values())
+            return queued == 0 and self._active < self.max_workers
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get queue depth and latency metrics.
+
+        Returns:
+            Dictionary with worker counts and per-lane statistics (times in ms)
+        """
+        with self._lock:
+            lanes = {}
+            for priority, lane in self._stats.items():
+                started = lane.completed or 1
+                lanes[priority.name.lower()] = {
+                    'queue_depth': lane.depth,
+                    'max_queue_depth': lane.max_depth,
+                    'submitted': lane.submitted,
+                    'completed': lane.completed,
+                    'failed': lane.failed,
+                    'average_wait': lane.wait_total / started * 1000,
+                    'max_wait': lane.wait_max * 1000,
+                    'average_run': lane.run_total / started * 1000,
+                }
+            return {
+                'workers': len(self._workers),
+                'max_workers': self.max_workers,
+                'active': self._active,
+                'lanes': lanes,
+            }
+
+
+# Global scheduler instance
+scheduler = TaskScheduler(max_workers=4)
@@ -0,0 +1,115 @@
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Separates fields in the search text, so a match never spans two fields
+FIELD_SEPARATOR = "\x00"
+
+
+def build_search_text(fields: Iterable[Any]) -> str:
+    """
+    Join searchable fields into one lowercased text.
+
+    Args:
+        fields: Field values; lists and tuples are flattened, None is skipped
+
+    Returns:
+        Text matched by substring search
+    """
+    parts = []
+    for field in fields:
+        if field is None:
+            continue
+        if isinstance(field, (list, tuple)):
+            parts.extend(str(item) for item in field)
+        else:
+            parts.append(str(field))
+    return FIELD_SEPARATOR.join(parts).lower()
+
+
+class SearchIndex:
+    """
+    Substring search over one snapshot of resources.
+
+    Every resource contributes one lowercased text. A trigram posting index
+    maps each three-character substring to the resources containing it, so a
+    query only verifies the resources of its rarest trigram instead of
+    scanning the whole snapshot. A query that extends the previous one is
+    matched against the previous matches only.
+    """
+
+    GRAM = 3
+
+    def __init__(self, resources: List[Any], get_text: Callable[[Any], str]):
+        """
+        Build the index.
+
+        Args:
+            resources: Snapshot to index (kept by reference, not copied)
+            get_text: Function returning the lowercased search text of a resource
+        """
+        self.resources = resources
+        self._texts = [get_text(resource) for resource in resources]
+        self._postings: Dict[str, array] = {}
+
+        gram = self.GRAM
+        for position, text in enumerate(self._texts):
+            for trigram in {text[i:i + gram] for i in range(len(text) - gram + 1)}:
+                postings = self._postings.get(trigram)
+                if postings is None:
+                    postings = self._postings[trigram] = array('I')
+                postings.append(position)
+
+        # (query, positions) of the previous search, replaced as one value
+        # since the index is shared by the main loop and the search workers
+        self._last: Optional[Tuple[str, List[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def search(self, query: str) -> List[Any]:
+        """
+        Find the resources whose text contains the query.
+
+        Args:
+            query: Search query (case-insensitive)
+
+        Returns:
+            Matching resources in snapshot order
+        """
+        query = query.lower()
+        if not query:
+            return list(self.resources)
+
+        positions = self._match(query)
+        self._last = (query, positions)
+        resources = self.resources
+        return [resources[position] for position in positions]
+
+    def _match(self, query: str) -> List[int]:
+        """Positions of the texts containing the query."""
+        texts = self._texts
+        candidates = self._get_candidates(query)
+        if candidates is None:
+            return [position for position, text in enumerate(texts) if query in text]
+        return [position for position in candidates if query in texts[position]]
+
+    def _get_candidates(self, query: str) -> Optional[Iterable[int]]:
+        """Smallest known superset of the matches (None for all texts)."""
+        candidates = None
+
+        # Every match of a longer query also matched the previous one
+        last = self._last
+        if last is not None and last[0] in query:
+            candidates = last[1]
+
+        gram = self.GRAM
+        if len(query) >= gram:
+            for i in range(len(query) - gram + 1):
+                postings = self._postings.get(query[i:i + gram])
+                if postings is None:
+                    return ()
+                if candidates is None or len(postings) < len(candidates):
+                    candidates = postings
+
+        return candidates
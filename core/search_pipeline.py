@@ -0,0 +1,113 @@
+import threading
+from typing import Any, Callable, Dict
+
+from gi.repository import GLib
+
+from .scheduler import Priority, scheduler
+
+
+class SearchPipeline:
+    """
+    Debounced search and filtering off the main loop.
+
+    Each request bumps a generation token. The request waits out the
+    debounce delay on the main loop, runs on a scheduler worker and hands
+    its result back through GLib.idle_add. A result is delivered only if no
+    newer request arrived in the meantime, so a burst of keystrokes costs
+    one filtering pass and one UI update.
+    """
+
+    def __init__(self, run: Callable[[str, Dict[str, Any], Callable[[], bool]], Any],
+                 deliver: Callable[[Any], None], delay_ms: int = 100,
+                 priority: Priority = Priority.FOREGROUND):
+        """
+        Initialize the pipeline.
+
+        Args:
+            run: Function (query, filters, is_cancelled) computing the result
+                in a worker thread; it may return early once is_cancelled()
+            deliver: Function receiving the result on the main loop
+            delay_ms: Debounce delay in milliseconds
+            priority: Scheduler lane for the filtering
+        """
+        self._run = run
+        self._deliver = deliver
+        self.delay_ms = delay_ms
+        self.priority = priority
+
+        self._generation = 0
+        self._timer = None
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Token of the latest request."""
+        return self._generation
+
+    def request(self, query: str, filters: Dict[str, Any]):
+        """
+        Request a search; supersedes any request still pending or running.
+
+        Args:
+            query: Search query
+            filters: Dictionary with filtering criteria
+        """
+        generation = self._next_generation()
+        self._remove_timer()
+        self._timer = GLib.timeout_add(self.delay_ms, self._start, generation, query, dict(filters))
+
+    def cancel(self):
+        """Drop the pending and running requests."""
+        self._next_generation()
+        self._remove_timer()
+
+    def is_current(self, generation: int) -> bool:
+        """
+        Check whether a request is still the latest one.
+
+        Args:
+            generation: Token of the request
+
+        Returns:
+            True if no newer request was made
+        """
+        return generation == self._generation
+
+    def _next_generation(self) -> int:
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def _remove_timer(self):
+        if self._timer:
+            try:
+                GLib.source_remove(self._timer)
+            except (ValueError, TypeError):
+                # Ignore errors if the ID is not found
+                pass
+            self._timer = None
+
+    def _start(self, generation: int, query: str, filters: Dict[str, Any]):
+        """Debounce delay elapsed: move the work to a worker."""
+        if self.is_current(generation):
+            self._timer = None
+            scheduler.submit_with_priority(self.priority, self._run_request, generation, query, filters)
+        return False  # Stop the timer
+
+    def _run_request(self, generation: int, query: str, filters: Dict[str, Any]):
+        """Compute the result in a worker thread."""
+        if not self.is_current(generation):
+            return
+        try:
+            result = self._run(query, filters, lambda: not self.is_current(generation))
+        except Exception as e:
+            print(f"Error in search pipeline: {e}")
+            return
+        if self.is_current(generation):
+            GLib.idle_add(self._finish, generation, result)
+
+    def _finish(self, generation: int, result: Any):
+        """Deliver the result on the main loop unless it went stale."""
+        if self.is_current(generation):
+            self._deliver(result)
+        return False
@@ -0,0 +1,131 @@
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .scheduler import scheduler
+
+
+def _spawn_scheduled(run: Callable):
+    """Run a flight on the shared scheduler."""
+    scheduler.submit(run)
+
+
+def _run_inline(run: Callable):
+    """Run a flight in the calling thread."""
+    run()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    Every caller receives the same Future, so a result is fetched once no
+    matter how many places ask for it at the same moment.
+    """
+
+    def __init__(self, spawn: Optional[Callable] = None):
+        """
+        Initialize the coalescer.
+
+        Args:
+            spawn: Function that starts a flight in the background
+                (the shared scheduler's normal lane if None)
+        """
+        self._spawn = spawn or _spawn_scheduled
+        self._lock = threading.Lock()
+        self._flights: Dict[str, Future] = {}
+        self._trailing: Dict[str, Tuple[Future, Callable, Callable]] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """
+        Check if a call for the key is running or queued.
+
+        Args:
+            key: Flight key
+
+        Returns:
+            True if a call is in flight
+        """
+        with self._lock:
+            return key in self._flights
+
+    def submit(self, key: str, func: Callable[[], Any], fresh: bool = False,
+               spawn: Optional[Callable] = None) -> Future:
+        """
+        Start func in the background or join the call already in flight.
+
+        Args:
+            key: Flight key
+            func: Function producing the result
+            fresh: The caller needs a result that started after this call
+                (e.g. after a change); instead of joining a running flight,
+                one trailing flight is queued and shared by all such callers
+            spawn: Override for the function that starts the flight
+
+        Returns:
+            Future with the result of the shared call
+        """
+        spawn = spawn or self._spawn
+        with self._lock:
+            current = self._flights.get(key)
+            if current is not None:
+                if not fresh:
+                    return current
+                trailing = self._trailing.get(key)
+                if trailing is None:
+                    trailing = (Future(), func, spawn)
+                    self._trailing[key] = trailing
+                return trailing[0]
+
+            future = Future()
+            self._flights[key] = future
+
+        spawn(lambda: self._run(key, future, func))
+        return future
+
+    def do(self, key: str, func: Callable[[], Any], fresh: bool = False) -> Any:
+        """
+        Call func, or wait for the call already in flight for the key.
+
+        Args:
+            key: Flight key
+            func: Function producing the result
+            fresh: Wait for the running flight to finish and start a new one
+
+        Returns:
+            Result of the shared call
+        """
+        if fresh:
+            with self._lock:
+                current = self._flights.get(key)
+            if current is not None:
+                wait([current])
+        return self.submit(key, func, spawn=_run_inline).result()
+
+    def _run(self, key: str, future: Future, func: Callable[[], Any]):
+        """Execute a flight and publish its result."""
+        if not future.set_running_or_notify_cancel():
+            self._finish(key)
+            return
+
+        try:
+            result = func()
+        except BaseException as e:
+            # Leave the key before publishing so done callbacks can start a new flight
+            self._finish(key)
+            future.set_exception(e)
+        else:
+            self._finish(key)
+            future.set_result(result)
+
+    def _finish(self, key: str):
+        """Retire the current flight and start the trailing one, if any."""
+        with self._lock:
+            trailing = self._trailing.pop(key, None)
+            if trailing is None:
+                self._flights.pop(key, None)
+                return
+            future, func, spawn = trailing
+            self._flights[key] = future
+
+        spawn(lambda: self._run(key, future, func))
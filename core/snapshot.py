@@ -0,0 +1,73 @@
+from typing import Any, Optional, Sequence, Tuple
+
+
+class Snapshot:
+    """
+    One published state of a resource manager.
+
+    The resources and their filtered view are tuples and the snapshot itself
+    is immutable, so a reader holding a snapshot sees a consistent pair for
+    as long as it keeps the reference, without copying or locking. A manager
+    publishes a new state by replacing its snapshot reference, which is a
+    single atomic assignment; the version grows with every publication.
+    The generation identifies the refresh (or local change) the resources
+    come from, so a completion older than the published data is detected.
+    """
+
+    __slots__ = ("version", "resources", "filtered", "view", "generation")
+
+    def __init__(self, version: int = 0, resources: Tuple[Any, ...] = (),
+                 filtered: Tuple[Any, ...] = (), view: Optional[tuple] = None,
+                 generation: int = 0):
+        """
+        Initialize the snapshot.
+
+        Args:
+            version: Publication number
+            resources: All resources
+            filtered: Resources matching the search and filters, in display order
+            view: Search, filters and sort the filtered view was computed for
+            generation: Generation of the refresh that produced the resources
+        """
+        set_field = object.__setattr__
+        set_field(self, "version", version)
+        set_field(self, "resources", resources)
+        set_field(self, "filtered", filtered)
+        set_field(self, "view", view)
+        set_field(self, "generation", generation)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Snapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Snapshot is immutable")
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def replace(self, resources: Optional[Sequence[Any]] = None,
+                filtered: Optional[Sequence[Any]] = None, view: Optional[tuple] = None,
+                generation: Optional[int] = None) -> "Snapshot":
+        """
+        Derive the next snapshot.
+
+        Args:
+            resources: New resources (kept if None)
+            filtered: New filtered view (kept if None)
+            view: Search, filters and sort of the new filtered view (kept if None)
+            generation: Generation of the new resources (kept if None)
+
+        Returns:
+            Snapshot with the next version
+        """
+        return Snapshot(
+            self.version + 1,
+            self.resources if resources is None else tuple(resources),
+            self.filtered if filtered is None else tuple(filtered),
+            self.view if view is None else view,
+            self.generation if generation is None else generation,
+        )
+
+    def __repr__(self) -> str:
+        return (f"Snapshot(version={self.version}, generation={self.generation}, "
+                f"resources={len(self.resources)}, filtered={len(self.filtered)})")
@@ -0,0 +1,160 @@
+import threading
+from array import array
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+# Sort specification: (sort key name, descending) pairs, most significant first
+SortSpec = Tuple[Tuple[str, bool], ...]
+
+
+def text_key(get_value: Callable[[Any], Any]) -> Callable[[Any], str]:
+    """Case-insensitive text sort key (missing values sort first)."""
+    return lambda resource: str(get_value(resource) or "").lower()
+
+
+def number_key(get_value: Callable[[Any], Any]) -> Callable[[Any], float]:
+    """Numeric sort key for raw sizes and counts (missing values sort as 0)."""
+    def key(resource):
+        value = get_value(resource)
+        return value if isinstance(value, (int, float)) else 0
+    return key
+
+
+def sort_resources(resources: Sequence[Any], spec: SortSpec,
+                   sort_keys: Dict[str, Callable[[Any], Any]]) -> List[Any]:
+    """
+    Sort resources without a cache (for lists that are not a snapshot).
+
+    Args:
+        resources: Resources to sort
+        spec: Sort specification
+        sort_keys: Sort key functions by name
+
+    Returns:
+        Sorted copy of the resources
+    """
+    result = list(resources)
+    # Stable sorts from the least significant column up
+    for name, descending in reversed(spec):
+        result.sort(key=sort_keys[name], reverse=descending)
+    return result
+
+
+class SortCache:
+    """
+    Sorted orders of one snapshot of resources.
+
+    The typed sort key of a column is computed once per snapshot, on first
+    use, and every requested order is kept as a permutation of snapshot
+    positions. Multi-column orders are built by a stable sort of the order
+    of their less significant columns, which is itself cached, so switching
+    the sort column back and forth costs a lookup.
+    """
+
+    def __init__(self, resources: List[Any], sort_keys: Dict[str, Callable[[Any], Any]]):
+        """
+        Initialize the cache.
+
+        Args:
+            resources: Snapshot to sort (kept by reference, not copied)
+            sort_keys: Sort key functions by name; a key function must return
+                values of one comparable type (e.g. 0 rather than None)
+        """
+        self.resources = resources
+        self.sort_keys = sort_keys
+        self._keys: Dict[str, list] = {}
+        self._permutations: Dict[SortSpec, array] = {}
+        self._ranks: Dict[SortSpec, array] = {}
+        self._positions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get_permutation(self, spec: SortSpec) -> array:
+        """
+        Get the snapshot positions in sorted order.
+
+        Args:
+            spec: Sort specification
+
+        Returns:
+            Permutation of range(len(resources))
+        """
+        spec = tuple(spec)
+        with self._lock:
+            return self._get_permutation(spec)
+
+    def sort(self, resources: List[Any], spec: SortSpec) -> List[Any]:
+        """
+        Sort the snapshot or a selection of it.
+
+        Args:
+            resources: The snapshot, or resources taken from it (a search result)
+            spec: Sort specification
+
+        Returns:
+            Sorted list of the resources
+        """
+        if not spec:
+            return resources
+
+        spec = tuple(spec)
+        snapshot = self.resources
+        with self._lock:
+            permutation = self._get_permutation(spec)
+            if resources is snapshot:
+                return [snapshot[position] for position in permutation]
+
+            positions = self._get_positions()
+            try:
+                selected = [positions[id(resource)] for resource in resources]
+            except KeyError:
+                # Not a selection of this snapshot
+                return sort_resources(resources, spec, self.sort_keys)
+
+            if len(selected) * 4 < len(snapshot):
+                # Small selection: order by rank rather than walking the whole snapshot
+                selected.sort(key=self._get_ranks(spec).__getitem__)
+                return [snapshot[position] for position in selected]
+
+        members = set(selected)
+        return [snapshot[position] for position in permutation if position in members]
+
+    def _get_permutation(self, spec: SortSpec) -> array:
+        """Get a permutation from the cache, sorting the less significant order if needed."""
+        permutation = self._permutations.get(spec)
+        if permutation is not None:
+            return permutation
+
+        if len(spec) > 1:
+            order = list(self._get_permutation(spec[1:]))
+        else:
+            order = list(range(len(self.resources)))
+        name, descending = spec[0]
+        order.sort(key=self._get_keys(name).__getitem__, reverse=descending)
+
+        permutation = array('I', order)
+        self._permutations[spec] = permutation
+        return permutation
+
+    def _get_ranks(self, spec: SortSpec) -> array:
+        """Inverse of a permutation: snapshot position -> sorted position."""
+        ranks = self._ranks.get(spec)
+        if ranks is None:
+            ranks = array('I', bytes(4 * len(self.resources)))
+            for rank, position in enumerate(self._get_permutation(spec)):
+                ranks[position] = rank
+            self._ranks[spec] = ranks
+        return ranks
+
+    def _get_keys(self, name: str) -> list:
+        """Typed sort keys of a column, computed once per snapshot."""
+        keys = self._keys.get(name)
+        if keys is None:
+            get_key = self.sort_keys[name]
+            keys = self._keys[name] = [get_key(resource) for resource in self.resources]
+        return keys
+
+    def _get_positions(self) -> Dict[int, int]:
+        """Snapshot position of each resource object."""
+        if not self._positions and self.resources:
+            self._positions = {id(resource): position for position, resource in enumerate(self.resources)}
+        return self._positions
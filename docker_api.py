@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 import docker
+import threading
 import time
-from typing import Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from docker_records import ContainerRecord, ImageRecord, NetworkRecord, VolumeRecord
 
 class DockerAPI:
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, executor: Executor | None = None):
         self.client = docker.from_env()
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # A shared executor (e.g. the application scheduler) is used as is and
+        # not shut down here; otherwise the API owns a private pool
+        self.max_workers = max_workers
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else ThreadPoolExecutor(max_workers=max_workers)
         self._connection_cache = {}
         self._last_ping = 0
         self._ping_interval = 30
@@ -30,152 +37,253 @@ class DockerAPI:
             self._last_ping = current_time
             return False
 
-    def get_images(self) -> list[dict[str, Any]]:
-        """Get list of Docker images with optimization"""
+    # Listing engine: every listing is a single low-level /<kind>/json call and
+    # records are projected straight from the decoded JSON, without wrapping
+    # them in SDK Model objects first
+
+    def get_images(self, filters: dict[str, Any] | None = None) -> list[ImageRecord]:
+        """Get list of Docker images from the /images/json summary, optionally filtered by the daemon"""
         try:
-            images = self.client.images.list()
-            result = []
-            
-            for image in images:
-                image_id = image.short_id.replace("sha256:", "")
-                
-                # Optimized tag retrieval
-                repo = "<none>"
-                tag = "<none>"
-                if image.tags:
-                    repo_tag = image.tags[0].split(":")
-                    repo = repo_tag[0]
-                    tag = repo_tag[1] if len(repo_tag) > 1 else "latest"
-                
-                # Get attributes once
-                attrs = image.attrs
-                size = attrs.get("Size", 0)
-                created = attrs.get("Created", "")
-                repo_tags = image.tags if image.tags else ["<none>"]
-                
-                result.append({
-                    "Id": image_id,
-                    "id": image_id,
-                    "Repository": repo,
-                    "repository": repo,
-                    "Tag": tag,
-                    "tag": tag,
-                    "Size": size,
-                    "size": size,
-                    "Created": created,
-                    "created": created,
-                    "RepoTags": repo_tags
-                })
-            
-            return result
+            images = self.client.api.images(**self._filter_kwargs(filters))
+            return [self._project_image(image) for image in images]
         except Exception as e:
             print(f"Ошибка получения образов: {e}")
             return []
 
-    def get_containers(self, all: bool = True) -> list[dict[str, Any]]:
-        """Get list of Docker containers with optimization"""
+    def get_containers(self, all: bool = True, filters: dict[str, Any] | None = None) -> list[ContainerRecord]:
+        """Get list of Docker containers from the /containers/json summary, optionally filtered by the daemon"""
         try:
-            containers = self.client.containers.list(all=all)
+            # The summary already carries Image/ImageID, so no per-container
+            # inspect or image lookup is needed
+            containers = self.client.api.containers(all=all, **self._filter_kwargs(filters))
+            image_tags = None
             result = []
             
             for container in containers:
-                container_id = container.short_id
-                name = container.name
-                image = container.image.tags[0] if container.image.tags else container.image.short_id
-                status = container.status
-
-                # Optimized port retrieval
-                ports = []
-                try:
-                    ports_info = container.attrs.get("HostConfig", {}).get("PortBindings", {})
-                    for container_port, host_ports in ports_info.items():
-                        if host_ports:
-                            for host_port in host_ports:
-                                ports.append(f"{host_port.get('HostPort', '')}:{container_port}")
-                except Exception:
-                    pass  # Ignore port retrieval errors
-                
-                ports_str = ", ".join(ports) if ports else ""
+                image = container.get("Image", "")
+                image_id = container.get("ImageID", "")
+                if self._is_image_reference_missing(image, image_id):
+                    # Resolve tags from a single images listing shared by the whole batch
+                    if image_tags is None:
+                        image_tags = self._get_image_tags()
+                    tags = image_tags.get(image_id)
+                    image = tags[0] if tags else "sha256:" + image_id.replace("sha256:", "")[:12]
                 
-                result.append({
-                    "Id": container_id,
-                    "id": container_id,
-                    "Names": [name],
-                    "name": name,
-                    "Image": image,
-                    "image": image,
-                    "State": status,
-                    "Status": status,
-                    "status": status,
-                    "Ports": ports,
-                    "ports": ports_str
-                })
+                result.append(self._project_container(container, image))
             
             return result
         except Exception as e:
             print(f"Ошибка получения контейнеров: {e}")
             return []
 
-    def get_networks(self) -> list[dict[str, Any]]:
-        """Get list of Docker networks with optimization"""
+    @staticmethod
+    def _is_image_reference_missing(image: str, image_id: str) -> bool:
+        """Check whether a container summary names its image only by ID"""
+        if not image or image.startswith("sha256:"):
+            return True
+        # Containers created from an ID prefix report that prefix as Image
+        return bool(image_id) and image_id.replace("sha256:", "").startswith(image)
+
+    def _get_image_tags(self) -> dict[str, list[str]]:
+        """Map image IDs to their tags with one /images/json call"""
         try:
-            networks = self.client.networks.list()
-            result = []
-            
-            for network in networks:
-                network_id = network.short_id
-                name = network.name
-                
-                # Get attributes once
-                attrs = network.attrs
-                driver = attrs.get("Driver", "")
-                scope = attrs.get("Scope", "")
-                
-                result.append({
-                    "Id": network_id,
-                    "id": network_id,
-                    "Name": name,
-                    "name": name,
-                    "Driver": driver,
-                    "driver": driver,
-                    "Scope": scope,
-                    "scope": scope
-                })
-            
-            return result
+            return {
+                image["Id"]: [tag for tag in image.get("RepoTags") or [] if tag != "<none>:<none>"]
+                for image in self.client.api.images()
+            }
+        except Exception as e:
+            print(f"Ошибка получения тегов образов: {e}")
+            return {}
+
+    def get_networks(self, filters: dict[str, Any] | None = None) -> list[NetworkRecord]:
+        """Get list of Docker networks from the /networks summary, optionally filtered by the daemon"""
+        try:
+            networks = self.client.api.networks(**self._filter_kwargs(filters))
+            return [self._project_network(network) for network in networks]
         except Exception as e:
             print(f"Ошибка получения сетей: {e}")
             return []
 
-    def get_volumes(self) -> list[dict[str, Any]]:
-        """Get list of Docker volumes with optimization"""
+    def get_volumes(self, filters: dict[str, Any] | None = None) -> list[VolumeRecord]:
+        """Get list of Docker volumes from the /volumes summary, optionally filtered by the daemon"""
         try:
-            volumes = self.client.volumes.list()
-            result = []
-            
-            for volume in volumes:
-                volume_id = volume.short_id
-                name = volume.name
-                
-                # Get attributes once
-                attrs = volume.attrs
-                driver = attrs.get("Driver", "")
-                mountpoint = attrs.get("Mountpoint", "")
-                
-                result.append({
-                    "Name": name,
-                    "name": name,
-                    "Driver": driver,
-                    "driver": driver,
-                    "Mountpoint": mountpoint,
-                    "mountpoint": mountpoint
-                })
-            
-            return result
+            volumes = self.client.api.volumes(**self._filter_kwargs(filters)).get("Volumes") or []
+            return [self._project_volume(volume) for volume in volumes]
         except Exception as e:
             print(f"Ошибка получения томов: {e}")
             return []
 
+    # Targeted lookups used to apply /events without re-listing; each returns
+    # None when the resource no longer exists and raises on any other error,
+    # so a failed lookup is never mistaken for a removal
+
+    def get_container(self, container_id: str) -> ContainerRecord | None:
+        """Get one container from a /containers/json summary filtered by ID"""
+        try:
+            containers = self.client.api.containers(all=True, filters={"id": container_id})
+            if not containers:
+                return None
+            container = containers[0]
+            image = container.get("Image", "")
+            image_id = container.get("ImageID", "")
+            if self._is_image_reference_missing(image, image_id):
+                image = self._resolve_image_tag(image_id)
+            return self._project_container(container, image)
+        except docker.errors.NotFound:
+            return None
+        except Exception as e:
+            print(f"Ошибка получения контейнера {container_id}: {e}")
+            raise
+
+    def _resolve_image_tag(self, image_id: str) -> str:
+        """Resolve the first tag of a single image, falling back to its short ID"""
+        try:
+            tags = [
+                tag for tag in self.client.api.inspect_image(image_id).get("RepoTags") or []
+                if tag != "<none>:<none>"
+            ]
+        except docker.errors.NotFound:
+            tags = []
+        return tags[0] if tags else "sha256:" + image_id.replace("sha256:", "")[:12]
+
+    def get_image(self, image_ref: str) -> ImageRecord | None:
+        """Get one image by ID or name from /images/{name}/json"""
+        try:
+            return self._project_image(self.client.api.inspect_image(image_ref))
+        except docker.errors.NotFound:
+            return None
+        except Exception as e:
+            print(f"Ошибка получения образа {image_ref}: {e}")
+            raise
+
+    def get_network(self, network_id: str) -> NetworkRecord | None:
+        """Get one network from the /networks summary filtered by ID"""
+        try:
+            networks = self.client.api.networks(ids=[network_id])
+            return self._project_network(networks[0]) if networks else None
+        except docker.errors.NotFound:
+            return None
+        except Exception as e:
+            print(f"Ошибка получения сети {network_id}: {e}")
+            raise
+
+    def get_volume(self, volume_name: str) -> VolumeRecord | None:
+        """Get one volume from /volumes/{name}"""
+        try:
+            return self._project_volume(self.client.api.inspect_volume(volume_name))
+        except docker.errors.NotFound:
+            return None
+        except Exception as e:
+            print(f"Ошибка получения тома {volume_name}: {e}")
+            raise
+
+    def get_events(self, since: Any = None):
+        """Open the /events stream for containers, images, networks and volumes
+
+        Returns a decoded, closable stream; since replays events missed while
+        the stream was down.
+        """
+        return self.client.api.events(
+            since=since,
+            decode=True,
+            filters={"type": ["container", "image", "network", "volume"]}
+        )
+
+    @staticmethod
+    def _filter_kwargs(filters: dict[str, Any] | None) -> dict[str, Any]:
+        """Listing kwargs for daemon-side filters (none for a plain listing)"""
+        return {"filters": filters} if filters else {}
+
+    @staticmethod
+    def _project_image(image: dict[str, Any]) -> ImageRecord:
+        """Project an /images/json record onto the fields the UI uses"""
+        image_id = image.get("Id", "").replace("sha256:", "")[:12]
+        tags = [tag for tag in image.get("RepoTags") or [] if tag != "<none>:<none>"]
+        
+        repo = "<none>"
+        tag = "<none>"
+        if tags:
+            # Split on the last colon after the last slash so registry ports survive
+            name, sep, version = tags[0].rpartition(":")
+            if sep and "/" not in version:
+                repo, tag = name, version
+            else:
+                repo, tag = tags[0], "latest"
+        
+        return ImageRecord(
+            id=image_id,
+            repository=repo,
+            tag=tag,
+            size=image.get("Size", 0),
+            created=DockerAPI._format_timestamp(image.get("Created", "")),
+            repo_tags=tags,
+            labels=image.get("Labels")
+        )
+
+    @staticmethod
+    def _project_container(container: dict[str, Any], image: str) -> ContainerRecord:
+        """Project a /containers/json record onto the fields the UI uses"""
+        container_id = container.get("Id", "")[:12]
+        names = container.get("Names") or []
+        
+        # Only published ports, IPv4/IPv6 duplicates collapsed
+        ports = dict.fromkeys(
+            f"{port['PublicPort']}:{port.get('PrivatePort', '')}/{port.get('Type', 'tcp')}"
+            for port in container.get("Ports") or []
+            if port.get("PublicPort")
+        )
+        
+        # Named volumes only; bind mounts and tmpfs are not Docker resources
+        volumes = [
+            mount["Name"] for mount in container.get("Mounts") or []
+            if mount.get("Type") == "volume" and mount.get("Name")
+        ]
+        networks = [
+            network["NetworkID"][:12]
+            for network in ((container.get("NetworkSettings") or {}).get("Networks") or {}).values()
+            if network and network.get("NetworkID")
+        ]
+        
+        return ContainerRecord(
+            id=container_id,
+            name=names[0].lstrip("/") if names else container_id,
+            image=image,
+            status=container.get("State", ""),
+            ports=ports,
+            labels=container.get("Labels"),
+            image_id=container.get("ImageID", "").replace("sha256:", "")[:12],
+            volumes=volumes,
+            networks=networks
+        )
+
+    @staticmethod
+    def _project_network(network: dict[str, Any]) -> NetworkRecord:
+        """Project a /networks record onto the fields the UI uses"""
+        return NetworkRecord(
+            id=network.get("Id", "")[:12],
+            name=network.get("Name", ""),
+            driver=network.get("Driver", ""),
+            scope=network.get("Scope", ""),
+            labels=network.get("Labels")
+        )
+
+    @staticmethod
+    def _project_volume(volume: dict[str, Any]) -> VolumeRecord:
+        """Project a /volumes record onto the fields the UI uses"""
+        return VolumeRecord(
+            name=volume.get("Name", ""),
+            driver=volume.get("Driver", ""),
+            mountpoint=volume.get("Mountpoint", ""),
+            labels=volume.get("Labels")
+        )
+
+    @staticmethod
+    def _format_timestamp(created: Any) -> str:
+        """Normalize a summary timestamp (Unix seconds) to the ISO form of inspect"""
+        if isinstance(created, (int, float)):
+            return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(created))
+        return created or ""
+
     def get_system_info(self) -> dict[str, Any]:
         """Get system information about Docker with caching"""
         try:
@@ -184,7 +292,7 @@ class DockerAPI:
                 "Containers": info.get("Containers", 0),
                 "Images": info.get("Images", 0),
                 "Networks": len(info.get("NetworkSettings", {}).get("Networks", {})),
-                "Volumes": len(self.client.volumes.list()),
+                "Volumes": len(self.client.api.volumes().get("Volumes") or []),
                 "DockerRootDir": info.get("DockerRootDir", ""),
                 "ServerVersion": info.get("ServerVersion", ""),
                 "OperatingSystem": info.get("OperatingSystem", ""),
@@ -272,8 +380,6 @@ class DockerAPI:
 
     def delete_images(self, image_ids: list[str]) -> dict[str, bool]:
         """Batch deletion of images with parallel processing"""
-        results = {}
-        
         def delete_single_image(img_id):
             try:
                 image = self.client.images.get(img_id)
@@ -283,14 +389,7 @@ class DockerAPI:
                 print(f"Ошибка удаления образа {img_id}: {e}")
                 return img_id, False
         
-        # Parallel deletion
-        futures = [self.executor.submit(delete_single_image, img_id) for img_id in image_ids]
-        
-        for future in as_completed(futures):
-            img_id, success = future.result()
-            results[img_id] = success
-        
-        return results
+        return self._run_batch(delete_single_image, image_ids)
 
     def delete_container(self, container_id: str, force: bool = False) -> bool:
         """Delete container with optimization"""
@@ -304,8 +403,6 @@ class DockerAPI:
 
     def delete_containers(self, container_ids: list[str], force: bool = False) -> dict[str, bool]:
         """Batch deletion of containers with parallel processing"""
-        results = {}
-        
         def delete_single_container(cont_id):
             try:
                 container = self.client.containers.get(cont_id)
@@ -315,14 +412,27 @@ class DockerAPI:
                 print(f"Ошибка удаления контейнера {cont_id}: {e}")
                 return cont_id, False
         
-        # Parallel deletion
-        futures = [self.executor.submit(delete_single_container, cont_id) for cont_id in container_ids]
-        
-        for future in as_completed(futures):
-            cont_id, success = future.result()
-            results[cont_id] = success
-        
-        return results
+        return self._run_batch(delete_single_container, container_ids)
+
+    def start_container(self, container_id: str) -> bool:
+        """Start container"""
+        try:
+            container = self.client.containers.get(container_id)
+            container.start()
+            return True
+        except Exception as e:
+            print(f"Ошибка запуска контейнера {container_id}: {e}")
+            return False
+
+    def restart_container(self, container_id: str) -> bool:
+        """Restart container"""
+        try:
+            container = self.client.containers.get(container_id)
+            container.restart()
+            return True
+        except Exception as e:
+            print(f"Ошибка перезапуска контейнера {container_id}: {e}")
+            return False
 
     def stop_container(self, container_id: str) -> bool:
         """Stop container with optimization"""
@@ -336,8 +446,6 @@ class DockerAPI:
 
     def stop_containers(self, container_ids: list[str]) -> dict[str, bool]:
         """Batch stop of containers with parallel processing"""
-        results = {}
-        
         def stop_single_container(cont_id):
             try:
                 container = self.client.containers.get(cont_id)
@@ -347,14 +455,7 @@ class DockerAPI:
                 print(f"Ошибка остановки контейнера {cont_id}: {e}")
                 return cont_id, False
         
-        # Parallel stop
-        futures = [self.executor.submit(stop_single_container, cont_id) for cont_id in container_ids]
-        
-        for future in as_completed(futures):
-            cont_id, success = future.result()
-            results[cont_id] = success
-        
-        return results
+        return self._run_batch(stop_single_container, container_ids)
 
     def delete_network(self, network_id: str) -> bool:
         """Delete network with optimization"""
@@ -368,8 +469,6 @@ class DockerAPI:
 
     def delete_networks(self, network_ids: list[str]) -> dict[str, bool]:
         """Batch deletion of networks with parallel processing"""
-        results = {}
-        
         def delete_single_network(net_id):
             try:
                 network = self.client.networks.get(net_id)
@@ -379,14 +478,7 @@ class DockerAPI:
                 print(f"Ошибка удаления сети {net_id}: {e}")
                 return net_id, False
         
-        # Parallel deletion
-        futures = [self.executor.submit(delete_single_network, net_id) for net_id in network_ids]
-        
-        for future in as_completed(futures):
-            net_id, success = future.result()
-            results[net_id] = success
-        
-        return results
+        return self._run_batch(delete_single_network, network_ids)
 
     def delete_volume(self, volume_name: str) -> bool:
         """Delete volume with optimization"""
@@ -400,8 +492,6 @@ class DockerAPI:
 
     def delete_volumes(self, volume_names: list[str]) -> dict[str, bool]:
         """Batch deletion of volumes with parallel processing"""
-        results = {}
-        
         def delete_single_volume(vol_name):
             try:
                 volume = self.client.volumes.get(vol_name)
@@ -411,13 +501,50 @@ class DockerAPI:
                 print(f"Ошибка удаления тома {vol_name}: {e}")
                 return vol_name, False
         
-        # Parallel deletion
-        futures = [self.executor.submit(delete_single_volume, vol_name) for vol_name in volume_names]
+        return self._run_batch(delete_single_volume, volume_names)
+
+    def _run_batch(self, func: Callable[[str], tuple[str, bool]], items: list[str]) -> dict[str, bool]:
+        """Run a batch operation in parallel with bounded concurrency
+
+        At most max_workers - 1 helpers are queued on the executor and the
+        calling thread works through the batch as well, so a large batch never
+        occupies more than max_workers threads, and a batch started from a
+        worker of the same executor cannot deadlock waiting for free workers.
+        """
+        pending = iter(list(items))
+        total = len(items)
+        results = {}
+        finished = 0
+        lock = threading.Lock()
+        all_done = threading.Condition(lock)
+        
+        def drain():
+            nonlocal finished
+            while True:
+                with lock:
+                    item = next(pending, None)
+                if item is None:
+                    return
+                try:
+                    key, success = func(item)
+                except Exception as e:
+                    print(f"Ошибка пакетной операции {item}: {e}")
+                    key, success = item, False
+                with lock:
+                    results[key] = success
+                    finished += 1
+                    if finished == total:
+                        all_done.notify_all()
         
-        for future in as_completed(futures):
-            vol_name, success = future.result()
-            results[vol_name] = success
+        for _ in range(min(self.max_workers, total) - 1):
+            self.executor.submit(drain)
+        drain()
         
+        # Items picked up by helpers are running and will finish; helpers
+        # still queued find the batch empty and return immediately
+        with lock:
+            while finished < total:
+                all_done.wait()
         return results
 
     # Методы очистки
@@ -512,5 +639,5 @@ class DockerAPI:
 
     def __del__(self):
         """Resource cleanup when object is deleted"""
-        if hasattr(self, 'executor'):
+        if hasattr(self, 'executor') and getattr(self, '_owns_executor', True):
             self.executor.shutdown(wait=True)
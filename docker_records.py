@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Compact record types for Docker resources.
+
+Records are immutable __slots__ objects that still read like the dicts
+DockerAPI used to return: every legacy key ("Id"/"id", "Name"/"name", ...)
+resolves to one stored field, so each value is kept once. Values that repeat
+across records (status, image, driver, scope, ...) are interned.
+"""
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so equal values share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _labels(labels: Any) -> tuple[tuple[str, str], ...]:
+    """Store labels as interned (key, value) pairs; label keys repeat across resources"""
+    if not labels:
+        return ()
+    if isinstance(labels, Mapping):
+        labels = labels.items()
+    return tuple((_intern(key), _intern(value)) for key, value in labels)
+
+
+class Record(Mapping):
+    """Immutable mapping over __slots__ with legacy key aliases"""
+
+    __slots__ = ()
+
+    # Legacy key -> attribute name, in the order the old dicts used
+    KEYS: dict[str, str] = {}
+
+    # Keys present only while their value is non-empty, so a record without
+    # labels still reads exactly like the old dict
+    OPTIONAL_KEYS: dict[str, str] = {"Labels": "labels_dict"}
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        name = self.KEYS.get(key)
+        if name is not None:
+            return getattr(self, name)
+        name = self.OPTIONAL_KEYS.get(key)
+        if name is not None:
+            value = getattr(self, name)
+            if value:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.KEYS
+        for key, name in self.OPTIONAL_KEYS.items():
+            if getattr(self, name):
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.KEYS) + sum(1 for name in self.OPTIONAL_KEYS.values() if getattr(self, name))
+
+    def __contains__(self, key) -> bool:
+        if key in self.KEYS:
+            return True
+        name = self.OPTIONAL_KEYS.get(key)
+        return name is not None and bool(getattr(self, name))
+
+    @property
+    def labels_dict(self) -> dict[str, str]:
+        return dict(self.labels)
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def copy(self) -> dict[str, Any]:
+        """Return a mutable dict with the legacy keys"""
+        return dict(self.items())
+
+    def replace(self, **changes) -> "Record":
+        """Return a new record with some fields changed"""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return type(self)(**values)
+
+
+class ContainerRecord(Record):
+    """Container projected from a /containers/json summary"""
+
+    __slots__ = ("id", "name", "image", "status", "ports", "labels", "image_id", "volumes", "networks")
+
+    KEYS = {
+        "Id": "id", "id": "id",
+        "Names": "names", "name": "name",
+        "Image": "image", "image": "image",
+        "State": "status", "Status": "status", "status": "status",
+        "Ports": "ports_list", "ports": "ports_display",
+    }
+
+    # Relations to other resources, in the short ID / name form their own
+    # records use: "ImageID" (12 hex digits), "VolumeNames", "NetworkIDs"
+    OPTIONAL_KEYS = {
+        **Record.OPTIONAL_KEYS,
+        "ImageID": "image_id",
+        "VolumeNames": "volumes_list",
+        "NetworkIDs": "networks_list",
+    }
+
+    def __init__(self, id: str, name: str, image: str, status: str, ports: tuple[str, ...] = (),
+                 labels: Any = (), image_id: str = "", volumes: tuple[str, ...] = (),
+                 networks: tuple[str, ...] = ()):
+        set_field = object.__setattr__
+        set_field(self, "id", id)
+        set_field(self, "name", name)
+        set_field(self, "image", _intern(image))
+        set_field(self, "status", _intern(status))
+        set_field(self, "ports", tuple(ports))
+        set_field(self, "labels", _labels(labels))
+        # Shared by every container of an image / volume / network
+        set_field(self, "image_id", _intern(image_id))
+        set_field(self, "volumes", tuple(_intern(name) for name in volumes))
+        set_field(self, "networks", tuple(_intern(network) for network in networks))
+
+    @property
+    def volumes_list(self) -> list[str]:
+        return list(self.volumes)
+
+    @property
+    def networks_list(self) -> list[str]:
+        return list(self.networks)
+
+    @property
+    def names(self) -> list[str]:
+        return [self.name]
+
+    @property
+    def ports_list(self) -> list[str]:
+        return list(self.ports)
+
+    @property
+    def ports_display(self) -> str:
+        return ", ".join(self.ports)
+
+
+class ImageRecord(Record):
+    """Image projected from an /images/json summary or inspect"""
+
+    __slots__ = ("id", "repository", "tag", "size", "created", "repo_tags", "labels")
+
+    KEYS = {
+        "Id": "id", "id": "id",
+        "Repository": "repository", "repository": "repository",
+        "Tag": "tag", "tag": "tag",
+        "Size": "size", "size": "size",
+        "Created": "created", "created": "created",
+        "RepoTags": "repo_tags_list",
+    }
+
+    def __init__(self, id: str, repository: str, tag: str, size: int, created: str,
+                 repo_tags: tuple[str, ...] = (), labels: Any = ()):
+        set_field = object.__setattr__
+        set_field(self, "id", id)
+        set_field(self, "repository", _intern(repository))
+        set_field(self, "tag", _intern(tag))
+        set_field(self, "size", size)
+        set_field(self, "created", created)
+        set_field(self, "repo_tags", tuple(repo_tags))
+        set_field(self, "labels", _labels(labels))
+
+    @property
+    def repo_tags_list(self) -> list[str]:
+        return list(self.repo_tags) if self.repo_tags else ["<none>"]
+
+
+class NetworkRecord(Record):
+    """Network projected from a /networks summary"""
+
+    __slots__ = ("id", "name", "driver", "scope", "labels")
+
+    KEYS = {
+        "Id": "id", "id": "id",
+        "Name": "name", "name": "name",
+        "Driver": "driver", "driver": "driver",
+        "Scope": "scope", "scope": "scope",
+    }
+
+    def __init__(self, id: str, name: str, driver: str, scope: str, labels: Any = ()):
+        set_field = object.__setattr__
+        set_field(self, "id", id)
+        set_field(self, "name", name)
+        set_field(self, "driver", _intern(driver))
+        set_field(self, "scope", _intern(scope))
+        set_field(self, "labels", _labels(labels))
+
+
+class VolumeRecord(Record):
+    """Volume projected from a /volumes summary"""
+
+    __slots__ = ("name", "driver", "mountpoint", "labels")
+
+    KEYS = {
+        "Name": "name", "name": "name",
+        "Driver": "driver", "driver": "driver",
+        "Mountpoint": "mountpoint", "mountpoint": "mountpoint",
+    }
+
+    def __init__(self, name: str, driver: str, mountpoint: str, labels: Any = ()):
+        set_field = object.__setattr__
+        set_field(self, "name", name)
+        set_field(self, "driver", _intern(driver))
+        set_field(self, "mountpoint", mountpoint)
+        set_field(self, "labels", _labels(labels))
@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
 import sys
 import os
-import threading
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib, Gio
+from gi.repository import Gtk, GLib, Gio, Gdk
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from docker_api import DockerAPI
+from core.cache_policy import CachePolicy
+from core.relation_graph import RelationGraph
+from core.scheduler import Priority, scheduler
 from services.docker_service import DockerService
 from services.notification_service import NotificationService
 from services.memory_service import memory_service
+from services.refresh_scheduler import RefreshScheduler
+from services.prefetch_service import PrefetchService
 from resources import ContainerManager, ImageManager, NetworkManager, VolumeManager
 from ui.themes.theme_manager import ThemeManager
 from ui.components.dashboard import Dashboard
@@ -39,6 +43,18 @@ class DockerGUIApp(Gtk.Application):
         self.network_manager = None
         self.volume_manager = None
         
+        # Containers using each image, volume and network
+        self.relation_graph = None
+        
+        # Adaptive polling of the managers not covered by the event stream
+        self.refresh_scheduler = None
+        
+        # Idle-time warming of the sections likely to be opened next
+        self.prefetch_service = None
+        
+        # Pending live refreshes by resource kind (GLib source IDs)
+        self._live_refresh_sources = {}
+        
         # UI components
         self.dashboard = None
         self.status_bar = None
@@ -111,29 +127,69 @@ class DockerGUIApp(Gtk.Application):
         
         try:
             # Initialize Docker API with optimized settings
-            self.docker_api = DockerAPI(max_workers=4)
+            self.docker_api = DockerAPI(max_workers=scheduler.max_workers, executor=scheduler)
             
             # Initialize services
             self.docker_service = DockerService(self.docker_api)
             self.notification_service = NotificationService()
             
+            # Stale listings render at once and are revalidated in the background;
+            # only listings older than max_staleness wait for the daemon
+            cache_policies = {
+                "containers": CachePolicy(revalidate_interval=15, max_staleness=300),
+                "images": CachePolicy(revalidate_interval=60, max_staleness=1800),
+                "networks": CachePolicy(revalidate_interval=120, max_staleness=3600),
+                "volumes": CachePolicy(revalidate_interval=120, max_staleness=3600),
+            }
+            for kind, cache_policy in cache_policies.items():
+                self.docker_service.set_cache_policy(kind, cache_policy)
+            
             # Initialize resource managers with optimized cache settings
             self.container_manager = ContainerManager(
-                self.docker_service, self.notification_service, cache_ttl=15
+                self.docker_service, self.notification_service,
+                cache_policy=cache_policies["containers"]
             )
             self.image_manager = ImageManager(
-                self.docker_service, self.notification_service, cache_ttl=60
+                self.docker_service, self.notification_service,
+                cache_policy=cache_policies["images"]
             )
             self.network_manager = NetworkManager(
-                self.docker_service, self.notification_service, cache_ttl=120
+                self.docker_service, self.notification_service,
+                cache_policy=cache_policies["networks"]
             )
             self.volume_manager = VolumeManager(
-                self.docker_service, self.notification_service, cache_ttl=120
+                self.docker_service, self.notification_service,
+                cache_policy=cache_policies["volumes"]
             )
             
+            self.relation_graph = RelationGraph(self.container_manager, {
+                "images": self.image_manager,
+                "volumes": self.volume_manager,
+                "networks": self.network_manager,
+            })
+            
             # Setup callbacks for resource managers
             self._setup_resource_callbacks()
             
+            # The cache policies above are starting intervals: polling adapts
+            # them to how often each resource type changes and to visibility
+            self.refresh_scheduler = RefreshScheduler(
+                is_live=self.docker_service.is_live,
+                clear_cache=self.docker_service.clear_cache
+            )
+            for kind, cache_policy in cache_policies.items():
+                self.refresh_scheduler.register(kind, self._get_manager(kind), cache_policy)
+            self.refresh_scheduler.set_visible(cache_policies)  # The dashboard shows every type
+            
+            self.prefetch_service = PrefetchService(
+                {kind: self._get_manager(kind) for kind in cache_policies}
+            )
+            self.prefetch_service.record_navigation(self.current_section)
+            
+            # Keep data current from the Docker event stream
+            self.docker_service.add_callback(self._on_docker_service_event)
+            self.docker_service.enable_live_updates()
+            
             # Initialize theme manager (will be done after window creation)
             self.theme_manager = None
             
@@ -151,6 +207,50 @@ class DockerGUIApp(Gtk.Application):
         self.network_manager.add_callback(self._on_network_event)
         self.volume_manager.add_callback(self._on_volume_event)
     
+    def _on_docker_service_event(self, event_type: str, data=None):
+        """Handler for Docker service events."""
+        if event_type.endswith("_changed"):
+            self._schedule_live_refresh(event_type[:-len("_changed")])
+        elif event_type.endswith("_refreshed") and event_type != "all_data_refreshed":
+            manager = self._get_manager(event_type[:-len("_refreshed")])
+            if manager is not None:
+                manager.refresh(force=True)
+        elif event_type.endswith("_revalidated"):
+            # The manager loaded the stale listing; reload it without a spinner
+            manager = self._get_manager(event_type[:-len("_revalidated")])
+            if manager is not None:
+                manager.invalidate_cache()
+                manager.refresh()
+        elif event_type == "all_data_refreshed":
+            refresh_time = performance_monitor.end_timer("refresh_all_data")
+            print(f"Время обновления всех данных: {refresh_time:.2f} мс")
+        elif event_type == "refresh_error":
+            self._show_error(f"Ошибка обновления: {data}")
+    
+    def _get_manager(self, kind: str):
+        """Get the resource manager for a resource kind."""
+        return {
+            "containers": self.container_manager,
+            "images": self.image_manager,
+            "networks": self.network_manager,
+            "volumes": self.volume_manager,
+        }.get(kind)
+    
+    def _schedule_live_refresh(self, kind: str):
+        """Coalesce a burst of events into one manager refresh per kind."""
+        if kind in self._live_refresh_sources:
+            return
+        self._live_refresh_sources[kind] = GLib.timeout_add(100, self._perform_live_refresh, kind)
+    
+    def _perform_live_refresh(self, kind: str):
+        """Refresh a manager from the live state store."""
+        self._live_refresh_sources.pop(kind, None)
+        manager = self._get_manager(kind)
+        # A forced refresh waits for a load that starts after this event
+        if manager is not None:
+            manager.refresh(force=True)
+        return False
+    
     def _on_container_event(self, event_type: str, data=None):
         """Handler for container events."""
         if event_type == "updated":
@@ -188,6 +288,10 @@ class DockerGUIApp(Gtk.Application):
         self.window.set_default_size(1200, 800)
         self.window.set_resizable(True)
         
+        # No polling while the window is unfocused or minimized
+        self.window.connect("notify::is-active", self._on_window_state_changed)
+        self.window.connect("realize", self._on_window_realized)
+        
         # Setup actions
         self._setup_actions()
         
@@ -334,26 +438,47 @@ class DockerGUIApp(Gtk.Application):
         containers_button = Gtk.Button(label="Containers")
         containers_button.add_css_class("nav-button")
         containers_button.connect("clicked", self._on_navigation_clicked, "containers")
+        self._track_navigation_hover(containers_button, "containers")
         parent.append(containers_button)
         
         # Images button
         images_button = Gtk.Button(label="Images")
         images_button.add_css_class("nav-button")
         images_button.connect("clicked", self._on_navigation_clicked, "images")
+        self._track_navigation_hover(images_button, "images")
         parent.append(images_button)
         
         # Networks button
         networks_button = Gtk.Button(label="Networks")
         networks_button.add_css_class("nav-button")
         networks_button.connect("clicked", self._on_navigation_clicked, "networks")
+        self._track_navigation_hover(networks_button, "networks")
         parent.append(networks_button)
         
         # Volumes button
         volumes_button = Gtk.Button(label="Volumes")
         volumes_button.add_css_class("nav-button")
         volumes_button.connect("clicked", self._on_navigation_clicked, "volumes")
+        self._track_navigation_hover(volumes_button, "volumes")
         parent.append(volumes_button)
     
+    def _track_navigation_hover(self, button, section):
+        """Let the prefetcher warm a section while the pointer is over its button."""
+        motion = Gtk.EventControllerMotion()
+        motion.connect("enter", self._on_navigation_hover, section)
+        motion.connect("leave", self._on_navigation_unhover, section)
+        button.add_controller(motion)
+    
+    def _on_navigation_hover(self, controller, x, y, section):
+        """Handler for the pointer entering a navigation button."""
+        if self.prefetch_service:
+            self.prefetch_service.hover(section)
+    
+    def _on_navigation_unhover(self, controller, section):
+        """Handler for the pointer leaving a navigation button."""
+        if self.prefetch_service:
+            self.prefetch_service.unhover(section)
+    
     def _create_dashboard(self):
         """Create the dashboard."""
         def navigation_callback(section):
@@ -413,30 +538,14 @@ class DockerGUIApp(Gtk.Application):
             except Exception as e:
                 GLib.idle_add(self._show_error, f"Ошибка загрузки данных: {str(e)}")
         
-        # Run in a separate thread
-        import threading
-        thread = threading.Thread(target=_load, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _load)
     
     def _refresh_all_data(self):
         """Update all data."""
         performance_monitor.start_timer("refresh_all_data")
         
-        def _refresh():
-            try:
-                self.container_manager.refresh(force=True)
-                self.image_manager.refresh(force=True)
-                self.network_manager.refresh(force=True)
-                self.volume_manager.refresh(force=True)
-                
-                refresh_time = performance_monitor.end_timer("refresh_all_data")
-                print(f"Время обновления всех данных: {refresh_time:.2f} мс")
-                
-            except Exception as e:
-                GLib.idle_add(self._show_error, f"Ошибка обновления: {str(e)}")
-        
-        thread = threading.Thread(target=_refresh, daemon=True)
-        thread.start()
+        # The four listings run concurrently; sections update as each arrives
+        self.docker_service.refresh_all_data()
     
     def _update_status(self):
         """Update the connection status."""
@@ -453,6 +562,11 @@ class DockerGUIApp(Gtk.Application):
         """Handler for navigation click."""
         self.current_section = section
         self.content_stack.set_visible_child_name(section)
+        self._set_visible_section(section)
+        
+        # Drop the pending prefetch before the section's own load is queued
+        if self.prefetch_service:
+            self.prefetch_service.record_navigation(section)
         
         # Update data for the selected section
         if section == "containers":
@@ -464,6 +578,38 @@ class DockerGUIApp(Gtk.Application):
         elif section == "volumes":
             self.volume_manager.refresh()
     
+    def _set_visible_section(self, section: str):
+        """Serve the visible section's loads before the hidden ones."""
+        self.container_manager.set_visible(section == "containers")
+        self.image_manager.set_visible(section == "images")
+        self.network_manager.set_visible(section == "networks")
+        self.volume_manager.set_visible(section == "volumes")
+        
+        if self.refresh_scheduler:
+            if section == "dashboard":
+                self.refresh_scheduler.set_visible(("containers", "images", "networks", "volumes"))
+            else:
+                self.refresh_scheduler.set_visible((section,))
+    
+    def _on_window_realized(self, window):
+        """Follow the minimized state of the window surface."""
+        surface = window.get_surface()
+        if surface is not None:
+            surface.connect("notify::state", self._on_window_state_changed)
+    
+    def _on_window_state_changed(self, *args):
+        """Pause polling and prefetch while the window is unfocused or minimized."""
+        if not self.refresh_scheduler:
+            return
+        surface = self.window.get_surface()
+        minimized = surface is not None and bool(surface.get_state() & Gdk.ToplevelState.MINIMIZED)
+        if self.window.is_active() and not minimized:
+            self.refresh_scheduler.resume()
+            self.prefetch_service.resume()
+        else:
+            self.refresh_scheduler.pause()
+            self.prefetch_service.pause()
+    
     def _on_containers_updated(self):
         """Handler for container updates."""
         self._update_containers_view()
@@ -556,8 +702,7 @@ class DockerGUIApp(Gtk.Application):
                 GLib.idle_add(self._hide_loading)
                 GLib.idle_add(self._show_error, f"Ошибка очистки: {str(e)}")
         
-        thread = threading.Thread(target=_prune, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _prune)
     
     def _on_about(self, action, param):
         """Show application information."""
@@ -650,6 +795,16 @@ class DockerGUIApp(Gtk.Application):
     def do_shutdown(self):
         """Shutdown the application."""
         print("Завершение работы приложения...")
+        
+        if self.refresh_scheduler:
+            self.refresh_scheduler.pause()
+        if self.prefetch_service:
+            self.prefetch_service.pause()
+        if self.docker_service:
+            self.docker_service.disable_live_updates()
+        
+        scheduler_metrics = scheduler.get_metrics()
+        scheduler.shutdown(wait=False, cancel_futures=True)
 
         memory_service.stop_memory_monitoring()
         
@@ -666,6 +821,12 @@ class DockerGUIApp(Gtk.Application):
         print("Метрики производительности:")
         for metric, data in final_perf_stats.items():
             print(f"  {metric}: {data['average']:.1f} мс (среднее)")
+        print("Планировщик задач:")
+        for lane, data in scheduler_metrics['lanes'].items():
+            print(
+                f"  {lane}: {data['completed']} задач, ожидание {data['average_wait']:.1f} мс (среднее), "
+                f"макс. очередь {data['max_queue_depth']}"
+            )
         
         try:
             # Try to call the parent method
@@ -1,35 +1,82 @@
-import threading
-from typing import List, Dict, Any, Optional, Callable
+from collections import ChainMap
+from typing import List, Dict, Any, Mapping, Optional, Callable, Tuple
 from gi.repository import GLib
 
 from core.resource_manager import ResourceManager
+from core.cache_policy import CachePolicy
+from core.query import CONTAINER_STATES, QueryField, label_field
+from core.relation_graph import get_image_edges, get_network_edges, get_volume_edges
+from core.sorting import text_key
 from core.base_operations import BaseOperations
+from core.scheduler import Priority, scheduler
 
 
 class ContainerManager(ResourceManager):
-    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 15):
-        super().__init__(docker_api, cache_ttl)
+    INDEXES = {
+        'status': lambda container: container.get('State', '').lower(),
+        'image': lambda container: container.get('Image', ''),
+        'label': ResourceManager._get_label_keys,
+        # Edges of the relation graph to images, volumes and networks
+        'image_id': get_image_edges,
+        'volume': get_volume_edges,
+        'network': get_network_edges,
+    }
+    
+    # States removed by a container prune
+    PRUNABLE_STATES = ('exited', 'created', 'dead')
+    
+    QUERY_FIELDS = {
+        'status': QueryField(lambda container: container.get('State', ''),
+                             daemon_filter='status', daemon_values=CONTAINER_STATES),
+        # The daemon's ancestor filter also matches child images, and fails on unknown ones
+        'image': QueryField(lambda container: container.get('Image', '')),
+        'name': QueryField(lambda container: container.get('Names', []), daemon_filter='name'),
+        'label': label_field(),
+    }
+    
+    SORT_KEYS = {
+        'name': text_key(lambda container: (container.get('Names') or [''])[0]),
+        'image': text_key(lambda container: container.get('Image')),
+        'status': text_key(lambda container: container.get('Status')),
+        'ports': text_key(lambda container: container.get('ports')),
+    }
+    
+    # Status shown as soon as a lifecycle action is requested
+    EXPECTED_STATUS = {
+        'start': 'running',
+        'stop': 'exited',
+        'restart': 'running',
+    }
+    
+    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 15,
+                 cache_policy: Optional[CachePolicy] = None):
+        super().__init__(docker_api, cache_ttl, cache_policy)
         self.notification_service = notification_service
         self.resource_type = "containers"
-        self.containers = []
-        self.filtered_containers = []
         
-    def _load_resources(self):
-        self.containers = self.docker_api.get_containers()
-        self.resources = self.containers  # Synchronize with the base class
-        self.filtered_containers = self.containers.copy()
-        self.filtered_resources = self.filtered_containers  # Synchronize with the base class
+    def _load_resources(self) -> List[Dict[str, Any]]:
+        return self.docker_api.get_containers()
+    
+    @property
+    def containers(self) -> Tuple[Dict[str, Any], ...]:
+        """All containers of the current snapshot."""
+        return self.resources
+    
+    @property
+    def filtered_containers(self) -> Tuple[Dict[str, Any], ...]:
+        """Filtered containers of the current snapshot."""
+        return self.filtered_resources
     
     def _get_resource_id(self, resource: Dict[str, Any]) -> str:
         return resource.get('Id', '')
     
-    def _resource_matches_search(self, resource: Dict[str, Any], query: str) -> bool:
-        query = query.lower()
+    def _get_search_fields(self, resource: Dict[str, Any]) -> tuple:
+        """Get the container fields matched by the search."""
         return (
-            query in resource.get('Names', [''])[0].lower() or
-            query in resource.get('Image', '').lower() or
-            query in resource.get('Status', '').lower() or
-            query in resource.get('Id', '')[:12].lower()
+            resource.get('Names', []),
+            resource.get('Image', ''),
+            resource.get('Status', ''),
+            resource.get('Id', '')[:12]
         )
     
     def _resource_matches_filters(self, resource: Dict[str, Any], filters: Dict[str, Any]) -> bool:
@@ -51,18 +98,6 @@ class ContainerManager(ResourceManager):
         """Perform container deletion."""
         self.docker_api.delete_container(resource_id, force=True)
     
-    def refresh(self, callback: Optional[Callable] = None, force: bool = False):
-        """Refresh container data.
-
-        Args:
-            callback: Callback function to notify upon completion
-            force: Force refresh, ignoring the cache
-        """
-        if callback:
-            self.add_callback(lambda event_type, data: callback() if event_type == 'loading_complete' else None)
-        
-        super().refresh(force=force)
-    
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Search containers by query.
         
@@ -107,20 +142,10 @@ class ContainerManager(ResourceManager):
             container_id: Container ID
             callback: Callback function
         """
-        def _start():
-            try:
-                self.docker_api.start_container(container_id)
-                if self.notification_service:
-                    self.notification_service.show_success("Контейнер запущен")
-                self.invalidate_cache()  # Invalidate the cache after the change
-                GLib.idle_add(self._on_operation_complete, 'start', container_id, callback)
-            except Exception as e:
-                if self.notification_service:
-                    self.notification_service.show_error(f"Ошибка запуска контейнера: {str(e)}")
-                GLib.idle_add(self._on_operation_error, 'start', container_id, str(e), callback)
-        
-        thread = threading.Thread(target=_start, daemon=True)
-        thread.start()
+        self._run_operation(
+            'start', container_id, lambda: self.docker_api.start_container(container_id),
+            "Контейнер запущен", "Ошибка запуска контейнера", callback
+        )
     
     def stop_container(self, container_id: str, callback: Optional[Callable] = None):
         """
@@ -130,20 +155,10 @@ class ContainerManager(ResourceManager):
             container_id: Container ID
             callback: Callback function
         """
-        def _stop():
-            try:
-                self.docker_api.stop_container(container_id)
-                if self.notification_service:
-                    self.notification_service.show_success("Контейнер остановлен")
-                self.invalidate_cache()  # Invalidate the cache after the change
-                GLib.idle_add(self._on_operation_complete, 'stop', container_id, callback)
-            except Exception as e:
-                if self.notification_service:
-                    self.notification_service.show_error(f"Ошибка остановки контейнера: {str(e)}")
-                GLib.idle_add(self._on_operation_error, 'stop', container_id, str(e), callback)
-        
-        thread = threading.Thread(target=_stop, daemon=True)
-        thread.start()
+        self._run_operation(
+            'stop', container_id, lambda: self.docker_api.stop_container(container_id),
+            "Контейнер остановлен", "Ошибка остановки контейнера", callback
+        )
     
     def restart_container(self, container_id: str, callback: Optional[Callable] = None):
         """
@@ -153,20 +168,10 @@ class ContainerManager(ResourceManager):
             container_id: Container ID
             callback: Callback function
         """
-        def _restart():
-            try:
-                self.docker_api.restart_container(container_id)
-                if self.notification_service:
-                    self.notification_service.show_success("Контейнер перезапущен")
-                self.invalidate_cache()  # Invalidate the cache after the change
-                GLib.idle_add(self._on_operation_complete, 'restart', container_id, callback)
-            except Exception as e:
-                if self.notification_service:
-                    self.notification_service.show_error(f"Ошибка перезапуска контейнера: {str(e)}")
-                GLib.idle_add(self._on_operation_error, 'restart', container_id, str(e), callback)
-        
-        thread = threading.Thread(target=_restart, daemon=True)
-        thread.start()
+        self._run_operation(
+            'restart', container_id, lambda: self.docker_api.restart_container(container_id),
+            "Контейнер перезапущен", "Ошибка перезапуска контейнера", callback
+        )
     
     def delete_container(self, container_id: str, force: bool = False, callback: Optional[Callable] = None):
         """
@@ -177,29 +182,87 @@ class ContainerManager(ResourceManager):
             force: Force deletion
             callback: Callback function
         """
-        def _delete():
+        self._run_operation(
+            'delete', container_id, lambda: self.docker_api.delete_container(container_id, force=force),
+            "Контейнер удален", "Ошибка удаления контейнера", callback
+        )
+    
+    def _run_operation(self, operation: str, container_id: str, perform: Callable[[], Any],
+                       success_message: str, error_message: str, callback: Optional[Callable]):
+        """
+        Run a lifecycle action with an optimistic local update.
+        
+        The expected state is shown at once. Once the daemon has applied the
+        action, the container is reconciled from a single-container lookup
+        (or from its event, with live updates); if the action fails, the
+        previous state is restored. Nothing is re-listed.
+        
+        Args:
+            operation: 'start', 'stop', 'restart' or 'delete'
+            container_id: Container ID
+            perform: Function running the action; returns the container as
+                listed afterwards (None if gone or left to the event stream)
+            success_message: Notification on success
+            error_message: Notification prefix on failure
+            callback: Callback function
+        """
+        previous = self.get_resource(container_id)
+        expected = self._get_expected_state(operation, previous)
+        if previous is not None:
+            self.apply_local_change(container_id, expected)
+        
+        def _run():
             try:
-                self.docker_api.delete_container(container_id, force=force)
+                container = perform()
                 if self.notification_service:
-                    self.notification_service.show_success("Контейнер удален")
-                self.invalidate_cache()  # Invalidate the cache after the change
-                GLib.idle_add(self._on_operation_complete, 'delete', container_id, callback)
+                    self.notification_service.show_success(success_message)
+                GLib.idle_add(self._on_operation_complete, operation, container_id, container, callback)
             except Exception as e:
                 if self.notification_service:
-                    self.notification_service.show_error(f"Ошибка удаления контейнера: {str(e)}")
-                GLib.idle_add(self._on_operation_error, 'delete', container_id, str(e), callback)
+                    self.notification_service.show_error(f"{error_message}: {str(e)}")
+                GLib.idle_add(self._on_operation_error, operation, container_id, str(e), callback,
+                              previous, expected)
         
-        thread = threading.Thread(target=_delete, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _run)
+    
+    def _get_expected_state(self, operation: str, container: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        """
+        Get the state a container should reach after an action.
+        
+        Args:
+            operation: 'start', 'stop', 'restart' or 'delete'
+            container: Current state (None if unknown)
+            
+        Returns:
+            Expected state, or None for a deleted or unknown container
+        """
+        status = self.EXPECTED_STATUS.get(operation)
+        if container is None or status is None:
+            return None
+        if hasattr(container, 'replace'):
+            return container.replace(status=status)
+        return {**container, 'State': status, 'Status': status}
     
-    def _on_operation_complete(self, operation: str, container_id: str, callback: Optional[Callable]):
-        """Handler for the completion of the operation."""
+    def _on_operation_complete(self, operation: str, container_id: str,
+                               container: Optional[Mapping[str, Any]], callback: Optional[Callable]):
+        """Handler for the completion of the operation: apply the confirmed state."""
+        # With live updates the daemon event re-reads the container
+        if operation != 'delete' and not self._is_live():
+            if container is None:
+                # The action succeeded but the container could not be re-read
+                self.refresh(force=True)
+            else:
+                self.apply_local_change(container_id, container)
         if callback:
             callback()
-        self.refresh(force=True)  # Force update after the operation
     
-    def _on_operation_error(self, operation: str, container_id: str, error: str, callback: Optional[Callable]):
-        """Handler for the error of the operation."""
+    def _on_operation_error(self, operation: str, container_id: str, error: str, callback: Optional[Callable],
+                            previous: Optional[Mapping[str, Any]] = None,
+                            expected: Optional[Mapping[str, Any]] = None):
+        """Handler for the error of the operation: roll back the optimistic state."""
+        # Unless a refresh has replaced the optimistic state meanwhile
+        if previous is not None and self.get_resource(container_id) is expected:
+            self.apply_local_change(container_id, previous)
         if callback:
             callback()
         print(f"Error in {operation} operation for container {container_id}: {error}")
@@ -237,7 +300,7 @@ class ContainerManager(ResourceManager):
             print(f"Error getting container stats: {e}")
             return {}
     
-    def format_container_data(self, container: Dict[str, Any]) -> Dict[str, Any]:
+    def format_container_data(self, container: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Format container data for display.
         
@@ -247,7 +310,8 @@ class ContainerManager(ResourceManager):
         Returns:
             Formatted container data
         """
-        formatted = container.copy()
+        # Display fields layered over the record instead of copying it
+        formatted = ChainMap({}, container)
         
         # Format the name
         names = container.get('Names', [])
@@ -282,7 +346,7 @@ class ContainerManager(ResourceManager):
         
         return formatted
     
-    def get_all_containers_formatted(self) -> List[Dict[str, Any]]:
+    def get_all_containers_formatted(self) -> List[Mapping[str, Any]]:
         """
         Get all containers in formatted view.
         
@@ -298,7 +362,7 @@ class ContainerManager(ResourceManager):
         Returns:
             Number of running containers
         """
-        return len([c for c in self.resources if 'Up' in c.get('Status', '')])
+        return self.count_indexed_resources('status', 'running')
     
     def get_stopped_containers_count(self) -> int:
         """
@@ -307,7 +371,16 @@ class ContainerManager(ResourceManager):
         Returns:
             Number of stopped containers
         """
-        return len([c for c in self.resources if 'Exited' in c.get('Status', '')])
+        return self.count_indexed_resources('status', 'exited')
+    
+    def get_prunable_containers_count(self) -> int:
+        """
+        Get the number of containers a prune would remove.
+        
+        Returns:
+            Number of stopped containers
+        """
+        return sum(self.count_indexed_resources('status', state) for state in self.PRUNABLE_STATES)
     
     def get_total_containers_count(self) -> int:
         """
@@ -317,3 +390,15 @@ class ContainerManager(ResourceManager):
             Total number of containers
         """
         return len(self.resources)
+    
+    def get_containers_by_image(self, image: str) -> List[Dict[str, Any]]:
+        """
+        Get containers created from an image.
+        
+        Args:
+            image: Image name as listed by Docker
+            
+        Returns:
+            List of containers
+        """
+        return self.get_indexed_resources('image', image)
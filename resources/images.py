@@ -1,37 +1,77 @@
-import threading
-from typing import List, Dict, Any, Optional, Callable
+from collections import ChainMap
+from typing import List, Dict, Any, Mapping, Optional, Callable, Tuple
 from gi.repository import GLib
 
 from core.resource_manager import ResourceManager
+from core.cache_policy import CachePolicy
+from core.query import QueryField, label_field
+from core.sorting import number_key, text_key
 from core.base_operations import BaseOperations
+from core.scheduler import Priority, scheduler
+
+
+def _is_dangling(image: Mapping[str, Any]) -> bool:
+    """Check if an image has no repository tags."""
+    return all(tag in ('<none>', '<none>:<none>') for tag in image.get('RepoTags') or ())
 
 
 class ImageManager(ResourceManager):
-    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 60):
-        super().__init__(docker_api, cache_ttl)
+    INDEXES = {
+        'repository': lambda image: image.get('Repository', ''),
+        'dangling': _is_dangling,
+        'label': ResourceManager._get_label_keys,
+    }
+    
+    QUERY_FIELDS = {
+        'repository': QueryField(lambda image: image.get('Repository', '')),
+        'tag': QueryField(lambda image: image.get('Tag', '')),
+        'dangling': QueryField(_is_dangling, QueryField.BOOL, daemon_filter='dangling'),
+        'label': label_field(),
+    }
+    
+    SORT_KEYS = {
+        'repository': text_key(lambda image: image.get('Repository')),
+        'tag': text_key(lambda image: image.get('Tag')),
+        'id': text_key(lambda image: image.get('Id')),
+        'size': number_key(lambda image: image.get('Size')),
+        # ISO 8601 timestamps order chronologically as text
+        'created': text_key(lambda image: image.get('Created')),
+    }
+    
+    TOTALS = {
+        'size': lambda image: image.get('Size', 0),
+    }
+    
+    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 60,
+                 cache_policy: Optional[CachePolicy] = None):
+        super().__init__(docker_api, cache_ttl, cache_policy)
         self.notification_service = notification_service
         self.resource_type = "images"
-        self.images = []
-        self.filtered_images = []
         
-    def _load_resources(self):
+    def _load_resources(self) -> List[Dict[str, Any]]:
         """Load images from the Docker API."""
-        self.images = self.docker_api.get_images()
-        self.resources = self.images  # Synchronize with the base class
-        self.filtered_images = self.images.copy()
-        self.filtered_resources = self.filtered_images  # Synchronize with the base class
+        return self.docker_api.get_images()
+    
+    @property
+    def images(self) -> Tuple[Dict[str, Any], ...]:
+        """All images of the current snapshot."""
+        return self.resources
+    
+    @property
+    def filtered_images(self) -> Tuple[Dict[str, Any], ...]:
+        """Filtered images of the current snapshot."""
+        return self.filtered_resources
     
     def _get_resource_id(self, resource: Dict[str, Any]) -> str:
         """Get the ID of the image."""
         return resource.get('Id', '')
     
-    def _resource_matches_search(self, resource: Dict[str, Any], query: str) -> bool:
-        """Check if the image matches the search query."""
-        query = query.lower()
+    def _get_search_fields(self, resource: Dict[str, Any]) -> tuple:
+        """Get the image fields matched by the search."""
         return (
-            query in resource.get('RepoTags', [''])[0].lower() if resource.get('RepoTags') else False or
-            query in resource.get('Id', '')[:12].lower() or
-            query in str(resource.get('Size', '')).lower()
+            resource.get('RepoTags', []),
+            resource.get('Id', '')[:12],
+            resource.get('Size', '')
         )
     
     def _resource_matches_filters(self, resource: Dict[str, Any], filters: Dict[str, Any]) -> bool:
@@ -55,18 +95,6 @@ class ImageManager(ResourceManager):
         """Perform image deletion."""
         self.docker_api.delete_image(resource_id, force=True)
     
-    def refresh(self, callback: Optional[Callable] = None, force: bool = False):
-        """Refresh image data.
-        
-        Args:
-            callback: Callback function to notify upon completion
-            force: Force refresh, ignoring the cache
-        """
-        if callback:
-            self.add_callback(lambda event_type, data: callback() if event_type == 'loading_complete' else None)
-        
-        super().refresh(force=force)
-    
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Search images by query.
         
@@ -124,8 +152,7 @@ class ImageManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка удаления образа: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'delete', image_id, str(e), callback)
         
-        thread = threading.Thread(target=_delete, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _delete)
     
     def pull_image(self, image_name: str, callback: Optional[Callable] = None):
         """
@@ -147,8 +174,7 @@ class ImageManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка загрузки образа: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'pull', image_name, str(e), callback)
         
-        thread = threading.Thread(target=_pull, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _pull)
     
     def build_image(self, dockerfile_path: str, tag: str, callback: Optional[Callable] = None):
         """
@@ -171,8 +197,7 @@ class ImageManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка сборки образа: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'build', tag, str(e), callback)
         
-        thread = threading.Thread(target=_build, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _build)
     
     def tag_image(self, image_id: str, repository: str, tag: str, callback: Optional[Callable] = None):
         """
@@ -196,8 +221,7 @@ class ImageManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка тегирования образа: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'tag', f"{repository}:{tag}", str(e), callback)
         
-        thread = threading.Thread(target=_tag, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _tag)
     
     def _on_operation_complete(self, operation: str, image_id: str, callback: Optional[Callable]):
         """Handler for the completion of the operation."""
@@ -211,7 +235,7 @@ class ImageManager(ResourceManager):
             callback()
         print(f"Error in {operation} operation for image {image_id}: {error}")
     
-    def format_image_data(self, image: Dict[str, Any]) -> Dict[str, Any]:
+    def format_image_data(self, image: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Format image data for display.
         
@@ -221,7 +245,8 @@ class ImageManager(ResourceManager):
         Returns:
             Formatted image data
         """
-        formatted = image.copy()
+        # Display fields layered over the record instead of copying it
+        formatted = ChainMap({}, image)
         
         # Format the tags
         repo_tags = image.get('RepoTags', [])
@@ -246,9 +271,14 @@ class ImageManager(ResourceManager):
         # Number of layers
         formatted['layers_count'] = len(image.get('Layers', []))
         
+        # Containers created from the image
+        users = self.count_users(image.get('Id', ''))
+        formatted['in_use'] = users > 0
+        formatted['usage_display'] = f"Используется ({users})" if users else "Не используется"
+        
         return formatted
     
-    def get_all_images_formatted(self) -> List[Dict[str, Any]]:
+    def get_all_images_formatted(self) -> List[Mapping[str, Any]]:
         """
         Get all images in formatted view.
         
@@ -273,7 +303,31 @@ class ImageManager(ResourceManager):
         Returns:
             Number of dangling images
         """
-        return len([img for img in self.resources if not img.get('RepoTags')])
+        return self.count_indexed_resources('dangling', True)
+    
+    def get_unused_images_count(self) -> int:
+        """
+        Get the number of images no container uses.
+        
+        Returns:
+            Number of unused images (0 without a relation graph)
+        """
+        if self.relations is None:
+            return 0
+        return len(self.resources) - self.relations.count_used(self.resource_type)
+    
+    def get_prunable_images_count(self) -> int:
+        """
+        Get the number of images a prune would remove (dangling and unused).
+        
+        Returns:
+            Number of prunable images (0 without a relation graph)
+        """
+        if self.relations is None:
+            return 0
+        with self._index_lock:
+            dangling = list(self._indexes['dangling'].get(True, {}))
+        return sum(1 for image_id in dangling if not self.is_used(image_id))
     
     def get_total_size(self) -> int:
         """
@@ -282,4 +336,4 @@ class ImageManager(ResourceManager):
         Returns:
             Total size in bytes
         """
-        return sum(img.get('Size', 0) for img in self.resources)
+        return self.get_total('size')
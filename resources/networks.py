@@ -1,38 +1,71 @@
-import threading
-from typing import List, Dict, Any, Optional, Callable
+from collections import ChainMap
+from typing import List, Dict, Any, Mapping, Optional, Callable, Tuple
 from gi.repository import GLib
 
 from core.resource_manager import ResourceManager
+from core.cache_policy import CachePolicy
+from core.query import QueryField, label_field
+from core.sorting import text_key
 from core.base_operations import BaseOperations
+from core.scheduler import Priority, scheduler
 
 
 class NetworkManager(ResourceManager):
-    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 120):
-        super().__init__(docker_api, cache_ttl)
+    # Networks Docker creates itself; a prune never removes them. The listing
+    # has no flag for them, so they are recognized by name
+    BUILTIN_NETWORKS = ('bridge', 'host', 'none')
+    
+    INDEXES = {
+        'driver': lambda network: network.get('Driver', ''),
+        'scope': lambda network: network.get('Scope', ''),
+        'builtin': lambda network: network.get('Name', '') in NetworkManager.BUILTIN_NETWORKS,
+        'label': ResourceManager._get_label_keys,
+    }
+    
+    QUERY_FIELDS = {
+        'name': QueryField(lambda network: network.get('Name', ''), daemon_filter='name'),
+        'driver': QueryField(lambda network: network.get('Driver', ''), daemon_filter='driver'),
+        'scope': QueryField(lambda network: network.get('Scope', ''), daemon_filter='scope'),
+        'label': label_field(),
+    }
+    
+    SORT_KEYS = {
+        'name': text_key(lambda network: network.get('Name')),
+        'driver': text_key(lambda network: network.get('Driver')),
+        'scope': text_key(lambda network: network.get('Scope')),
+    }
+    
+    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 120,
+                 cache_policy: Optional[CachePolicy] = None):
+        super().__init__(docker_api, cache_ttl, cache_policy)
         self.notification_service = notification_service
         self.resource_type = "networks"
-        self.networks = []
-        self.filtered_networks = []
         
-    def _load_resources(self):
+    def _load_resources(self) -> List[Dict[str, Any]]:
         """Load networks from the Docker API."""
-        self.networks = self.docker_api.get_networks()
-        self.resources = self.networks  # Synchronize with the base class
-        self.filtered_networks = self.networks.copy()
-        self.filtered_resources = self.filtered_networks  # Synchronize with the base class
+        return self.docker_api.get_networks()
+    
+    @property
+    def networks(self) -> Tuple[Dict[str, Any], ...]:
+        """All networks of the current snapshot."""
+        return self.resources
+    
+    @property
+    def filtered_networks(self) -> Tuple[Dict[str, Any], ...]:
+        """Filtered networks of the current snapshot."""
+        return self.filtered_resources
     
     def _get_resource_id(self, resource: Dict[str, Any]) -> str:
         """Get the ID of the network."""
         return resource.get('Id', '')
     
-    def _resource_matches_search(self, resource: Dict[str, Any], query: str) -> bool:
-        """Check if the network matches the search query."""
-        query = query.lower()
+    def _get_search_fields(self, resource: Dict[str, Any]) -> tuple:
+        """Get the network fields matched by the search."""
         return (
-            query in resource.get('Name', '').lower() or
-            query in resource.get('Driver', '').lower() or
-            query in resource.get('Scope', '').lower() or
-            query in resource.get('Id', '')[:12].lower()
+            resource.get('Name', ''),
+            resource.get('Driver', ''),
+            resource.get('Scope', ''),
+            resource.get('Id', '')[:12]
         )
     
     def _resource_matches_filters(self, resource: Dict[str, Any], filters: Dict[str, Any]) -> bool:
@@ -52,9 +85,10 @@ class NetworkManager(ResourceManager):
         # Filter by type
         if 'type' in filters and filters['type']:
             type_filter = filters['type'].lower()
-            if type_filter == 'builtin' and not resource.get('Internal', False):
+            builtin = resource.get('Name', '') in self.BUILTIN_NETWORKS
+            if type_filter == 'builtin' and not builtin:
                 return False
-            elif type_filter == 'custom' and resource.get('Internal', False):
+            elif type_filter == 'custom' and builtin:
                 return False
         
         return True
@@ -63,18 +97,6 @@ class NetworkManager(ResourceManager):
         """Perform network deletion."""
         self.docker_api.delete_network(resource_id)
     
-    def refresh(self, callback: Optional[Callable] = None, force: bool = False):
-        """Refresh network data.
-        
-        Args:
-            callback: Callback function to notify upon completion
-            force: Force refresh, ignoring the cache
-        """
-        if callback:
-            self.add_callback(lambda event_type, data: callback() if event_type == 'loading_complete' else None)
-        
-        super().refresh(force=force)
-    
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Search networks by query.
         
@@ -142,8 +164,7 @@ class NetworkManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка создания сети: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'create', name, str(e), callback)
         
-        thread = threading.Thread(target=_create, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _create)
     
     def delete_network(self, network_id: str, callback: Optional[Callable] = None):
         """
@@ -165,8 +186,7 @@ class NetworkManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка удаления сети: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'delete', network_id, str(e), callback)
         
-        thread = threading.Thread(target=_delete, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _delete)
     
     def connect_container(self, network_id: str, container_id: str, callback: Optional[Callable] = None):
         """
@@ -189,8 +209,7 @@ class NetworkManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка подключения контейнера: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'connect', f"{network_id}:{container_id}", str(e), callback)
         
-        thread = threading.Thread(target=_connect, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _connect)
     
     def disconnect_container(self, network_id: str, container_id: str, callback: Optional[Callable] = None):
         """
@@ -213,8 +232,7 @@ class NetworkManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка отключения контейнера: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'disconnect', f"{network_id}:{container_id}", str(e), callback)
         
-        thread = threading.Thread(target=_disconnect, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _disconnect)
     
     def _on_operation_complete(self, operation: str, network_id: str, callback: Optional[Callable]):
         """Handler for the completion of the operation."""
@@ -228,7 +246,7 @@ class NetworkManager(ResourceManager):
             callback()
         print(f"Error in {operation} operation for network {network_id}: {error}")
     
-    def format_network_data(self, network: Dict[str, Any]) -> Dict[str, Any]:
+    def format_network_data(self, network: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Format network data for display.
         
@@ -238,7 +256,8 @@ class NetworkManager(ResourceManager):
         Returns:
             Formatted network data
         """
-        formatted = network.copy()
+        # Display fields layered over the record instead of copying it
+        formatted = ChainMap({}, network)
         
         # Format the name
         formatted['display_name'] = network.get('Name', '')
@@ -272,10 +291,10 @@ class NetworkManager(ResourceManager):
         formatted['short_id'] = network.get('Id', '')[:12]
         
         # Type of network
-        if network.get('Internal', False):
-            formatted['type_display'] = 'Внутренняя'
+        if network.get('Name', '') in self.BUILTIN_NETWORKS:
+            formatted['type_display'] = 'Встроенная'
         else:
-            formatted['type_display'] = 'Внешняя'
+            formatted['type_display'] = 'Пользовательская'
         
         # Number of connected containers
         containers = network.get('Containers', {})
@@ -283,7 +302,7 @@ class NetworkManager(ResourceManager):
         
         return formatted
     
-    def get_all_networks_formatted(self) -> List[Dict[str, Any]]:
+    def get_all_networks_formatted(self) -> List[Mapping[str, Any]]:
         """
         Get all networks in formatted view.
         
@@ -308,7 +327,7 @@ class NetworkManager(ResourceManager):
         Returns:
             Number of built-in networks
         """
-        return len([net for net in self.resources if net.get('Internal', False)])
+        return self.count_indexed_resources('builtin', True)
     
     def get_custom_networks_count(self) -> int:
         """
@@ -317,7 +336,19 @@ class NetworkManager(ResourceManager):
         Returns:
             Number of custom networks
         """
-        return len([net for net in self.resources if not net.get('Internal', False)])
+        return self.count_indexed_resources('builtin', False)
+    
+    def get_prunable_networks_count(self) -> int:
+        """
+        Get the number of networks a prune would remove (custom and unused).
+        
+        Returns:
+            Number of prunable networks
+        """
+        return sum(
+            1 for network in self.get_unused_resources()
+            if network.get('Name', '') not in self.BUILTIN_NETWORKS
+        )
     
     def get_networks_by_driver(self, driver: str) -> List[Dict[str, Any]]:
         """
@@ -329,4 +360,4 @@ class NetworkManager(ResourceManager):
         Returns:
             List of networks with the specified driver
         """
-        return [net for net in self.resources if net.get('Driver', '') == driver]
+        return self.get_indexed_resources('driver', driver)
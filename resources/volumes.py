@@ -1,37 +1,67 @@
-import threading
-from typing import List, Dict, Any, Optional, Callable
+from collections import ChainMap
+from typing import List, Dict, Any, Mapping, Optional, Callable, Tuple
 from gi.repository import GLib
 
 from core.resource_manager import ResourceManager
+from core.cache_policy import CachePolicy
+from core.query import QueryField, label_field
+from core.sorting import text_key
 from core.base_operations import BaseOperations
+from core.scheduler import Priority, scheduler
 
 
 class VolumeManager(ResourceManager):
-    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 120):
-        super().__init__(docker_api, cache_ttl)
+    INDEXES = {
+        'driver': lambda volume: volume.get('Driver', ''),
+        'label': ResourceManager._get_label_keys,
+    }
+    
+    QUERY_FIELDS = {
+        'name': QueryField(lambda volume: volume.get('Name', ''), daemon_filter='name'),
+        'driver': QueryField(lambda volume: volume.get('Driver', ''), daemon_filter='driver'),
+        'label': label_field(),
+    }
+    
+    SORT_KEYS = {
+        'name': text_key(lambda volume: volume.get('Name')),
+        'driver': text_key(lambda volume: volume.get('Driver')),
+        'mountpoint': text_key(lambda volume: volume.get('Mountpoint')),
+    }
+    
+    TOTALS = {
+        'size': lambda volume: volume.get('UsageData', {}).get('Size', 0),
+    }
+    
+    def __init__(self, docker_api, notification_service=None, cache_ttl: int = 120,
+                 cache_policy: Optional[CachePolicy] = None):
+        super().__init__(docker_api, cache_ttl, cache_policy)
         self.notification_service = notification_service
         self.resource_type = "volumes"
-        self.volumes = []
-        self.filtered_volumes = []
         
-    def _load_resources(self):
+    def _load_resources(self) -> List[Dict[str, Any]]:
         """Load volumes from the Docker API."""
-        self.volumes = self.docker_api.get_volumes()
-        self.resources = self.volumes  # Synchronize with the base class
-        self.filtered_volumes = self.volumes.copy()
-        self.filtered_resources = self.filtered_volumes  # Synchronize with the base class
+        return self.docker_api.get_volumes()
+    
+    @property
+    def volumes(self) -> Tuple[Dict[str, Any], ...]:
+        """All volumes of the current snapshot."""
+        return self.resources
+    
+    @property
+    def filtered_volumes(self) -> Tuple[Dict[str, Any], ...]:
+        """Filtered volumes of the current snapshot."""
+        return self.filtered_resources
     
     def _get_resource_id(self, resource: Dict[str, Any]) -> str:
         """Get the ID of the volume."""
         return resource.get('Name', '')
     
-    def _resource_matches_search(self, resource: Dict[str, Any], query: str) -> bool:
-        """Check if the volume matches the search query."""
-        query = query.lower()
+    def _get_search_fields(self, resource: Dict[str, Any]) -> tuple:
+        """Get the volume fields matched by the search."""
         return (
-            query in resource.get('Name', '').lower() or
-            query in resource.get('Driver', '').lower() or
-            query in resource.get('Mountpoint', '').lower()
+            resource.get('Name', ''),
+            resource.get('Driver', ''),
+            resource.get('Mountpoint', '')
         )
     
     def _resource_matches_filters(self, resource: Dict[str, Any], filters: Dict[str, Any]) -> bool:
@@ -45,9 +75,10 @@ class VolumeManager(ResourceManager):
         # Filter by status
         if 'status' in filters and filters['status']:
             status_filter = filters['status'].lower()
-            if status_filter == 'used' and not resource.get('UsageData', {}).get('RefCount', 0):
+            used = self.is_used(resource.get('Name', ''))
+            if status_filter == 'used' and not used:
                 return False
-            elif status_filter == 'unused' and resource.get('UsageData', {}).get('RefCount', 0):
+            elif status_filter == 'unused' and used:
                 return False
         
         # Filter by type
@@ -64,18 +95,6 @@ class VolumeManager(ResourceManager):
         """Perform volume deletion."""
         self.docker_api.delete_volume(resource_id, force=True)
     
-    def refresh(self, callback: Optional[Callable] = None, force: bool = False):
-        """Refresh volume data.
-        
-        Args:
-            callback: Callback function to notify upon completion
-            force: Force refresh, ignoring the cache
-        """
-        if callback:
-            self.add_callback(lambda event_type, data: callback() if event_type == 'loading_complete' else None)
-        
-        super().refresh(force=force)
-    
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Search volumes by query.
         
@@ -141,8 +160,7 @@ class VolumeManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка создания тома: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'create', name, str(e), callback)
         
-        thread = threading.Thread(target=_create, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _create)
     
     def delete_volume(self, volume_name: str, force: bool = False, callback: Optional[Callable] = None):
         """
@@ -165,8 +183,7 @@ class VolumeManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка удаления тома: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'delete', volume_name, str(e), callback)
         
-        thread = threading.Thread(target=_delete, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _delete)
     
     def inspect_volume(self, volume_name: str) -> Dict[str, Any]:
         """
@@ -207,8 +224,7 @@ class VolumeManager(ResourceManager):
                     self.notification_service.show_error(f"Ошибка очистки томов: {str(e)}")
                 GLib.idle_add(self._on_operation_error, 'prune', 'volumes', str(e), callback)
         
-        thread = threading.Thread(target=_prune, daemon=True)
-        thread.start()
+        scheduler.submit_with_priority(Priority.FOREGROUND, _prune)
     
     def _on_operation_complete(self, operation: str, volume_name: str, callback: Optional[Callable]):
         """Handler for the completion of the operation."""
@@ -222,7 +238,7 @@ class VolumeManager(ResourceManager):
             callback()
         print(f"Error in {operation} operation for volume {volume_name}: {error}")
     
-    def format_volume_data(self, volume: Dict[str, Any]) -> Dict[str, Any]:
+    def format_volume_data(self, volume: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Format volume data for display.
         
@@ -232,7 +248,8 @@ class VolumeManager(ResourceManager):
         Returns:
             Formatted volume data
         """
-        formatted = volume.copy()
+        # Display fields layered over the record instead of copying it
+        formatted = ChainMap({}, volume)
         
         # Format the name
         formatted['display_name'] = volume.get('Name', '')
@@ -252,8 +269,8 @@ class VolumeManager(ResourceManager):
         created = volume.get('CreatedAt', '')
         formatted['created_display'] = BaseOperations.format_date(created)
         
-        # Usage status
-        ref_count = usage_data.get('RefCount', 0)
+        # Usage status: containers mounting the volume
+        ref_count = self.count_users(volume.get('Name', ''))
         if ref_count > 0:
             formatted['status_display'] = f"Используется ({ref_count})"
             formatted['status_color'] = "success"
@@ -277,7 +294,7 @@ class VolumeManager(ResourceManager):
         
         return formatted
     
-    def get_all_volumes_formatted(self) -> List[Dict[str, Any]]:
+    def get_all_volumes_formatted(self) -> List[Mapping[str, Any]]:
         """
         Get all volumes in formatted view.
         
@@ -302,16 +319,18 @@ class VolumeManager(ResourceManager):
         Returns:
             Number of used volumes
         """
-        return len([vol for vol in self.resources if vol.get('UsageData', {}).get('RefCount', 0) > 0])
+        return self.relations.count_used(self.resource_type) if self.relations else 0
     
     def get_unused_volumes_count(self) -> int:
         """
         Get the number of unused volumes.
         
         Returns:
-            Number of unused volumes
+            Number of unused volumes (0 without a relation graph)
         """
-        return len([vol for vol in self.resources if vol.get('UsageData', {}).get('RefCount', 0) == 0])
+        if self.relations is None:
+            return 0
+        return len(self.resources) - self.get_used_volumes_count()
     
     def get_local_volumes_count(self) -> int:
         """
@@ -320,7 +339,7 @@ class VolumeManager(ResourceManager):
         Returns:
             Number of local volumes
         """
-        return len([vol for vol in self.resources if vol.get('Driver', '') == 'local'])
+        return self.count_indexed_resources('driver', 'local')
     
     def get_remote_volumes_count(self) -> int:
         """
@@ -329,7 +348,7 @@ class VolumeManager(ResourceManager):
         Returns:
             Number of remote volumes
         """
-        return len([vol for vol in self.resources if vol.get('Driver', '') != 'local'])
+        return len(self.resources) - self.count_indexed_resources('driver', 'local')
     
     def get_total_size(self) -> int:
         """
@@ -338,7 +357,7 @@ class VolumeManager(ResourceManager):
         Returns:
             Total size in bytes
         """
-        return sum(vol.get('UsageData', {}).get('Size', 0) for vol in self.resources)
+        return self.get_total('size')
     
     def get_volumes_by_driver(self, driver: str) -> List[Dict[str, Any]]:
         """
@@ -350,4 +369,4 @@ class VolumeManager(ResourceManager):
         Returns:
             List of volumes with the specified driver
         """
-        return [vol for vol in self.resources if vol.get('Driver', '') == driver]
+        return self.get_indexed_resources('driver', driver)
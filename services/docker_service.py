@@ -1,9 +1,17 @@
 import threading
+from concurrent.futures import Future
+from functools import partial
 from typing import List, Dict, Any, Optional, Callable
 import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import GLib
 
+from core.cache_policy import CachePolicy
+from core.scheduler import Priority, scheduler
+from core.single_flight import SingleFlight
+from ui.components.virtual_list import performance_monitor
+from .state_store import LiveStateStore
+
 
 class DockerService:
     def __init__(self, docker_api):
@@ -12,6 +20,13 @@ class DockerService:
         self._cache = {}
         self._cache_timeout = 30  # seconds
         self._last_cache_update = {}
+        self.state_store = None
+        self._flights = SingleFlight()
+        
+        # Stale-while-revalidate rules per resource type
+        self._cache_policies = {}
+        self._revalidating = set()
+        self._revalidate_lock = threading.Lock()
         
     def add_callback(self, callback: Callable):
         """
@@ -47,24 +62,96 @@ class DockerService:
             except Exception as e:
                 print(f"Error in Docker service callback: {e}")
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
+    def enable_live_updates(self):
         """
-        Check if the cache is valid.
+        Keep resource data current from the Docker event stream instead of
+        the cache timeout.
+        """
+        if self.state_store is None:
+            self.state_store = LiveStateStore(self.docker_api, dispatch=GLib.idle_add)
+            self.state_store.add_callback(self._on_state_store_event)
+        self.state_store.start()
+    
+    def disable_live_updates(self):
+        """
+        Stop following the Docker event stream.
+        """
+        if self.state_store:
+            self.state_store.stop()
+    
+    def is_live(self, cache_key: str) -> bool:
+        """
+        Check if a resource kind is kept current by the event stream.
+        
+        Args:
+            cache_key: Cache key (resource kind)
+            
+        Returns:
+            True if the data is served from the live state store
+        """
+        return self.state_store is not None and self.state_store.is_live(cache_key)
+    
+    def _on_state_store_event(self, event_type: str, data: Any = None):
+        """
+        Forward state store changes (<kind>_changed, state_store_connected,
+        state_store_disconnected) to the service callbacks.
+        
+        Args:
+            event_type: Type of event
+            data: Event data
+        """
+        self._notify_callbacks(event_type, data)
+    
+    def set_cache_policy(self, cache_key: str, cache_policy: CachePolicy):
+        """
+        Set the cache policy for a resource type.
+        
+        Args:
+            cache_key: Cache key (resource kind)
+            cache_policy: Freshness rules
+        """
+        self._cache_policies[cache_key] = cache_policy
+    
+    def get_cache_policy(self, cache_key: str) -> CachePolicy:
+        """
+        Get the cache policy for a resource type.
+        
+        Args:
+            cache_key: Cache key (resource kind)
+            
+        Returns:
+            Policy set for the type, or one revalidating after the cache timeout
+        """
+        return self._cache_policies.get(cache_key) or CachePolicy(revalidate_interval=self._cache_timeout)
+    
+    def _get_cache_state(self, cache_key: str) -> str:
+        """
+        Classify the cached listing by its cache policy.
         
         Args:
             cache_key: Cache key
             
         Returns:
-            True if the cache is valid
+            CachePolicy.FRESH, CachePolicy.STALE or CachePolicy.EXPIRED
         """
         if cache_key not in self._last_cache_update:
-            return False
+            return CachePolicy.EXPIRED
         
         import time
-        current_time = time.time()
-        last_update = self._last_cache_update[cache_key]
+        age = time.time() - self._last_cache_update[cache_key]
+        return self.get_cache_policy(cache_key).get_state(age)
+    
+    def _is_cache_valid(self, cache_key: str) -> bool:
+        """
+        Check if the cache is valid.
         
-        return (current_time - last_update) < self._cache_timeout
+        Args:
+            cache_key: Cache key
+            
+        Returns:
+            True if the cache is valid
+        """
+        return self._get_cache_state(cache_key) == CachePolicy.FRESH
     
     def _update_cache(self, cache_key: str, data: Any):
         """
@@ -92,31 +179,138 @@ class DockerService:
             self._cache.clear()
             self._last_cache_update.clear()
     
-    # Methods for working with containers
+    def _patch_cache(self, cache_key: str, resource_id: str, resource: Optional[Dict[str, Any]]):
+        """
+        Replace or drop one resource of a cached listing, keeping its age.
+        
+        Args:
+            cache_key: Cache key (resource kind)
+            resource_id: ID of the resource (full or short)
+            resource: New state of the resource (None to drop it)
+        """
+        data = self._cache.get(cache_key)
+        if data is None:
+            return
+        
+        short_id = resource_id[:12]
+        patched = []
+        found = False
+        for item in data:
+            if item.get('Id', '')[:12] == short_id:
+                found = True
+                if resource is not None:
+                    patched.append(resource)
+            else:
+                patched.append(item)
+        if not found and resource is not None:
+            patched.append(resource)
+        # Listings handed out earlier are never modified
+        self._cache[cache_key] = patched
     
-    def get_containers(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+    def _get_listing(self, cache_key: str, loader: Callable, use_cache: bool) -> List[Dict[str, Any]]:
         """
-        Get a list of containers.
+        Get a resource listing from the live store, the cache or the daemon.
+        
+        Concurrent requests for the same listing share one daemon call; a
+        request bypassing the cache waits for a call that started after it.
+        A stale listing is returned at once and revalidated in the background,
+        followed by '<kind>_revalidated' on the main loop.
         
         Args:
+            cache_key: Cache key (resource kind)
+            loader: DockerAPI listing method
             use_cache: Use cache
             
         Returns:
-            List of containers
+            List of resources
         """
-        cache_key = "containers"
+        if use_cache and self.is_live(cache_key):
+            return self.state_store.get(cache_key)
         
-        if use_cache and self._is_cache_valid(cache_key):
+        state = self._get_cache_state(cache_key) if use_cache else CachePolicy.EXPIRED
+        if state == CachePolicy.FRESH:
             return self._cache[cache_key]
         
-        try:
-            containers = self.docker_api.get_containers()
-            self._update_cache(cache_key, containers)
-            self._notify_callbacks('containers_updated', containers)
-            return containers
-        except Exception as e:
-            self._notify_callbacks('containers_error', str(e))
-            raise
+        def _load():
+            try:
+                data = loader()
+            except Exception as e:
+                self._notify_callbacks(f'{cache_key}_error', str(e))
+                raise
+            self._update_cache(cache_key, data)
+            # A full re-list also corrects the live state, should it have drifted
+            if not use_cache and self.is_live(cache_key):
+                self.state_store.replace(cache_key, data)
+            self._notify_callbacks(f'{cache_key}_updated', data)
+            return data
+        
+        if state == CachePolicy.STALE:
+            self._revalidate(cache_key, _load)
+            return self._cache[cache_key]
+        
+        return self._flights.do(cache_key, _load, fresh=not use_cache)
+    
+    def _get_filtered_listing(self, cache_key: str, loader: Callable,
+                              filters: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """
+        Get a listing filtered by the daemon, bypassing the cache.
+        
+        Args:
+            cache_key: Cache key (resource kind)
+            loader: DockerAPI listing method accepting filters=
+            filters: Docker API filters, e.g. {"status": ["running"]}
+            
+        Returns:
+            List of matching resources
+        """
+        flight_key = f"{cache_key}?" + "&".join(
+            f"{name}={value}" for name in sorted(filters) for value in sorted(filters[name])
+        )
+        return self._flights.do(flight_key, lambda: loader(filters=filters))
+    
+    def _revalidate(self, cache_key: str, load: Callable):
+        """
+        Reload a stale listing on the background lane, once per resource type.
+        
+        Args:
+            cache_key: Cache key (resource kind)
+            load: Function loading and caching the listing
+        """
+        with self._revalidate_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+        
+        def _run():
+            try:
+                # Joins a load already running for the key instead of repeating it
+                data = self._flights.do(cache_key, load)
+            except Exception:
+                return  # Reported by load as '<kind>_error'
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(cache_key)
+            GLib.idle_add(self._notify_callbacks, f'{cache_key}_revalidated', data)
+        
+        scheduler.submit_with_priority(Priority.BACKGROUND, _run)
+    
+    # Methods for working with containers
+    
+    def get_containers(self, use_cache: bool = True,
+                   filters: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Get a list of containers.
+        
+        Args:
+            use_cache: Use cache
+            filters: Docker API filters applied by the daemon (bypasses the cache)
+            
+        Returns:
+            List of containers
+        """
+        if filters:
+            return self._get_filtered_listing("containers", self.docker_api.get_containers, filters)
+        return self._get_listing("containers", self.docker_api.get_containers, use_cache)
     
     def get_container(self, container_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -134,47 +328,63 @@ class DockerService:
             self._notify_callbacks('container_error', {'id': container_id, 'error': str(e)})
             raise
     
-    def start_container(self, container_id: str):
+    def start_container(self, container_id: str) -> Optional[Dict[str, Any]]:
         """
         Start a container.
         
         Args:
             container_id: ID of the container
+            
+        Returns:
+            The container as listed after the start (None with live updates,
+            where the event stream re-reads it)
         """
         try:
-            self.docker_api.start_container(container_id)
-            self._clear_cache("containers")
+            self._check_result(self.docker_api.start_container(container_id),
+                               f"Не удалось запустить контейнер {container_id}")
+            container = self._reconcile_container(container_id)
             self._notify_callbacks('container_started', container_id)
+            return container
         except Exception as e:
             self._notify_callbacks('container_start_error', {'id': container_id, 'error': str(e)})
             raise
     
-    def stop_container(self, container_id: str):
+    def stop_container(self, container_id: str) -> Optional[Dict[str, Any]]:
         """
         Stop a container.
         
         Args:
             container_id: ID of the container
+            
+        Returns:
+            The container as listed after the stop (None with live updates)
         """
         try:
-            self.docker_api.stop_container(container_id)
-            self._clear_cache("containers")
+            self._check_result(self.docker_api.stop_container(container_id),
+                               f"Не удалось остановить контейнер {container_id}")
+            container = self._reconcile_container(container_id)
             self._notify_callbacks('container_stopped', container_id)
+            return container
         except Exception as e:
             self._notify_callbacks('container_stop_error', {'id': container_id, 'error': str(e)})
             raise
     
-    def restart_container(self, container_id: str):
+    def restart_container(self, container_id: str) -> Optional[Dict[str, Any]]:
         """
         Restart a container.
         
         Args:
             container_id: ID of the container
+            
+        Returns:
+            The container as listed after the restart (None with live updates)
         """
         try:
-            self.docker_api.restart_container(container_id)
-            self._clear_cache("containers")
+            self._check_result(self.docker_api.restart_container(container_id),
+                               f"Не удалось перезапустить контейнер {container_id}")
+            container = self._reconcile_container(container_id)
             self._notify_callbacks('container_restarted', container_id)
+            return container
         except Exception as e:
             self._notify_callbacks('container_restart_error', {'id': container_id, 'error': str(e)})
             raise
@@ -188,13 +398,44 @@ class DockerService:
             force: Force deletion
         """
         try:
-            self.docker_api.delete_container(container_id, force)
-            self._clear_cache("containers")
+            self._check_result(self.docker_api.delete_container(container_id, force),
+                               f"Не удалось удалить контейнер {container_id}")
+            self._patch_cache("containers", container_id, None)
             self._notify_callbacks('container_deleted', container_id)
         except Exception as e:
             self._notify_callbacks('container_delete_error', {'id': container_id, 'error': str(e)})
             raise
     
+    @staticmethod
+    def _check_result(result: Any, message: str):
+        """Raise if a DockerAPI operation reported failure (it returns False)."""
+        if result is False:
+            raise RuntimeError(message)
+    
+    def _reconcile_container(self, container_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Re-read one container after a change and patch the cached listing.
+        
+        Args:
+            container_id: ID of the container
+            
+        Returns:
+            The container, or None if it no longer exists or the live state
+            store follows it
+        """
+        if self.is_live("containers"):
+            return None
+        try:
+            container = self.docker_api.get_container(container_id)
+        except Exception as e:
+            # The operation itself succeeded; only the re-read failed, so the
+            # listing is dropped and read again instead of patched
+            print(f"Ошибка обновления контейнера {container_id}: {e}")
+            self._clear_cache("containers")
+            return None
+        self._patch_cache("containers", container_id, container)
+        return container
+    
     def get_container_logs(self, container_id: str, tail: int = 100) -> str:
         """
         Get the logs of a container.
@@ -214,29 +455,21 @@ class DockerService:
     
     # Methods for working with images
     
-    def get_images(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+    def get_images(self, use_cache: bool = True,
+                   filters: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
         """
         Get a list of images.
         
         Args:
             use_cache: Use cache
+            filters: Docker API filters applied by the daemon (bypasses the cache)
             
         Returns:
             List of images
         """
-        cache_key = "images"
-        
-        if use_cache and self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
-        
-        try:
-            images = self.docker_api.get_images()
-            self._update_cache(cache_key, images)
-            self._notify_callbacks('images_updated', images)
-            return images
-        except Exception as e:
-            self._notify_callbacks('images_error', str(e))
-            raise
+        if filters:
+            return self._get_filtered_listing("images", self.docker_api.get_images, filters)
+        return self._get_listing("images", self.docker_api.get_images, use_cache)
     
     def delete_image(self, image_id: str, force: bool = False):
         """
@@ -271,29 +504,21 @@ class DockerService:
     
     # Methods for working with networks
     
-    def get_networks(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+    def get_networks(self, use_cache: bool = True,
+                   filters: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
         """
         Get a list of networks.
         
         Args:
             use_cache: Use cache
+            filters: Docker API filters applied by the daemon (bypasses the cache)
             
         Returns:
             List of networks
         """
-        cache_key = "networks"
-        
-        if use_cache and self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
-        
-        try:
-            networks = self.docker_api.get_networks()
-            self._update_cache(cache_key, networks)
-            self._notify_callbacks('networks_updated', networks)
-            return networks
-        except Exception as e:
-            self._notify_callbacks('networks_error', str(e))
-            raise
+        if filters:
+            return self._get_filtered_listing("networks", self.docker_api.get_networks, filters)
+        return self._get_listing("networks", self.docker_api.get_networks, use_cache)
     
     def delete_network(self, network_id: str):
         """
@@ -312,29 +537,21 @@ class DockerService:
     
     # Methods for working with volumes
     
-    def get_volumes(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+    def get_volumes(self, use_cache: bool = True,
+                   filters: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
         """
         Get a list of volumes.
         
         Args:
             use_cache: Use cache
+            filters: Docker API filters applied by the daemon (bypasses the cache)
             
         Returns:
             List of volumes
         """
-        cache_key = "volumes"
-        
-        if use_cache and self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
-        
-        try:
-            volumes = self.docker_api.get_volumes()
-            self._update_cache(cache_key, volumes)
-            self._notify_callbacks('volumes_updated', volumes)
-            return volumes
-        except Exception as e:
-            self._notify_callbacks('volumes_error', str(e))
-            raise
+        if filters:
+            return self._get_filtered_listing("volumes", self.docker_api.get_volumes, filters)
+        return self._get_listing("volumes", self.docker_api.get_volumes, use_cache)
     
     def delete_volume(self, volume_name: str):
         """
@@ -407,24 +624,56 @@ class DockerService:
     
     # Asynchronous methods
     
-    def refresh_all_data(self):
-        """
-        Update all data asynchronously.
+    def refresh_all_data(self, priority: Priority = Priority.FOREGROUND) -> List[Future]:
         """
-        def _refresh():
+        Re-list all resource types concurrently.
+        
+        Each listing is delivered on the main loop as '<kind>_refreshed' as
+        soon as it arrives, so the total time is that of the slowest listing;
+        'all_data_refreshed' follows the last one. Every listing is timed as
+        'refresh_<kind>' in the performance monitor.
+        
+        Args:
+            priority: Scheduler lane for the listings
+            
+        Returns:
+            Futures of the four listings
+        """
+        loaders = {
+            "containers": self.get_containers,
+            "images": self.get_images,
+            "networks": self.get_networks,
+            "volumes": self.get_volumes,
+        }
+        remaining = [len(loaders)]
+        lock = threading.Lock()
+        
+        def _refresh(kind: str, loader: Callable):
+            performance_monitor.start_timer(f"refresh_{kind}")
             try:
-                # Update all data types
-                self.get_containers(use_cache=False)
-                self.get_images(use_cache=False)
-                self.get_networks(use_cache=False)
-                self.get_volumes(use_cache=False)
-                
+                return loader(use_cache=False)
+            finally:
+                performance_monitor.end_timer(f"refresh_{kind}")
+        
+        def _on_done(kind: str, future: Future):
+            error = future.exception()
+            if error is not None:
+                GLib.idle_add(self._notify_callbacks, 'refresh_error', f"{kind}: {error}")
+            else:
+                GLib.idle_add(self._notify_callbacks, f'{kind}_refreshed', future.result())
+            
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
                 GLib.idle_add(self._notify_callbacks, 'all_data_refreshed')
-            except Exception as e:
-                GLib.idle_add(self._notify_callbacks, 'refresh_error', str(e))
         
-        thread = threading.Thread(target=_refresh, daemon=True)
-        thread.start()
+        futures = []
+        for kind, loader in loaders.items():
+            future = scheduler.submit_with_priority(priority, _refresh, kind, loader)
+            future.add_done_callback(partial(_on_done, kind))
+            futures.append(future)
+        return futures
     
     def set_cache_timeout(self, timeout: int):
         """
@@ -435,6 +684,15 @@ class DockerService:
         """
         self._cache_timeout = timeout
     
+    def clear_cache(self, cache_key: str):
+        """
+        Drop one cached listing, so that the next request reaches the daemon.
+        
+        Args:
+            cache_key: Cache key (resource kind)
+        """
+        self._clear_cache(cache_key)
+    
     def clear_all_cache(self):
         """
         Clear the entire cache.
@@ -0,0 +1,214 @@
+from typing import Dict, Any, List, Optional
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import GLib
+
+from core.cache_policy import CachePolicy
+from core.scheduler import Priority, scheduler
+
+
+class PrefetchService:
+    """
+    Warms the listings of the sections the user is likely to open next.
+
+    Navigation history is kept as decaying section -> section transition
+    weights; hovering a navigation button marks that section as the most
+    likely one. Warming happens in GLib idle time and only when the shared
+    scheduler has nothing queued and a worker free, on the background lane,
+    at most MAX_IN_FLIGHT loads at a time and MAX_CANDIDATES sections per
+    navigation. Every navigation cancels the prefetch still pending; a load
+    that already started is left to finish, since the section it warms may
+    be the one being opened.
+    """
+
+    # Weight of older transitions after each navigation from the same section
+    DECAY = 0.8
+
+    # Score of a hovered section on top of its history
+    HOVER_WEIGHT = 3.0
+
+    # Sections warmed per navigation
+    MAX_CANDIDATES = 2
+
+    # Concurrent prefetch loads
+    MAX_IN_FLIGHT = 1
+
+    # Retry delay while the scheduler is busy with other work
+    BUSY_RETRY_MS = 500
+
+    def __init__(self, managers: Dict[str, Any]):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            managers: ResourceManager by section name, in navigation order
+        """
+        self._managers = managers
+        self._transitions: Dict[str, Dict[str, float]] = {}
+        self._current: Optional[str] = None
+        self._hovered: Optional[str] = None
+
+        self._generation = 0
+        self._planned: List[str] = []
+        self._source = None
+        self._in_flight = 0
+        self._paused = False
+
+        # Sections warmed since the last navigation, to count hits
+        self._warmed = set()
+        self._stats = {'prefetches': 0, 'hits': 0, 'cancelled': 0}
+
+    def record_navigation(self, section: str):
+        """
+        Learn from a navigation and plan the next prefetch.
+
+        Call before refreshing the opened section, so a pending prefetch
+        does not compete with it.
+
+        Args:
+            section: Section opened by the user
+        """
+        self.cancel()
+        if section in self._warmed and self._managers[section].get_cache_state() == CachePolicy.FRESH:
+            self._stats['hits'] += 1
+        self._warmed.clear()
+
+        previous = self._current
+        if previous is not None and previous != section:
+            weights = self._transitions.setdefault(previous, {})
+            for target in weights:
+                weights[target] *= self.DECAY
+            weights[section] = weights.get(section, 0.0) + 1.0
+
+        self._current = section
+        self._hovered = None
+        self.schedule()
+
+    def hover(self, section: str):
+        """
+        The pointer entered the navigation button of a section.
+
+        Args:
+            section: Section of the button
+        """
+        if section == self._current or section not in self._managers:
+            return
+        self._hovered = section
+        self.cancel()
+        self.schedule()
+
+    def unhover(self, section: str):
+        """
+        The pointer left the navigation button of a section.
+
+        Args:
+            section: Section of the button
+        """
+        if self._hovered == section:
+            self._hovered = None
+
+    def predict(self) -> List[str]:
+        """
+        Rank the sections by how likely they are to be opened next.
+
+        Returns:
+            Section names with a positive score, most likely first
+        """
+        scores = dict(self._transitions.get(self._current, {}))
+        if self._hovered is not None:
+            scores[self._hovered] = scores.get(self._hovered, 0.0) + self.HOVER_WEIGHT
+
+        order = list(self._managers)
+        candidates = [
+            section for section, score in scores.items()
+            if score > 0 and section != self._current and section in self._managers
+        ]
+        # Ties keep the navigation order
+        candidates.sort(key=lambda section: (-scores[section], order.index(section)))
+        return candidates
+
+    def schedule(self):
+        """Plan warming of the most likely sections in idle time."""
+        if self._paused or self._source:
+            return
+        self._planned = self.predict()[:self.MAX_CANDIDATES]
+        if self._planned:
+            self._source = GLib.idle_add(self._on_idle, self._generation, priority=GLib.PRIORITY_LOW)
+
+    def cancel(self):
+        """Drop the pending prefetch (a load already started is not interrupted)."""
+        self._generation += 1
+        if self._planned:
+            self._stats['cancelled'] += 1
+        self._planned = []
+        self._remove_source()
+
+    def pause(self):
+        """Stop prefetching (window unfocused or minimized)."""
+        self._paused = True
+        self.cancel()
+
+    def resume(self):
+        """Resume prefetching."""
+        if not self._paused:
+            return
+        self._paused = False
+        self.schedule()
+
+    @property
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get prefetch statistics.
+
+        Returns:
+            Dictionary with started prefetches, hits (opened sections that
+            were warmed) and cancelled plans
+        """
+        return dict(self._stats)
+
+    def _remove_source(self):
+        if self._source:
+            try:
+                GLib.source_remove(self._source)
+            except (ValueError, TypeError):
+                # Ignore errors if the ID is not found
+                pass
+            self._source = None
+
+    def _on_idle(self, generation: int):
+        """Idle callback: start the next planned load if nothing else is waiting."""
+        self._source = None
+        if generation != self._generation or self._paused:
+            return False
+        if self._in_flight >= self.MAX_IN_FLIGHT:
+            return False  # Rescheduled when the running prefetch finishes
+
+        if not scheduler.has_capacity():
+            self._source = GLib.timeout_add(self.BUSY_RETRY_MS, self._on_idle, generation)
+            return False
+
+        while self._planned:
+            section = self._planned.pop(0)
+            manager = self._managers[section]
+            if manager.get_cache_state() == CachePolicy.FRESH:
+                continue
+
+            self._in_flight += 1
+            self._stats['prefetches'] += 1
+            self._warmed.add(section)
+            future = manager.refresh(priority=Priority.BACKGROUND)
+            future.add_done_callback(
+                lambda done: GLib.idle_add(self._on_prefetch_done, generation)
+            )
+            break
+        return False
+
+    def _on_prefetch_done(self, generation: int):
+        """A prefetch load finished: continue with the plan if it is still current."""
+        self._in_flight -= 1
+        if generation == self._generation and self._planned and not self._paused and not self._source:
+            self._source = GLib.idle_add(self._on_idle, generation, priority=GLib.PRIORITY_LOW)
+        return False
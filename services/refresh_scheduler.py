@@ -0,0 +1,215 @@
+from typing import Dict, Any, Optional, Callable, Iterable
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import GLib
+
+from core.cache_policy import CachePolicy
+
+
+class RefreshSchedule:
+    """Adaptive polling state of one resource type."""
+
+    def __init__(self, kind: str, manager, cache_policy: CachePolicy,
+                 min_interval: float, max_interval: float):
+        self.kind = kind
+        self.manager = manager
+        self.cache_policy = cache_policy
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        # Interval of the visible section, adapted to the observed changes
+        self.interval = cache_policy.revalidate_interval
+        # Moving average of the changed resources per poll
+        self.change_rate = 0.0
+        self.change_count = manager.change_count
+        self.visible = False
+        self.timer = None
+
+
+class RefreshScheduler:
+    """
+    Polls resource managers at intervals adapted to how often they change.
+
+    Every poll looks at the changes the manager found since the previous
+    one (ResourceManager.change_count): changes halve the interval, a quiet
+    period stretches it. Hidden sections are polled BACKOFF_FACTOR times
+    less often and nothing is polled while the window is unfocused or
+    minimized. Resource types kept current by the Docker event stream are
+    not polled.
+
+    The interval is also written to the cache policy shared by the manager
+    and DockerService, so a section opened between polls revalidates on the
+    same schedule; the policy's max_staleness bounds every interval.
+    """
+
+    # Change of the visible interval after a poll with / without changes
+    SPEEDUP_FACTOR = 0.5
+    SLOWDOWN_FACTOR = 1.5
+
+    # Hidden sections are polled this many times less often
+    BACKOFF_FACTOR = 4
+
+    # Weight of the latest poll in the change rate
+    RATE_SMOOTHING = 0.3
+
+    def __init__(self, is_live: Optional[Callable[[str], bool]] = None,
+                 clear_cache: Optional[Callable[[str], None]] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            is_live: Function telling if a resource type is kept current by
+                the Docker event stream (polled always if None)
+            clear_cache: Function dropping the cached listing of a resource
+                type before a poll, e.g. DockerService.clear_cache
+        """
+        self._is_live = is_live
+        self._clear_cache = clear_cache
+        self._schedules: Dict[str, RefreshSchedule] = {}
+        self._paused = False
+
+    def register(self, kind: str, manager, cache_policy: CachePolicy,
+                 min_interval: Optional[float] = None, max_interval: Optional[float] = None):
+        """
+        Poll a resource manager.
+
+        Args:
+            kind: Resource type, e.g. "containers"
+            manager: ResourceManager to refresh
+            cache_policy: Policy shared by the manager and DockerService; its
+                revalidate_interval is the starting interval
+            min_interval: Shortest interval (a third of the starting one if None)
+            max_interval: Longest interval of the visible section (eight times
+                the starting one if None)
+        """
+        base = cache_policy.revalidate_interval
+        schedule = RefreshSchedule(
+            kind, manager, cache_policy,
+            min_interval if min_interval is not None else base / 3,
+            max_interval if max_interval is not None else base * 8
+        )
+        self._schedules[kind] = schedule
+        self._arm(schedule)
+
+    def unregister(self, kind: str):
+        """
+        Stop polling a resource manager.
+
+        Args:
+            kind: Resource type
+        """
+        schedule = self._schedules.pop(kind, None)
+        if schedule is not None:
+            self._disarm(schedule)
+
+    def set_visible(self, kinds: Iterable[str]):
+        """
+        Set the resource types shown on screen.
+
+        Args:
+            kinds: Visible resource types (the others back off)
+        """
+        kinds = set(kinds)
+        for schedule in self._schedules.values():
+            visible = schedule.kind in kinds
+            if visible != schedule.visible:
+                schedule.visible = visible
+                self._arm(schedule)
+
+    def pause(self):
+        """Stop polling (window unfocused or minimized)."""
+        if self._paused:
+            return
+        self._paused = True
+        for schedule in self._schedules.values():
+            self._disarm(schedule)
+
+    def resume(self):
+        """Resume polling; visible sections that went stale meanwhile refresh at once."""
+        if not self._paused:
+            return
+        self._paused = False
+        for schedule in self._schedules.values():
+            if schedule.visible and schedule.manager.get_cache_state() != CachePolicy.FRESH:
+                schedule.manager.refresh()
+            self._arm(schedule)
+
+    @property
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def get_interval(self, kind: str) -> float:
+        """
+        Get the current polling interval.
+
+        Args:
+            kind: Resource type
+
+        Returns:
+            Interval in seconds, including the back-off of a hidden section
+        """
+        return self._get_effective_interval(self._schedules[kind])
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the polling state of every resource type.
+
+        Returns:
+            Dictionary kind -> interval, change rate and visibility
+        """
+        return {
+            kind: {
+                'interval': self._get_effective_interval(schedule),
+                'change_rate': schedule.change_rate,
+                'visible': schedule.visible,
+            }
+            for kind, schedule in self._schedules.items()
+        }
+
+    def _get_effective_interval(self, schedule: RefreshSchedule) -> float:
+        interval = schedule.interval if schedule.visible else schedule.interval * self.BACKOFF_FACTOR
+        max_staleness = schedule.cache_policy.max_staleness
+        if max_staleness is not None:
+            interval = min(interval, max_staleness)
+        return interval
+
+    def _arm(self, schedule: RefreshSchedule):
+        """(Re)start the timer of a resource type with its current interval."""
+        self._disarm(schedule)
+        interval = self._get_effective_interval(schedule)
+        schedule.cache_policy.revalidate_interval = interval
+        if not self._paused:
+            schedule.timer = GLib.timeout_add(int(interval * 1000), self._poll, schedule)
+
+    def _disarm(self, schedule: RefreshSchedule):
+        if schedule.timer:
+            try:
+                GLib.source_remove(schedule.timer)
+            except (ValueError, TypeError):
+                # Ignore errors if the ID is not found
+                pass
+            schedule.timer = None
+
+    def _poll(self, schedule: RefreshSchedule):
+        """Timer callback: adapt the interval to the last period and refresh."""
+        schedule.timer = None
+        if self._paused:
+            return False
+
+        change_count = schedule.manager.change_count
+        changes = change_count - schedule.change_count
+        schedule.change_count = change_count
+        schedule.change_rate += self.RATE_SMOOTHING * (changes - schedule.change_rate)
+        if changes:
+            schedule.interval = max(schedule.min_interval, schedule.interval * self.SPEEDUP_FACTOR)
+        else:
+            schedule.interval = min(schedule.max_interval, schedule.interval * self.SLOWDOWN_FACTOR)
+
+        self._arm(schedule)
+        if not (self._is_live and self._is_live(schedule.kind)):
+            if self._clear_cache:
+                self._clear_cache(schedule.kind)
+            # The snapshot stays on screen while it is reloaded
+            schedule.manager.invalidate_cache()
+            schedule.manager.refresh()
+        return False  # Re-armed with the new interval
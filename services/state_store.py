@@ -0,0 +1,319 @@
+import threading
+import time
+from typing import List, Dict, Any, Optional, Callable
+
+
+class LiveStateStore:
+    """
+    Keeps containers, images, networks and volumes current from the Docker
+    /events stream.
+
+    The store lists every resource kind once and then applies each event as a
+    targeted lookup of the affected resource, so a busy host costs a handful
+    of small requests instead of repeated full listings.
+    """
+
+    KINDS = ("containers", "images", "networks", "volumes")
+
+    # Event type -> resource kind
+    EVENT_KINDS = {
+        "container": "containers",
+        "image": "images",
+        "network": "networks",
+        "volume": "volumes",
+    }
+
+    # Actions that remove the resource; any other tracked action re-reads it
+    REMOVE_ACTIONS = {
+        "containers": {"destroy"},
+        "images": {"delete"},
+        "networks": {"destroy", "remove"},
+        "volumes": {"destroy"},
+    }
+
+    # Actions that change a projected field
+    UPDATE_ACTIONS = {
+        "containers": {"create", "start", "restart", "stop", "die", "kill", "pause", "unpause", "rename", "update"},
+        "images": {"pull", "tag", "untag", "import", "load", "build"},
+        "networks": {"create"},
+        "volumes": {"create"},
+    }
+
+    # Network actions that change the networks of the container in
+    # Actor.Attributes.container rather than the network itself
+    CONTAINER_ACTIONS = {
+        "networks": {"connect", "disconnect"},
+    }
+
+    def __init__(self, docker_api, dispatch: Optional[Callable] = None,
+                 reconnect_delay: float = 1.0, max_reconnect_delay: float = 30.0):
+        """
+        Initialize the store.
+
+        Args:
+            docker_api: DockerAPI instance
+            dispatch: Function used to deliver notifications, e.g. GLib.idle_add
+                to run callbacks on the main loop (called directly if None)
+            reconnect_delay: Initial delay before reconnecting to the event stream
+            max_reconnect_delay: Upper bound for the reconnect backoff
+        """
+        self.docker_api = docker_api
+        self._dispatch = dispatch
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._records: Dict[str, Dict[str, Dict[str, Any]]] = {kind: {} for kind in self.KINDS}
+        self._loaded = set()
+        self._lock = threading.RLock()
+        self._callbacks = []
+
+        self._since = None
+        self._live = False
+        self._resync_pending = False
+        self._stream = None
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def add_callback(self, callback: Callable):
+        """
+        Add a callback for notifications about changes.
+
+        Args:
+            callback: Callback function
+        """
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable):
+        """
+        Remove a callback.
+
+        Args:
+            callback: Callback function to remove
+        """
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _notify_callbacks(self, event_type: str, data: Any = None):
+        """
+        Notify all registered callbacks.
+
+        Args:
+            event_type: Type of event
+            data: Event data
+        """
+        for callback in self._callbacks:
+            try:
+                callback(event_type, data)
+            except Exception as e:
+                print(f"Error in state store callback: {e}")
+
+    def _emit(self, event_type: str, data: Any = None):
+        """Deliver a notification through the dispatcher."""
+        if self._dispatch:
+            self._dispatch(self._notify_callbacks, event_type, data)
+        else:
+            self._notify_callbacks(event_type, data)
+
+    # Public state
+
+    def start(self):
+        """Load the initial state and start following the event stream."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop following the event stream."""
+        self._stop_event.set()
+        self._close_stream()
+        self._live = False
+
+    def is_live(self, kind: Optional[str] = None) -> bool:
+        """
+        Check whether the store is connected to the event stream.
+
+        Args:
+            kind: Resource kind to check (None for the stream itself)
+
+        Returns:
+            True if the data can be served without re-listing
+        """
+        if not self._live:
+            return False
+        return kind is None or kind in self._loaded
+
+    def get(self, kind: str) -> List[Dict[str, Any]]:
+        """
+        Get the current records of a resource kind.
+
+        Args:
+            kind: One of KINDS
+
+        Returns:
+            List of records in listing order
+        """
+        with self._lock:
+            return list(self._records[kind].values())
+
+    # Loading
+
+    def resync(self, kind: Optional[str] = None):
+        """
+        Replace the state of a kind (or all kinds) with a full listing.
+
+        Args:
+            kind: Resource kind to reload (None for all)
+        """
+        for resync_kind in ([kind] if kind else self.KINDS):
+            self.replace(resync_kind, getattr(self.docker_api, f"get_{resync_kind}")())
+
+    def replace(self, kind: str, records: List[Dict[str, Any]]):
+        """
+        Replace the state of a kind with a listing made elsewhere.
+
+        Args:
+            kind: Resource kind
+            records: Full listing of the kind
+        """
+        with self._lock:
+            self._records[kind] = {self._get_key(kind, record): record for record in records}
+            self._loaded.add(kind)
+        self._emit(f"{kind}_changed", {"action": "resync", "id": None})
+
+    def _run(self):
+        """Initial listing followed by the event loop with reconnects."""
+        # Remember the position before listing, so anything that happens
+        # while listing is replayed from the stream
+        self._since = self._format_since(time.time_ns())
+        self.resync()
+
+        delay = self.reconnect_delay
+        while not self._stop_event.is_set():
+            try:
+                self._stream = self.docker_api.get_events(since=self._since)
+            except Exception as e:
+                print(f"Ошибка подключения к потоку событий Docker: {e}")
+                # The daemon keeps its event log in memory, so an unreachable
+                # daemon may have restarted and lost it: list again on reconnect
+                self._resync_pending = True
+                self._stop_event.wait(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            if self._resync_pending:
+                self._resync_pending = False
+                self.resync()
+
+            self._live = True
+            self._emit("state_store_connected")
+            delay = self.reconnect_delay
+
+            try:
+                for event in self._stream:
+                    if self._stop_event.is_set():
+                        break
+                    self._apply_event(event)
+                    # A failed lookup left the state behind: reconnect, which
+                    # lists again and resumes from the last event
+                    if self._resync_pending:
+                        break
+            except Exception as e:
+                if not self._stop_event.is_set():
+                    print(f"Поток событий Docker прерван: {e}")
+            finally:
+                self._close_stream()
+
+            # /events never ends on its own; a stream that did may come from
+            # a restarted daemon that lost its event log
+            if not self._stop_event.is_set():
+                self._resync_pending = True
+
+            self._live = False
+            if not self._stop_event.is_set():
+                self._emit("state_store_disconnected")
+                self._stop_event.wait(delay)
+
+    def _close_stream(self):
+        """Close the current event stream, unblocking the reader."""
+        stream, self._stream = self._stream, None
+        if stream is not None and hasattr(stream, "close"):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    # Event handling
+
+    def _apply_event(self, event: Dict[str, Any]):
+        """
+        Apply a single /events message.
+
+        Args:
+            event: Decoded event
+        """
+        time_nano = event.get("timeNano")
+        if time_nano:
+            self._since = self._format_since(time_nano)
+        elif event.get("time"):
+            self._since = event["time"]
+
+        kind = self.EVENT_KINDS.get(event.get("Type"))
+        if kind is None:
+            return
+        # Actions such as "exec_start: sh" or "health_status: healthy" carry details
+        action = (event.get("Action") or "").split(":", 1)[0].strip()
+        actor = event.get("Actor") or {}
+        actor_id = actor.get("ID", "")
+
+        if action in self.CONTAINER_ACTIONS.get(kind, ()):
+            container_id = (actor.get("Attributes") or {}).get("container")
+            if container_id:
+                self._refresh_one("containers", container_id, action)
+        elif action == "prune" or not actor_id:
+            self.resync(kind)
+        elif action in self.REMOVE_ACTIONS[kind]:
+            self._remove(kind, self._get_key(kind, {"Id": actor_id, "Name": actor_id}), action)
+        elif action in self.UPDATE_ACTIONS[kind]:
+            self._refresh_one(kind, actor_id, action)
+
+    def _refresh_one(self, kind: str, actor_id: str, action: str):
+        """Re-read one resource and store or drop it."""
+        lookup = getattr(self.docker_api, f"get_{kind[:-1]}")
+        try:
+            record = lookup(actor_id)
+        except Exception as e:
+            # Only a missing resource is removed; keep the old record and
+            # list again once the stream reconnects
+            print(f"Ошибка обновления ресурса {actor_id}: {e}")
+            self._resync_pending = True
+            return
+        if record is None:
+            self._remove(kind, self._get_key(kind, {"Id": actor_id, "Name": actor_id}), action)
+            return
+
+        key = self._get_key(kind, record)
+        with self._lock:
+            self._records[kind][key] = record
+        self._emit(f"{kind}_changed", {"action": action, "id": key})
+
+    def _remove(self, kind: str, key: str, action: str):
+        """Drop one resource from the state."""
+        with self._lock:
+            removed = self._records[kind].pop(key, None)
+        if removed is not None:
+            self._emit(f"{kind}_changed", {"action": action, "id": key})
+
+    @staticmethod
+    def _get_key(kind: str, record: Dict[str, Any]) -> str:
+        """Key records the way DockerAPI projects them."""
+        if kind == "volumes":
+            return record.get("Name", "")
+        return record.get("Id", "").replace("sha256:", "")[:12]
+
+    @staticmethod
+    def _format_since(time_nano: int) -> str:
+        """Format a nanosecond timestamp for the since= parameter."""
+        return f"{time_nano // 1_000_000_000}.{time_nano % 1_000_000_000:09d}"
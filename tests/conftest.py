@@ -79,6 +79,46 @@ def mock_docker_client():
         
         mock_volumes = [mock_volume_1, mock_volume_2]
         
+        # Низкоуровневые сводки /containers/json, /images/json, /networks и /volumes
+        mock_client.api.containers.return_value = [
+            {
+                "Id": "c0ffee000001" + "0" * 52,
+                "Names": ["/test_container_1"],
+                "Image": "test_image:latest",
+                "ImageID": "sha256:" + "a" * 64,
+                "State": "running",
+                "Status": "Up 2 hours",
+                "Ports": [
+                    {"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"},
+                    {"IP": "::", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"}
+                ]
+            },
+            {
+                "Id": "c0ffee000002" + "0" * 52,
+                "Names": ["/test_container_2"],
+                "Image": "sha256:" + "b" * 64,
+                "ImageID": "sha256:" + "b" * 64,
+                "State": "exited",
+                "Status": "Exited (0) 5 minutes ago",
+                "Ports": []
+            }
+        ]
+        mock_client.api.images.return_value = [
+            {"Id": "sha256:" + "a" * 64, "RepoTags": ["test_image:latest"], "Size": 1024*1024*100, "Created": 1704067200},
+            {"Id": "sha256:" + "b" * 64, "RepoTags": ["test_image2:latest"], "Size": 1024*1024*50, "Created": 1704070800}
+        ]
+        mock_client.api.networks.return_value = [
+            {"Id": "0e7e00000001" + "0" * 52, "Name": "bridge", "Driver": "bridge", "Scope": "local"},
+            {"Id": "0e7e00000002" + "0" * 52, "Name": "test_network", "Driver": "bridge", "Scope": "local"}
+        ]
+        mock_client.api.volumes.return_value = {
+            "Volumes": [
+                {"Name": "test_volume_1", "Driver": "local", "Mountpoint": "/var/lib/docker/volumes/test_volume_1/_data"},
+                {"Name": "test_volume_2", "Driver": "local", "Mountpoint": "/var/lib/docker/volumes/test_volume_2/_data"}
+            ],
+            "Warnings": None
+        }
+        
         # Настройка методов клиента
         mock_client.containers.list.return_value = mock_containers
         mock_client.images.list.return_value = mock_images
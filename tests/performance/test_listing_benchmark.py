@@ -0,0 +1,227 @@
+"""
+Бенчмарк движка списков DockerAPI
+
+Сравнивает стоимость одной записи для низкоуровневого пути (client.api.*)
+и прежнего пути через модели SDK на 10, 1 000 и 10 000 ресурсах.
+Демон подменяется ответами без задержки, поэтому измеряется только
+стоимость на стороне клиента; число обращений к демону выводится отдельно.
+"""
+import gc
+import time
+from collections import Counter
+from unittest.mock import patch
+
+import docker
+import pytest
+
+import docker_api
+
+
+SIZES = (10, 1000, 10000)
+REPEAT = 3
+
+
+def _raw_images(count):
+    return [
+        {
+            "Id": f"sha256:{index:064x}",
+            "RepoTags": [f"app{index % 50}:v{index}"],
+            "Size": 1024 * 1024 * (index % 500 + 1),
+            "Created": 1704067200 + index,
+        }
+        for index in range(count)
+    ]
+
+
+def _raw_containers(count):
+    return [
+        {
+            "Id": f"{index:064x}",
+            "Names": [f"/service_{index}"],
+            "Image": f"sha256:{index % min(count, 50):064x}",
+            "ImageID": f"sha256:{index % min(count, 50):064x}",
+            "State": "running" if index % 3 else "exited",
+            "Status": "Up 2 hours" if index % 3 else "Exited (0) 1 hour ago",
+            "Ports": [{"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8000 + index % 1000, "Type": "tcp"}],
+        }
+        for index in range(count)
+    ]
+
+
+def _raw_networks(count):
+    return [
+        {"Id": f"{index:064x}", "Name": f"net_{index}", "Driver": "bridge", "Scope": "local"}
+        for index in range(count)
+    ]
+
+
+def _raw_volumes(count):
+    return [
+        {"Name": f"vol_{index}", "Driver": "local", "Mountpoint": f"/var/lib/docker/volumes/vol_{index}/_data"}
+        for index in range(count)
+    ]
+
+
+def _fake_client(count, calls):
+    """Настоящий клиент SDK, низкоуровневый API которого отвечает из памяти"""
+    client = docker.DockerClient(base_url="unix:///nonexistent/docker.sock", version="1.43")
+    api = client.api
+
+    images = _raw_images(count)
+    containers = _raw_containers(count)
+    networks = _raw_networks(count)
+    volumes = _raw_volumes(count)
+    images_by_id = {image["Id"]: image for image in images}
+    containers_by_id = {container["Id"]: container for container in containers}
+    networks_by_id = {network["Id"]: network for network in networks}
+
+    def counted(name, func):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    def inspect_container(container_id):
+        raw = containers_by_id[container_id]
+        return {
+            "Id": raw["Id"],
+            "Name": raw["Names"][0],
+            "Image": raw["ImageID"],
+            "State": {"Status": raw["State"]},
+            "HostConfig": {"PortBindings": {"80/tcp": [{"HostPort": str(raw["Ports"][0]["PublicPort"])}]}},
+        }
+
+    api.images = counted("images", lambda *a, **kw: images)
+    api.inspect_image = counted("inspect_image", lambda name: images_by_id[name if name.startswith("sha256:") else f"sha256:{name}"])
+    api.containers = counted("containers", lambda *a, **kw: containers)
+    api.inspect_container = counted("inspect_container", inspect_container)
+    api.networks = counted("networks", lambda *a, **kw: networks)
+    api.inspect_network = counted("inspect_network", lambda network_id, **kw: networks_by_id[network_id])
+    api.volumes = counted("volumes", lambda *a, **kw: {"Volumes": volumes, "Warnings": None})
+    return client
+
+
+# Прежний путь через модели SDK, сохранён как эталон для сравнения
+
+def _legacy_get_images(client):
+    result = []
+    for image in client.images.list():
+        image_id = image.short_id.replace("sha256:", "")
+        repo = "<none>"
+        tag = "<none>"
+        if image.tags:
+            repo_tag = image.tags[0].split(":")
+            repo = repo_tag[0]
+            tag = repo_tag[1] if len(repo_tag) > 1 else "latest"
+        attrs = image.attrs
+        size = attrs.get("Size", 0)
+        created = attrs.get("Created", "")
+        repo_tags = image.tags if image.tags else ["<none>"]
+        result.append({
+            "Id": image_id, "id": image_id, "Repository": repo, "repository": repo,
+            "Tag": tag, "tag": tag, "Size": size, "size": size,
+            "Created": created, "created": created, "RepoTags": repo_tags
+        })
+    return result
+
+
+def _legacy_get_containers(client):
+    result = []
+    for container in client.containers.list(all=True):
+        container_id = container.short_id
+        name = container.name
+        image = container.image.tags[0] if container.image.tags else container.image.short_id
+        status = container.status
+        ports = []
+        ports_info = container.attrs.get("HostConfig", {}).get("PortBindings", {})
+        for container_port, host_ports in ports_info.items():
+            if host_ports:
+                for host_port in host_ports:
+                    ports.append(f"{host_port.get('HostPort', '')}:{container_port}")
+        result.append({
+            "Id": container_id, "id": container_id, "Names": [name], "name": name,
+            "Image": image, "image": image, "State": status, "Status": status,
+            "status": status, "Ports": ports, "ports": ", ".join(ports)
+        })
+    return result
+
+
+def _legacy_get_networks(client):
+    result = []
+    for network in client.networks.list():
+        attrs = network.attrs
+        result.append({
+            "Id": network.short_id, "id": network.short_id, "Name": network.name, "name": network.name,
+            "Driver": attrs.get("Driver", ""), "driver": attrs.get("Driver", ""),
+            "Scope": attrs.get("Scope", ""), "scope": attrs.get("Scope", "")
+        })
+    return result
+
+
+def _legacy_get_volumes(client):
+    result = []
+    for volume in client.volumes.list():
+        attrs = volume.attrs
+        result.append({
+            "Name": volume.name, "name": volume.name,
+            "Driver": attrs.get("Driver", ""), "driver": attrs.get("Driver", ""),
+            "Mountpoint": attrs.get("Mountpoint", ""), "mountpoint": attrs.get("Mountpoint", "")
+        })
+    return result
+
+
+LEGACY = {
+    "images": _legacy_get_images,
+    "containers": _legacy_get_containers,
+    "networks": _legacy_get_networks,
+    "volumes": _legacy_get_volumes,
+}
+
+
+def _measure(func, repeat=REPEAT):
+    """Лучший из нескольких прогонов при выключенном сборщике мусора"""
+    best = None
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+    return best, result
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("kind", ["images", "containers", "networks", "volumes"])
+def test_listing_per_record_cost(kind, capsys):
+    """Стоимость одной записи: низкоуровневый путь против моделей SDK"""
+    rows = []
+    for count in SIZES:
+        legacy_calls = Counter()
+        legacy_client = _fake_client(count, legacy_calls)
+        legacy_time, legacy_result = _measure(lambda: LEGACY[kind](legacy_client))
+        legacy_calls = {name: calls // REPEAT for name, calls in legacy_calls.items()}
+
+        engine_calls = Counter()
+        with patch("docker_api.docker.from_env", return_value=_fake_client(count, engine_calls)):
+            api = docker_api.DockerAPI()
+        engine_time, engine_result = _measure(getattr(api, f"get_{kind}"))
+        api.executor.shutdown(wait=False)
+        engine_calls = {name: calls // REPEAT for name, calls in engine_calls.items()}
+
+        assert len(engine_result) == len(legacy_result)
+        # Движок обращается к демону O(1) раз независимо от числа ресурсов
+        assert sum(engine_calls.values()) <= 2
+        rows.append((
+            count,
+            legacy_time / len(legacy_result) * 1e6, sum(legacy_calls.values()),
+            engine_time / len(engine_result) * 1e6, sum(engine_calls.values()),
+        ))
+
+    with capsys.disabled():
+        print(f"\n{kind}: {'N':>6} | {'SDK мкс/запись':>14} {'вызовов':>8} | {'api мкс/запись':>14} {'вызовов':>8}")
+        for count, legacy_us, legacy_n, engine_us, engine_n in rows:
+            print(f"{kind}: {count:>6} | {legacy_us:>14.2f} {legacy_n:>8} | {engine_us:>14.2f} {engine_n:>8}")
@@ -0,0 +1,81 @@
+"""
+Бенчмарк памяти записей DockerAPI
+
+Сравнивает байты на запись для 10 000 контейнеров: прежние словари
+с дублирующимися ключами против записей на __slots__ из docker_records.
+Сводки демона создаются до начала замера, поэтому учитываются только
+объекты, которые удерживает сама проекция.
+"""
+import gc
+import tracemalloc
+
+import pytest
+
+from docker_api import DockerAPI
+
+
+COUNT = 10000
+
+
+def _raw_containers(count):
+    return [
+        {
+            "Id": f"{index:064x}",
+            "Names": [f"/service_{index}"],
+            # JSON декодирует каждую строку заново, поэтому повторы не разделяются
+            "Image": "".join(["registry.local/team/app", f":v{index % 5}"]),
+            "ImageID": f"sha256:{index % 5:064x}",
+            "State": "".join(["run", "ning"]) if index % 3 else "".join(["exi", "ted"]),
+            "Ports": [
+                {"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8000 + index % 1000, "Type": "tcp"},
+                {"IP": "::", "PrivatePort": 80, "PublicPort": 8000 + index % 1000, "Type": "tcp"},
+            ],
+        }
+        for index in range(count)
+    ]
+
+
+def _legacy_project_container(container, image):
+    """Прежняя проекция: словарь, где каждое поле хранится дважды"""
+    container_id = container.get("Id", "")[:12]
+    names = container.get("Names") or []
+    name = names[0].lstrip("/") if names else container_id
+    status = container.get("State", "")
+    ports = list(dict.fromkeys(
+        f"{port['PublicPort']}:{port.get('PrivatePort', '')}/{port.get('Type', 'tcp')}"
+        for port in container.get("Ports") or []
+        if port.get("PublicPort")
+    ))
+    ports_str = ", ".join(ports) if ports else ""
+    return {
+        "Id": container_id, "id": container_id, "Names": [name], "name": name,
+        "Image": image, "image": image, "State": status, "Status": status,
+        "status": status, "Ports": ports, "ports": ports_str
+    }
+
+
+def _retained_bytes(project, raw):
+    """Память, удерживаемая списком записей после проекции"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        records = [project(container, container["Image"]) for container in raw]
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(records) == len(raw)
+    return size
+
+
+@pytest.mark.slow
+def test_container_record_memory(capsys):
+    """Байты на запись для 10 000 контейнеров: словари против записей"""
+    legacy = _retained_bytes(_legacy_project_container, _raw_containers(COUNT)) / COUNT
+    records = _retained_bytes(DockerAPI._project_container, _raw_containers(COUNT)) / COUNT
+
+    with capsys.disabled():
+        print(f"\ncontainers: {COUNT} записей | словари {legacy:.0f} байт/запись | записи {records:.0f} байт/запись")
+
+    # Записи на __slots__ должны занимать заметно меньше памяти
+    assert records < legacy / 2
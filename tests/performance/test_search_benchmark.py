@@ -0,0 +1,60 @@
+"""
+Бенчмарк поиска по 20 000 образов
+
+Имитирует набор запроса в строке поиска на хосте-зеркале реестра:
+каждое нажатие клавиши должно укладываться в один кадр (16 мс).
+Индекс строится один раз на снимок, до начала ввода.
+"""
+import time
+
+import pytest
+
+from core.search_index import SearchIndex, build_search_text
+from docker_records import ImageRecord
+
+
+COUNT = 20000
+FRAME_MS = 16
+
+
+def _images(count):
+    return [
+        ImageRecord(
+            id=f"{index:064x}"[:12],
+            repository=f"mirror.local/team-{index % 50}/service-{index}",
+            tag=f"v{index % 7}.{index % 13}",
+            size=1024 * 1024 * (index % 900),
+            created="",
+            repo_tags=(f"mirror.local/team-{index % 50}/service-{index}:v{index % 7}.{index % 13}",),
+        )
+        for index in range(count)
+    ]
+
+
+def _search_text(image):
+    return build_search_text((image["RepoTags"], image["Id"], image["Size"]))
+
+
+@pytest.mark.slow
+def test_typing_stays_under_one_frame(capsys):
+    """Каждое нажатие клавиши в запросе обрабатывается быстрее кадра"""
+    images = _images(COUNT)
+    started = time.perf_counter()
+    index = SearchIndex(images, _search_text)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    query = "service-1234"
+    timings = []
+    for length in range(1, len(query) + 1):
+        started = time.perf_counter()
+        matches = index.search(query[:length])
+        timings.append((time.perf_counter() - started) * 1000)
+
+    with capsys.disabled():
+        print(f"\nimages: {COUNT} | построение {build_ms:.0f} мс | "
+              f"нажатие: макс {max(timings):.2f} мс, среднее {sum(timings) / len(timings):.2f} мс")
+
+    assert [image["Repository"] for image in matches] == [f"mirror.local/team-{1234 % 50}/service-1234"] + [
+        f"mirror.local/team-{index % 50}/service-{index}" for index in range(12340, 12350)
+    ]
+    assert max(timings) < FRAME_MS
@@ -0,0 +1,59 @@
+"""
+Бенчмарк пересортировки 10 000 образов
+
+Первая сортировка по колонке вычисляет ключи и перестановку,
+повторные клики по заголовкам берут перестановку из кэша снимка.
+"""
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from docker_records import ImageRecord
+from resources.images import ImageManager
+
+
+COUNT = 10000
+FRAME_MS = 16
+
+
+def _images(count):
+    return [
+        ImageRecord(
+            id=f"{index * 7919:012x}",
+            repository=f"team-{index % 50}/service-{index}",
+            tag=f"v{index % 7}",
+            size=(index * 104729) % (1024 ** 3),
+            created=f"2024-01-{index % 28 + 1:02d}T00:00:00Z",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.slow
+def test_resort_is_cached(capsys):
+    """Повторная сортировка по уже использованным колонкам быстрее кадра"""
+    manager = ImageManager(MagicMock())
+    manager.docker_api.get_images.return_value = _images(COUNT)
+    manager._run_refresh()
+    manager._apply_filters_and_search()
+    specs = [[("size", True)], [("created", False), ("size", True)], [("repository", False)]]
+
+    started = time.perf_counter()
+    for spec in specs:
+        manager.set_sort(spec)
+    first_ms = (time.perf_counter() - started) * 1000
+
+    timings = []
+    for spec in specs * 3:
+        started = time.perf_counter()
+        manager.set_sort(spec)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    with capsys.disabled():
+        print(f"\nimages: {COUNT} | первые сортировки {first_ms:.0f} мс | "
+              f"из кэша: макс {max(timings):.2f} мс")
+
+    repositories = [image["Repository"] for image in manager.get_filtered_resources()]
+    assert repositories == sorted(repositories)
+    assert max(timings) < FRAME_MS
@@ -0,0 +1,36 @@
+"""
+Unit тесты для политики кэширования stale-while-revalidate
+"""
+import pytest
+
+from core.cache_policy import CachePolicy
+
+
+class TestCachePolicy:
+    """Тесты для класса CachePolicy"""
+
+    def test_states_by_age(self):
+        """Тест: свежий, устаревший и просроченный снимок"""
+        policy = CachePolicy(revalidate_interval=10, max_staleness=60)
+
+        assert policy.get_state(None) == CachePolicy.EXPIRED
+        assert policy.get_state(5) == CachePolicy.FRESH
+        assert policy.get_state(10) == CachePolicy.STALE
+        assert policy.get_state(59) == CachePolicy.STALE
+        assert policy.get_state(60) == CachePolicy.EXPIRED
+
+    def test_invalidated_snapshot_is_stale(self):
+        """Тест: инвалидированный снимок показывается, пока идёт перезагрузка"""
+        policy = CachePolicy(revalidate_interval=10, max_staleness=60)
+
+        assert policy.get_state(1, valid=False) == CachePolicy.STALE
+        assert policy.get_state(60, valid=False) == CachePolicy.EXPIRED
+
+    def test_unbounded_staleness(self):
+        """Тест: без max_staleness снимок никогда не просрочен"""
+        assert CachePolicy(revalidate_interval=10).get_state(10 ** 6) == CachePolicy.STALE
+
+    def test_invalid_bounds(self):
+        """Тест: max_staleness не может быть меньше интервала перепроверки"""
+        with pytest.raises(ValueError):
+            CachePolicy(revalidate_interval=60, max_staleness=10)
@@ -0,0 +1,48 @@
+"""
+Unit тесты для полей карточки ресурса
+"""
+from docker_records import ContainerRecord, ImageRecord, VolumeRecord
+from ui.components.card import get_card_fields
+
+
+def _changed(before, after):
+    return {name for name in after if before.get(name) != after[name]}
+
+
+class TestCardFields:
+    """Тесты для функции get_card_fields"""
+
+    def test_container_fields(self):
+        """Тест: поля карточки контейнера"""
+        container = ContainerRecord(id="c1", name="web", image="nginx", status="running",
+                                    ports=("80->8080/tcp",))
+        fields = get_card_fields("container", container)
+
+        assert fields["title"] == "web"
+        assert fields["status"] == "RUNNING"
+        assert fields["status_class"] == "status-running"
+        assert fields["running"] is True
+        assert fields["ports"] == "Ports: 80->8080/tcp"
+
+    def test_status_flip_changes_status_fields_only(self):
+        """Тест: смена состояния меняет только поля статуса"""
+        container = ContainerRecord(id="c1", name="web", image="nginx", status="running")
+        before = get_card_fields("container", container)
+        after = get_card_fields("container", container.replace(status="exited"))
+
+        assert _changed(before, after) == {"status", "status_class", "running", "state"}
+        assert after["status_class"] == "status-exited"
+        assert _changed(after, get_card_fields("container", container.replace(status="exited"))) == set()
+
+    def test_optional_lines_hidden(self):
+        """Тест: отсутствующие сведения скрывают строку"""
+        image = ImageRecord(id="sha256:abcdef0123456789", repository="<none>", tag="<none>",
+                            size=2048, created="2024-01-02T03:04:05Z")
+        fields = get_card_fields("image", image)
+
+        assert fields["repo"] is None
+        assert fields["size"] == "Size: 2.0 KB"
+        assert fields["created"] == "Created: 2024-01-02 03:04"
+
+        volume = VolumeRecord(name="data", driver="local", mountpoint="")
+        assert get_card_fields("volume", volume)["mount"] is None
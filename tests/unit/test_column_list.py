@@ -0,0 +1,56 @@
+"""
+Unit тесты для построения splice-операций по ключам
+"""
+import random
+
+from ui.components.column_list import plan_splices
+
+
+def _apply(old_keys, new_keys):
+    """Применяет splice-операции к копии списка, как Gio.ListStore"""
+    model = list(old_keys)
+    splices = plan_splices(old_keys, new_keys)
+    for position, removals, inserted in splices:
+        model[position:position + removals] = [new_keys[index] for index in inserted]
+    return model, splices
+
+
+class TestPlanSplices:
+    """Тесты для функции plan_splices"""
+
+    def test_same_order_no_splices(self):
+        """Тест: неизменный порядок не трогает модель"""
+        keys = [f"k{index}" for index in range(100)]
+        assert plan_splices(keys, list(keys)) == []
+
+    def test_single_change_single_splice(self):
+        """Тест: добавление и удаление одной строки — одна операция"""
+        keys = [f"k{index}" for index in range(100)]
+
+        model, splices = _apply(keys, keys[:50] + ["new"] + keys[50:])
+        assert splices == [(50, 0, range(50, 51))]
+
+        model, splices = _apply(keys, keys[:10] + keys[11:])
+        assert splices == [(10, 1, range(10, 10))]
+
+    def test_move_touches_moved_row_only(self):
+        """Тест: перемещение строки не трогает остальные"""
+        keys = [f"k{index}" for index in range(100)]
+        moved = keys[:20] + keys[21:80] + [keys[20]] + keys[80:]
+
+        model, splices = _apply(keys, moved)
+        assert model == moved
+        assert sum(removals for _, removals, _ in splices) == 1
+        assert sum(len(inserted) for _, _, inserted in splices) == 1
+
+    def test_random_orders(self):
+        """Тест: результат совпадает с новым порядком при любых изменениях"""
+        rng = random.Random(3)
+        for _ in range(200):
+            old_keys = rng.sample(range(60), rng.randint(0, 40))
+            new_keys = rng.sample(range(60), rng.randint(0, 40))
+            if rng.random() < 0.5:
+                new_keys = sorted(old_keys[:rng.randint(0, len(old_keys))] + new_keys[:3], key=str)
+                new_keys = list(dict.fromkeys(new_keys))
+            model, _ = _apply(old_keys, new_keys)
+            assert model == new_keys
@@ -20,13 +20,66 @@ class TestDockerAPI:
         containers = api.get_containers()
         
         assert len(containers) == 2
-        assert containers[0]["id"] == "test_container_1"
+        assert containers[0]["id"] == "c0ffee000001"
+        assert containers[0]["name"] == "test_container_1"
         assert containers[0]["status"] == "running"
-        assert containers[1]["id"] == "test_container_2"
+        assert containers[1]["id"] == "c0ffee000002"
         assert containers[1]["status"] == "exited"
+        assert containers[0]["ports"] == "8080:80/tcp"
         
-        # Проверяем, что был вызван метод list
-        mock_docker_client.containers.list.assert_called_once()
+        # Сводка /containers/json запрашивается один раз, без inspect на контейнер
+        mock_docker_client.api.containers.assert_called_once_with(all=True)
+        mock_docker_client.containers.list.assert_not_called()
+        mock_docker_client.containers.get.assert_not_called()
+        
+    def test_get_containers_with_filters(self, mock_docker_client):
+        """Тест: фильтры передаются демону"""
+        api = docker_api.DockerAPI()
+        api.get_containers(filters={"status": ["running"]})
+        
+        mock_docker_client.api.containers.assert_called_once_with(all=True, filters={"status": ["running"]})
+        
+    def test_get_containers_relations(self, mock_docker_client):
+        """Тест: образ, именованные тома и сети контейнера берутся из сводки"""
+        summary = mock_docker_client.api.containers.return_value[0]
+        mock_docker_client.api.containers.return_value = [dict(
+            summary,
+            ImageID="sha256:" + "a" * 64,
+            Mounts=[
+                {"Type": "volume", "Name": "data", "Destination": "/data"},
+                {"Type": "bind", "Source": "/etc/hosts", "Destination": "/etc/hosts"},
+            ],
+            NetworkSettings={"Networks": {"bridge": {"NetworkID": "1" * 64}}},
+        )]
+        api = docker_api.DockerAPI()
+        container = api.get_containers()[0]
+        
+        assert container["ImageID"] == "a" * 12
+        assert container["VolumeNames"] == ["data"]
+        assert container["NetworkIDs"] == ["1" * 12]
+        
+    def test_get_containers_resolves_image_tags_with_single_listing(self, mock_docker_client):
+        """Тест: теги образов по ID разрешаются одним запросом списка образов"""
+        summary = mock_docker_client.api.containers.return_value[1]
+        mock_docker_client.api.containers.return_value = [
+            dict(summary, Id=f"{index:012d}" + "0" * 52) for index in range(50)
+        ]
+        api = docker_api.DockerAPI()
+        containers = api.get_containers()
+        
+        assert len(containers) == 50
+        assert all(c["image"] == "test_image2:latest" for c in containers)
+        mock_docker_client.api.images.assert_called_once()
+        mock_docker_client.images.get.assert_not_called()
+        
+    def test_get_containers_without_tags_uses_short_image_id(self, mock_docker_client):
+        """Тест: образ без тегов отображается коротким ID"""
+        mock_docker_client.api.images.return_value = []
+        api = docker_api.DockerAPI()
+        containers = api.get_containers()
+        
+        assert containers[0]["image"] == "test_image:latest"
+        assert containers[1]["image"] == "sha256:" + "b" * 12
         
     def test_get_images(self, mock_docker_client):
         """Тест получения списка образов"""
@@ -34,12 +87,29 @@ class TestDockerAPI:
         images = api.get_images()
         
         assert len(images) == 2
-        assert images[0]["id"] == "test_image_1"
+        assert images[0]["id"] == "a" * 12
         assert images[0]["repository"] == "test_image"
-        assert images[1]["id"] == "test_image_2"
+        assert images[0]["tag"] == "latest"
+        assert images[0]["created"] == "2024-01-01T00:00:00Z"
+        assert images[1]["id"] == "b" * 12
         assert images[1]["repository"] == "test_image2"
         
-        mock_docker_client.images.list.assert_called_once()
+        mock_docker_client.api.images.assert_called_once()
+        mock_docker_client.images.list.assert_not_called()
+        
+    def test_get_images_keeps_registry_port(self, mock_docker_client):
+        """Тест разбора тега с портом реестра"""
+        mock_docker_client.api.images.return_value = [
+            {"Id": "sha256:" + "c" * 64, "RepoTags": ["registry:5000/team/app"], "Size": 1, "Created": 0},
+            {"Id": "sha256:" + "d" * 64, "RepoTags": ["<none>:<none>"], "Size": 1, "Created": 0}
+        ]
+        api = docker_api.DockerAPI()
+        images = api.get_images()
+        
+        assert images[0]["repository"] == "registry:5000/team/app"
+        assert images[0]["tag"] == "latest"
+        assert images[1]["repository"] == "<none>"
+        assert images[1]["RepoTags"] == ["<none>"]
         
     def test_get_networks(self, mock_docker_client):
         """Тест получения списка сетей"""
@@ -47,12 +117,13 @@ class TestDockerAPI:
         networks = api.get_networks()
         
         assert len(networks) == 2
-        assert networks[0]["id"] == "test_network_1"
+        assert networks[0]["id"] == "0e7e00000001"
         assert networks[0]["name"] == "bridge"
-        assert networks[1]["id"] == "test_network_2"
+        assert networks[1]["id"] == "0e7e00000002"
         assert networks[1]["name"] == "test_network"
         
-        mock_docker_client.networks.list.assert_called_once()
+        mock_docker_client.api.networks.assert_called_once()
+        mock_docker_client.networks.list.assert_not_called()
         
     def test_get_volumes(self, mock_docker_client):
         """Тест получения списка томов"""
@@ -62,9 +133,59 @@ class TestDockerAPI:
         assert len(volumes) == 2
         assert volumes[0]["name"] == "test_volume_1"
         assert volumes[1]["name"] == "test_volume_2"
+        assert volumes[0]["driver"] == "local"
         
-        mock_docker_client.volumes.list.assert_called_once()
-        
+        mock_docker_client.api.volumes.assert_called_once()
+        mock_docker_client.volumes.list.assert_not_called()
+
+    def test_get_container_single_summary(self, mock_docker_client):
+        """Тест: один контейнер читается отфильтрованной сводкой без списка образов"""
+        summary = mock_docker_client.api.containers.return_value[1]
+        mock_docker_client.api.containers.return_value = [summary]
+        mock_docker_client.api.inspect_image.return_value = {"RepoTags": ["test_image2:latest"]}
+        api = docker_api.DockerAPI()
+
+        container = api.get_container(summary["Id"])
+
+        assert container["id"] == "c0ffee000002"
+        assert container["image"] == "test_image2:latest"
+        mock_docker_client.api.containers.assert_called_once_with(all=True, filters={"id": summary["Id"]})
+        mock_docker_client.api.images.assert_not_called()
+
+    def test_get_container_missing(self, mock_docker_client):
+        """Тест: удалённый контейнер возвращает None"""
+        mock_docker_client.api.containers.return_value = []
+        api = docker_api.DockerAPI()
+
+        assert api.get_container("c0ffee000003") is None
+
+    def test_get_container_error_raises(self, mock_docker_client):
+        """Тест: ошибка запроса контейнера не выдаётся за его удаление"""
+        mock_docker_client.api.containers.side_effect = ConnectionError("daemon down")
+        api = docker_api.DockerAPI()
+
+        with pytest.raises(ConnectionError):
+            api.get_container("c0ffee000003")
+
+    def test_get_image_missing(self, mock_docker_client):
+        """Тест: удалённый образ возвращает None"""
+        mock_docker_client.api.inspect_image.side_effect = docker_api.docker.errors.NotFound("gone")
+        api = docker_api.DockerAPI()
+
+        assert api.get_image("sha256:" + "c" * 64) is None
+
+    def test_get_events_filters_tracked_types(self, mock_docker_client):
+        """Тест: поток событий открывается с since и фильтром типов"""
+        api = docker_api.DockerAPI()
+
+        api.get_events(since="1704067200.000000000")
+
+        mock_docker_client.api.events.assert_called_once_with(
+            since="1704067200.000000000",
+            decode=True,
+            filters={"type": ["container", "image", "network", "volume"]}
+        )
+
     def test_stop_container(self, mock_docker_client):
         """Тест остановки контейнера"""
         api = docker_api.DockerAPI()
@@ -359,4 +480,21 @@ class TestDockerAPI:
         
         assert result["test_image_1"] is True
         assert result["test_image_2"] is False
-        assert mock_docker_client.images.remove.call_count == 2 
\ No newline at end of file
+        assert mock_docker_client.images.remove.call_count == 2
+
+    def test_batch_runs_on_shared_executor_without_deadlock(self, mock_docker_client):
+        """Тест: пакетная операция из потока общего пула не блокируется"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        api = docker_api.DockerAPI(max_workers=4, executor=executor)
+        container_ids = [f"container_{index}" for index in range(50)]
+        
+        # Единственный поток пула занят самой пакетной операцией
+        result = executor.submit(api.stop_containers, container_ids).result(timeout=10)
+        
+        assert result == {container_id: True for container_id in container_ids}
+        assert mock_docker_client.containers.get.call_count == 50
+        api.__del__()
+        assert not executor._shutdown
+        executor.shutdown()
@@ -0,0 +1,94 @@
+"""
+Unit тесты для компактных записей ресурсов Docker
+"""
+import copy
+import pickle
+
+import pytest
+
+from docker_records import ContainerRecord, ImageRecord, NetworkRecord, VolumeRecord
+
+
+@pytest.fixture
+def container():
+    return ContainerRecord(
+        id="c0ffee000001",
+        name="web",
+        image="nginx:latest",
+        status="running",
+        ports=("8080:80/tcp", "8443:443/tcp")
+    )
+
+
+class TestRecords:
+    """Тесты для классов записей"""
+
+    def test_legacy_keys(self, container):
+        """Тест: прежние ключи словаря читают одно поле"""
+        assert container["Id"] == container["id"] == "c0ffee000001"
+        assert container["Names"] == ["web"]
+        assert container["State"] == container["Status"] == container["status"] == "running"
+        assert container["Ports"] == ["8080:80/tcp", "8443:443/tcp"]
+        assert container["ports"] == "8080:80/tcp, 8443:443/tcp"
+        assert container.get("SizeRw", 0) == 0
+        assert "Image" in container and "Labels" not in container
+        with pytest.raises(KeyError):
+            container["Labels"]
+
+    def test_equals_legacy_dict(self, container):
+        """Тест: запись сравнивается со словарём прежнего формата"""
+        assert container == {
+            "Id": "c0ffee000001", "id": "c0ffee000001", "Names": ["web"], "name": "web",
+            "Image": "nginx:latest", "image": "nginx:latest", "State": "running",
+            "Status": "running", "status": "running",
+            "Ports": ["8080:80/tcp", "8443:443/tcp"], "ports": "8080:80/tcp, 8443:443/tcp"
+        }
+        assert container.copy() == dict(container)
+
+    def test_immutable(self, container):
+        """Тест: записи неизменяемы, изменения дают новую запись"""
+        with pytest.raises(AttributeError):
+            container.status = "exited"
+        with pytest.raises(TypeError):
+            container["status"] = "exited"
+
+        stopped = container.replace(status="exited")
+        assert stopped["status"] == "exited"
+        assert container["status"] == "running"
+        assert stopped["ports"] == container["ports"]
+
+    def test_no_instance_dict(self):
+        """Тест: записи хранят поля только в __slots__"""
+        for record in (
+            ContainerRecord("c0ffee000001", "web", "nginx", "running"),
+            ImageRecord("a" * 12, "nginx", "latest", 1, ""),
+            NetworkRecord("0e7e00000001", "bridge", "bridge", "local"),
+            VolumeRecord("data", "local", "/var/lib/docker/volumes/data/_data"),
+        ):
+            assert not hasattr(record, "__dict__")
+
+    def test_repeated_values_interned(self):
+        """Тест: повторяющиеся строки разделяют один объект"""
+        first = NetworkRecord("0e7e00000001", "a", "".join(["bri", "dge"]), "local")
+        second = NetworkRecord("0e7e00000002", "b", "".join(["br", "idge"]), "local")
+        assert first.driver is second.driver
+
+    def test_labels(self):
+        """Тест: метки хранятся кортежем пар и читаются прежним ключом Labels"""
+        labels = {"com.docker.compose.project": "shop", "tier": "front"}
+        first = ContainerRecord("c0ffee000001", "web", "nginx", "running", labels=labels)
+        second = ContainerRecord("c0ffee000002", "db", "nginx", "running", labels=dict(labels))
+
+        assert first["Labels"] == labels and "Labels" in first
+        assert first.labels[0][0] is second.labels[0][0]
+        assert first == {**dict(first), "Labels": labels}
+
+    def test_image_without_tags(self):
+        """Тест: образ без тегов отдаёт прежний RepoTags"""
+        image = ImageRecord("a" * 12, "<none>", "<none>", 1, "")
+        assert image["RepoTags"] == ["<none>"]
+
+    def test_copy_and_pickle(self, container):
+        """Тест: записи копируются и сериализуются"""
+        assert copy.copy(container) == container
+        assert pickle.loads(pickle.dumps(container)) == container
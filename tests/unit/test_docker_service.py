@@ -0,0 +1,166 @@
+"""
+Unit тесты для сервиса Docker
+"""
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.cache_policy import CachePolicy
+from services.docker_service import DockerService
+
+
+def _wait_for(predicate, timeout=5):
+    """Ждёт, пока колбэки Future отработают в потоке планировщика"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def main_loop_events():
+    """Подменяет GLib.idle_add: уведомления записываются по мере поступления"""
+    events = []
+    lock = threading.Lock()
+
+    def idle_add(func, *args):
+        with lock:
+            events.append(args[0] if args else func.__name__)
+            func(*args)
+
+    with patch("services.docker_service.GLib") as glib, \
+            patch("services.docker_service.performance_monitor") as monitor:
+        glib.idle_add.side_effect = idle_add
+        yield events, monitor
+
+
+class TestDockerService:
+    """Тесты для класса DockerService"""
+
+    def test_get_listing_shares_concurrent_calls(self):
+        """Тест: одновременные запросы одного списка идут к демону один раз"""
+        release = threading.Event()
+        api = MagicMock()
+        api.get_images.side_effect = lambda: release.wait(5) and ["image"]
+        service = DockerService(api)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(service.get_images())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == [["image"]] * 5
+        api.get_images.assert_called_once()
+
+    def test_refresh_all_streams_each_listing(self, main_loop_events):
+        """Тест: списки запрашиваются параллельно и отдаются по мере готовности"""
+        events, monitor = main_loop_events
+        release_images = threading.Event()
+        api = MagicMock()
+        api.get_containers.return_value = ["container"]
+        api.get_networks.return_value = ["network"]
+        api.get_volumes.return_value = ["volume"]
+        api.get_images.side_effect = lambda: release_images.wait(5) and ["image"]
+        service = DockerService(api)
+        received = {}
+        service.add_callback(lambda event_type, data: received.setdefault(event_type, data))
+
+        service.refresh_all_data()
+
+        # Медленный список образов не задерживает остальные
+        assert _wait_for(lambda: {"containers_refreshed", "networks_refreshed", "volumes_refreshed"} <= set(received))
+        assert received["containers_refreshed"] == ["container"]
+        assert "images_refreshed" not in received
+        assert "all_data_refreshed" not in received
+
+        release_images.set()
+        assert _wait_for(lambda: "all_data_refreshed" in received)
+        assert received["images_refreshed"] == ["image"]
+        assert events[-1] == "all_data_refreshed"
+        timers = {call.args[0] for call in monitor.start_timer.call_args_list}
+        assert timers == {"refresh_containers", "refresh_images", "refresh_networks", "refresh_volumes"}
+
+    def test_refresh_all_reports_failed_listing(self, main_loop_events):
+        """Тест: ошибка одного списка не прерывает остальные"""
+        api = MagicMock()
+        api.get_containers.side_effect = ConnectionError("daemon down")
+        api.get_images.return_value = []
+        api.get_networks.return_value = []
+        api.get_volumes.return_value = []
+        service = DockerService(api)
+        received = []
+        service.add_callback(lambda event_type, data: received.append(event_type))
+
+        service.refresh_all_data()
+
+        assert _wait_for(lambda: "all_data_refreshed" in received)
+        assert "refresh_error" in received
+        assert {"images_refreshed", "networks_refreshed", "volumes_refreshed"} <= set(received)
+        assert received[-1] == "all_data_refreshed"
+
+    def test_stale_listing_served_while_revalidating(self, main_loop_events):
+        """Тест: устаревший список отдаётся сразу и перепроверяется в фоне"""
+        release = threading.Event()
+        api = MagicMock()
+        api.get_images.return_value = ["old"]
+        service = DockerService(api)
+        service.set_cache_policy("images", CachePolicy(revalidate_interval=10, max_staleness=60))
+        received = {}
+        service.add_callback(lambda event_type, data: received.setdefault(event_type, data))
+
+        assert service.get_images() == ["old"]
+        service._last_cache_update["images"] -= 30
+        api.get_images.side_effect = lambda: release.wait(5) and ["new"]
+
+        # Демон ещё не ответил, а оба вызова уже вернули старые данные
+        assert service.get_images() == ["old"]
+        assert service.get_images() == ["old"]
+        release.set()
+
+        assert _wait_for(lambda: "images_revalidated" in received)
+        assert received["images_revalidated"] == ["new"]
+        assert service.get_images() == ["new"]
+        assert api.get_images.call_count == 2
+
+    def test_expired_listing_waits_for_daemon(self):
+        """Тест: просроченный список загружается заново"""
+        api = MagicMock()
+        api.get_volumes.side_effect = [["old"], ["new"]]
+        service = DockerService(api)
+        service.set_cache_policy("volumes", CachePolicy(revalidate_interval=10, max_staleness=60))
+
+        assert service.get_volumes() == ["old"]
+        service._last_cache_update["volumes"] -= 60
+
+        assert service.get_volumes() == ["new"]
+
+    def test_container_action_patches_cached_listing(self):
+        """Тест: после действия контейнер перечитывается точечно, список не запрашивается заново"""
+        api = MagicMock()
+        api.get_containers.return_value = [{"Id": "c1", "State": "exited"}, {"Id": "c2", "State": "running"}]
+        api.get_container.return_value = {"Id": "c1", "State": "running"}
+        service = DockerService(api)
+        listing = service.get_containers()
+
+        assert service.start_container("c1") == {"Id": "c1", "State": "running"}
+        service.delete_container("c2")
+
+        assert service.get_containers() == [{"Id": "c1", "State": "running"}]
+        assert listing[0]["State"] == "exited"
+        api.get_containers.assert_called_once()
+        api.get_container.assert_called_once_with("c1")
+
+    def test_failed_container_action_raises(self):
+        """Тест: отказ DockerAPI (False) превращается в исключение"""
+        api = MagicMock()
+        api.stop_container.return_value = False
+        service = DockerService(api)
+
+        with pytest.raises(RuntimeError):
+            service.stop_container("c1")
+        api.get_container.assert_not_called()
@@ -0,0 +1,66 @@
+"""
+Unit тесты для кэша высот на дереве Фенвика
+"""
+import random
+
+from ui.components.height_cache import HeightCache
+
+
+def _offsets(heights):
+    offsets = [0]
+    for height in heights:
+        offsets.append(offsets[-1] + height)
+    return offsets
+
+
+class TestHeightCache:
+    """Тесты для класса HeightCache"""
+
+    def test_estimates_until_measured(self):
+        """Тест: неизмеренные элементы имеют оценочную высоту"""
+        cache = HeightCache(50)
+        cache.reset(100)
+
+        assert cache.total == 5000
+        assert cache.get_offset(10) == 500
+        assert cache.get_index_at(525) == 10
+        assert not cache.is_measured(10)
+
+    def test_matches_prefix_sums(self):
+        """Тест: смещения и поиск по смещению совпадают с прямым подсчётом"""
+        rng = random.Random(7)
+        cache = HeightCache(40)
+        cache.reset(1000)
+        heights = [40] * 1000
+        for _ in range(600):
+            index = rng.randrange(1000)
+            heights[index] = rng.randint(10, 200)
+            cache.set(index, heights[index])
+
+        offsets = _offsets(heights)
+        for index in range(0, 1001, 37):
+            assert cache.get_offset(index) == offsets[index]
+        for _ in range(500):
+            offset = rng.randrange(offsets[-1])
+            index = cache.get_index_at(offset)
+            assert offsets[index] <= offset < offsets[index + 1]
+        assert cache.get_index_at(offsets[-1] + 100) == 999
+        assert cache.get_index_at(-5) == 0
+
+    def test_set_returns_change(self):
+        """Тест: повторное измерение возвращает изменение высоты"""
+        cache = HeightCache(60)
+        cache.reset(3)
+
+        assert cache.set(1, 90) == 30
+        assert cache.set(1, 90) == 0
+        assert cache.get_offset(2) == 150
+        assert cache.get_measured_mean() == 90
+
+    def test_reset_keeps_known_heights(self):
+        """Тест: известные высоты и новая оценка применяются при сбросе"""
+        cache = HeightCache(60)
+        cache.reset(4, {0: 100, 3: 20}, estimate=80)
+
+        assert [cache.get(index) for index in range(4)] == [100, 80, 80, 20]
+        assert cache.total == 280
@@ -0,0 +1,198 @@
+"""
+Unit тесты для упреждающей загрузки разделов
+"""
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.cache_policy import CachePolicy
+from core.scheduler import Priority
+from services.prefetch_service import PrefetchService
+
+
+@pytest.fixture
+def idle():
+    """Подменяет GLib и планировщик: обработчики копятся до явного вызова"""
+    pending = {}
+    ids = iter(range(1, 10000))
+
+    def add(func, *args, **kwargs):
+        source_id = next(ids)
+        pending[source_id] = (func, args)
+        return source_id
+
+    with patch("services.prefetch_service.GLib") as glib, \
+            patch("services.prefetch_service.scheduler") as scheduler:
+        glib.idle_add.side_effect = add
+        glib.timeout_add.side_effect = lambda interval, func, *args: add(func, *args)
+        glib.source_remove.side_effect = lambda source_id: pending.pop(source_id, None)
+        scheduler.has_capacity.return_value = True
+        yield pending, scheduler
+
+
+def _run_idle(pending):
+    """Выполняет все ожидающие обработчики, включая добавленные по ходу"""
+    while pending:
+        source_id = min(pending)
+        func, args = pending.pop(source_id)
+        func(*args)
+
+
+def _manager(state=CachePolicy.EXPIRED):
+    manager = MagicMock()
+    manager.get_cache_state.return_value = state
+    manager.futures = []
+
+    def refresh(priority=None):
+        future = Future()
+        manager.futures.append(future)
+        return future
+
+    manager.refresh.side_effect = refresh
+    return manager
+
+
+def _service(**states):
+    managers = {
+        section: _manager(states.get(section, CachePolicy.EXPIRED))
+        for section in ("containers", "images", "networks", "volumes")
+    }
+    return PrefetchService(managers), managers
+
+
+class TestPrefetchService:
+    """Тесты для класса PrefetchService"""
+
+    def test_learns_from_navigation_history(self, idle):
+        """Тест: после Dashboard -> Images загружаются образы"""
+        pending, _ = idle
+        prefetch, managers = _service()
+        prefetch.record_navigation("dashboard")
+        assert not pending  # Истории ещё нет
+
+        prefetch.record_navigation("images")
+        prefetch.record_navigation("dashboard")
+        assert prefetch.predict() == ["images"]
+
+        _run_idle(pending)
+        managers["images"].refresh.assert_called_once_with(priority=Priority.BACKGROUND)
+        managers["containers"].refresh.assert_not_called()
+
+    def test_recent_transitions_dominate(self, idle):
+        """Тест: старые переходы затухают"""
+        prefetch, _ = _service()
+        for section in ("dashboard", "images", "dashboard", "volumes", "dashboard", "volumes", "dashboard"):
+            prefetch.record_navigation(section)
+
+        assert prefetch.predict() == ["volumes", "images"]
+
+    def test_hover_comes_first(self, idle):
+        """Тест: наведение на кнопку поднимает раздел в начало"""
+        pending, _ = idle
+        prefetch, managers = _service()
+        prefetch.record_navigation("dashboard")
+        prefetch.record_navigation("images")
+        prefetch.record_navigation("dashboard")
+
+        prefetch.hover("networks")
+        assert prefetch.predict() == ["networks", "images"]
+        _run_idle(pending)
+        managers["networks"].refresh.assert_called_once()
+        managers["images"].refresh.assert_not_called()  # Ждёт завершения первой загрузки
+
+        prefetch.unhover("networks")
+        assert prefetch.predict() == ["images"]
+
+    def test_bounded_and_sequential(self, idle):
+        """Тест: не больше одной загрузки одновременно и двух разделов за переход"""
+        pending, _ = idle
+        prefetch, managers = _service()
+        prefetch.record_navigation("dashboard")
+        for section in ("containers", "images", "networks"):
+            prefetch.record_navigation(section)
+            prefetch.record_navigation("dashboard")
+
+        _run_idle(pending)
+        started = [section for section, manager in managers.items() if manager.refresh.called]
+        assert len(started) == 1
+
+        managers[started[0]].futures[0].set_result([])
+        _run_idle(pending)
+        started = [section for section, manager in managers.items() if manager.refresh.called]
+        assert len(started) == 2
+
+        for section in started:
+            for future in managers[section].futures:
+                if not future.done():
+                    future.set_result([])
+        _run_idle(pending)
+        assert sum(manager.refresh.call_count for manager in managers.values()) == 2
+        assert prefetch.get_stats()['prefetches'] == 2
+
+    def test_fresh_sections_skipped(self, idle):
+        """Тест: свежий кэш не перезагружается"""
+        pending, _ = idle
+        prefetch, managers = _service(images=CachePolicy.FRESH)
+        prefetch.record_navigation("dashboard")
+        prefetch.hover("images")
+
+        _run_idle(pending)
+        managers["images"].refresh.assert_not_called()
+
+    def test_waits_for_foreground_work(self, idle):
+        """Тест: пока планировщик занят, загрузка откладывается"""
+        pending, scheduler = idle
+        prefetch, managers = _service()
+        prefetch.record_navigation("dashboard")
+        scheduler.has_capacity.return_value = False
+        prefetch.hover("images")
+
+        func, args = pending.pop(min(pending))
+        func(*args)
+        managers["images"].refresh.assert_not_called()
+        assert len(pending) == 1  # Повтор по таймеру
+
+        scheduler.has_capacity.return_value = True
+        _run_idle(pending)
+        managers["images"].refresh.assert_called_once()
+
+    def test_navigation_cancels_pending(self, idle):
+        """Тест: переход отменяет ещё не начатую загрузку"""
+        pending, _ = idle
+        prefetch, managers = _service()
+        prefetch.record_navigation("dashboard")
+        prefetch.hover("images")
+        assert pending
+
+        prefetch.record_navigation("containers")
+        _run_idle(pending)
+        managers["images"].refresh.assert_not_called()
+        assert prefetch.get_stats()['cancelled'] >= 1
+
+    def test_pause_and_resume(self, idle):
+        """Тест: при свёрнутом окне ничего не загружается"""
+        pending, _ = idle
+        prefetch, managers = _service()
+        prefetch.record_navigation("dashboard")
+        prefetch.pause()
+        prefetch.hover("images")
+        _run_idle(pending)
+        managers["images"].refresh.assert_not_called()
+
+        prefetch.resume()
+        _run_idle(pending)
+        managers["images"].refresh.assert_called_once()
+
+    def test_hit_counted(self, idle):
+        """Тест: открытие прогретого раздела считается попаданием"""
+        pending, _ = idle
+        prefetch, managers = _service()
+        prefetch.record_navigation("dashboard")
+        prefetch.hover("images")
+        _run_idle(pending)
+        managers["images"].futures[0].set_result([])
+        managers["images"].get_cache_state.return_value = CachePolicy.FRESH
+
+        prefetch.record_navigation("images")
+        assert prefetch.get_stats()['hits'] == 1
@@ -0,0 +1,84 @@
+"""
+Unit тесты для языка запросов к ресурсам
+"""
+import pytest
+
+from core.query import QueryError, QueryField, compile_query, label_field
+from resources.containers import ContainerManager
+from resources.images import ImageManager
+
+
+CONTAINERS = [
+    {"Id": "a", "Names": ["web"], "Image": "nginx:latest", "State": "running",
+     "Labels": {"team": "core", "tier": "front"}},
+    {"Id": "b", "Names": ["cache"], "Image": "redis:7", "State": "exited",
+     "Labels": {"team": "data"}},
+    {"Id": "c", "Names": ["proxy"], "Image": "nginx:alpine", "State": "exited", "Labels": None},
+]
+
+
+def _select(query, fields=ContainerManager.QUERY_FIELDS):
+    compiled = compile_query(query, fields)
+    return [container["Id"] for container in CONTAINERS if compiled.matches(container)]
+
+
+class TestCompileQuery:
+    """Тесты для компиляции запросов"""
+
+    def test_field_terms(self):
+        """Тест: термы полей становятся предикатами, остальное — свободным текстом"""
+        compiled = compile_query("status:running image:nginx* label:team=core Web", ContainerManager.QUERY_FIELDS)
+
+        assert compiled.text == "web"
+        assert [compiled.matches(container) for container in CONTAINERS] == [True, False, False]
+
+    def test_glob_case_and_negation(self):
+        """Тест: шаблоны, регистр и отрицание"""
+        assert _select("image:NGINX*") == ["a", "c"]
+        assert _select("image:nginx") == []
+        assert _select("-status:running") == ["b", "c"]
+        assert _select("label:team") == ["a", "b"]
+        assert _select("label:team=d*") == ["b"]
+        assert _select("-label:team") == ["c"]
+
+    def test_daemon_filters(self):
+        """Тест: демону передаются только точные термы, которые он понимает"""
+        compiled = compile_query(
+            "status:Running image:nginx label:team=core label:tier=f* -name:web name:proxy",
+            ContainerManager.QUERY_FIELDS
+        )
+
+        assert compiled.daemon_filters == {
+            "status": ["running"],
+            "label": ["team", "tier"],
+            "name": ["proxy"],
+        }
+        assert compile_query("status:up", ContainerManager.QUERY_FIELDS).daemon_filters == {}
+        assert compile_query("name:Web", ContainerManager.QUERY_FIELDS).daemon_filters == {}
+
+    def test_label_value_matched_on_client(self):
+        """Тест: значение метки сравнивается на клиенте без учёта регистра"""
+        compiled = compile_query("label:team=Core", ContainerManager.QUERY_FIELDS)
+
+        assert compiled.daemon_filters == {"label": ["team"]}
+        assert compiled.matches({"Labels": {"team": "core"}})
+
+    def test_bool_field(self):
+        """Тест: логические поля принимают true/false и отклоняют другие значения"""
+        compiled = compile_query("dangling:yes", ImageManager.QUERY_FIELDS)
+
+        assert compiled.daemon_filters == {"dangling": ["true"]}
+        assert compiled.matches({"RepoTags": ["<none>:<none>"]})
+        assert not compiled.matches({"RepoTags": ["nginx:latest"]})
+        with pytest.raises(QueryError):
+            compile_query("dangling:maybe", ImageManager.QUERY_FIELDS)
+
+    def test_unknown_fields_and_quotes(self):
+        """Тест: неизвестные поля и незакрытые кавычки остаются текстом"""
+        fields = {"label": label_field(), "name": QueryField(lambda resource: resource.get("Name"))}
+
+        assert compile_query("redis:7", fields).text == "redis:7"
+        assert compile_query('name:"my app"', fields).matches({"Name": "My App"})
+        assert compile_query('name:"my', fields).text == ""
+        with pytest.raises(QueryError):
+            compile_query("label:=x", fields)
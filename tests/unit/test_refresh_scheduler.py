@@ -0,0 +1,109 @@
+"""
+Unit тесты для адаптивного планировщика опроса
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.cache_policy import CachePolicy
+from services.refresh_scheduler import RefreshScheduler
+
+
+@pytest.fixture
+def timers():
+    """Подменяет GLib: таймеры копятся до явного срабатывания"""
+    pending = {}
+    ids = iter(range(1, 10000))
+
+    def timeout_add(interval, func, *args):
+        timer_id = next(ids)
+        pending[timer_id] = (interval, func, args)
+        return timer_id
+
+    with patch("services.refresh_scheduler.GLib") as glib:
+        glib.timeout_add.side_effect = timeout_add
+        glib.source_remove.side_effect = lambda timer_id: pending.pop(timer_id, None)
+        yield pending
+
+
+def _fire(timers):
+    """Срабатывают все ожидающие таймеры"""
+    for timer_id in list(timers):
+        _, func, args = timers.pop(timer_id)
+        func(*args)
+
+
+def _manager():
+    manager = MagicMock()
+    manager.change_count = 0
+    manager.get_cache_state.return_value = CachePolicy.STALE
+    return manager
+
+
+class TestRefreshScheduler:
+    """Тесты для класса RefreshScheduler"""
+
+    def test_interval_follows_change_rate(self, timers):
+        """Тест: изменения ускоряют опрос, тишина замедляет до границ"""
+        manager = _manager()
+        policy = CachePolicy(revalidate_interval=12, max_staleness=300)
+        clear_cache = MagicMock()
+        refresh_scheduler = RefreshScheduler(clear_cache=clear_cache)
+        refresh_scheduler.register("containers", manager, policy)
+        refresh_scheduler.set_visible(["containers"])
+        assert [interval for interval, _, _ in timers.values()] == [12000]
+
+        manager.change_count = 3
+        _fire(timers)
+        assert refresh_scheduler.get_interval("containers") == 6
+        assert policy.revalidate_interval == 6
+        clear_cache.assert_called_once_with("containers")
+        manager.invalidate_cache.assert_called_once()
+        manager.refresh.assert_called_once()
+
+        for _ in range(2):
+            manager.change_count += 1
+            _fire(timers)
+        assert refresh_scheduler.get_interval("containers") == 4  # Нижняя граница: треть начального
+        for _ in range(20):
+            _fire(timers)
+        assert refresh_scheduler.get_interval("containers") == 96  # Верхняя граница: восемь начальных
+        assert 0 < refresh_scheduler.get_stats()["containers"]["change_rate"] < 1
+
+    def test_hidden_sections_back_off(self, timers):
+        """Тест: скрытый раздел опрашивается реже, но не реже max_staleness"""
+        refresh_scheduler = RefreshScheduler()
+        refresh_scheduler.register("images", _manager(), CachePolicy(60, max_staleness=1800))
+        refresh_scheduler.register("volumes", _manager(), CachePolicy(120, max_staleness=300))
+        refresh_scheduler.set_visible(["images"])
+
+        assert refresh_scheduler.get_interval("images") == 60
+        assert refresh_scheduler.get_interval("volumes") == 300
+        assert sorted(interval for interval, _, _ in timers.values()) == [60000, 300000]
+
+    def test_pause_and_resume(self, timers):
+        """Тест: без фокуса опроса нет; при возврате видимый раздел обновляется сразу"""
+        visible, hidden = _manager(), _manager()
+        refresh_scheduler = RefreshScheduler()
+        refresh_scheduler.register("containers", visible, CachePolicy(15))
+        refresh_scheduler.register("images", hidden, CachePolicy(60))
+        refresh_scheduler.set_visible(["containers"])
+
+        refresh_scheduler.pause()
+        assert timers == {}
+
+        refresh_scheduler.resume()
+        visible.refresh.assert_called_once()
+        hidden.refresh.assert_not_called()
+        assert len(timers) == 2
+
+    def test_live_types_are_not_polled(self, timers):
+        """Тест: типы, которые ведёт поток событий, не опрашиваются"""
+        manager = _manager()
+        refresh_scheduler = RefreshScheduler(is_live=lambda kind: kind == "containers")
+        refresh_scheduler.register("containers", manager, CachePolicy(15))
+
+        _fire(timers)
+
+        manager.refresh.assert_not_called()
+        assert len(timers) == 1
@@ -0,0 +1,122 @@
+"""
+Unit тесты для графа связей между ресурсами
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.relation_graph import RelationGraph
+from docker_records import ContainerRecord, ImageRecord, NetworkRecord, VolumeRecord
+from resources.containers import ContainerManager
+from resources.images import ImageManager
+from resources.networks import NetworkManager
+from resources.volumes import VolumeManager
+
+
+def _load(manager, method, resources):
+    """Загружает снимок так же, как поток обновления"""
+    getattr(manager.docker_api, method).return_value = resources
+    manager._run_refresh()
+    manager._on_refresh_complete()
+
+
+@pytest.fixture
+def graph():
+    containers = ContainerManager(MagicMock())
+    images = ImageManager(MagicMock())
+    volumes = VolumeManager(MagicMock())
+    networks = NetworkManager(MagicMock())
+
+    _load(images, "get_images", [
+        ImageRecord("aaaaaaaaaaaa", "nginx", "latest", 100, "", ("nginx:latest",)),
+        ImageRecord("bbbbbbbbbbbb", "redis", "7", 50, "", ("redis:7",)),
+        ImageRecord("cccccccccccc", "<none>", "<none>", 10, ""),
+        ImageRecord("dddddddddddd", "<none>", "<none>", 10, ""),
+    ])
+    _load(volumes, "get_volumes", [
+        VolumeRecord("data", "local", "/var/lib/docker/volumes/data"),
+        VolumeRecord("cache", "local", "/var/lib/docker/volumes/cache"),
+    ])
+    _load(networks, "get_networks", [
+        NetworkRecord("111111111111", "bridge", "bridge", "local"),
+        NetworkRecord("222222222222", "backend", "bridge", "local"),
+        NetworkRecord("333333333333", "frontend", "bridge", "local"),
+    ])
+    _load(containers, "get_containers", [
+        ContainerRecord("c1", "web", "nginx:latest", "running", image_id="aaaaaaaaaaaa",
+                        volumes=("data",), networks=("111111111111", "222222222222")),
+        ContainerRecord("c2", "worker", "nginx:latest", "exited", image_id="aaaaaaaaaaaa",
+                        volumes=("data",), networks=("222222222222",)),
+        ContainerRecord("c3", "old", "dddddddddddd", "exited", image_id="dddddddddddd"),
+    ])
+
+    relations = RelationGraph(containers, {"images": images, "volumes": volumes, "networks": networks})
+    return relations, containers, images, volumes, networks
+
+
+class TestRelationGraph:
+    """Тесты для класса RelationGraph"""
+
+    def test_used_by(self, graph):
+        """Тест: контейнеры, использующие образ, том и сеть"""
+        relations, _, images, volumes, networks = graph
+
+        assert {container["Id"] for container in images.get_users("aaaaaaaaaaaa")} == {"c1", "c2"}
+        assert volumes.count_users("data") == 2
+        assert networks.count_users("111111111111") == 1
+        assert not relations.is_used("volumes", "cache")
+        assert images.get_users("bbbbbbbbbbbb") == []
+
+    def test_unused_and_counts(self, graph):
+        """Тест: неиспользуемые ресурсы и счётчики для панели"""
+        _, _, images, volumes, networks = graph
+
+        assert [image["Id"] for image in images.get_unused_resources()] == ["bbbbbbbbbbbb", "cccccccccccc"]
+        assert images.get_unused_images_count() == 2
+        assert volumes.get_used_volumes_count() == 1
+        assert volumes.get_unused_volumes_count() == 1
+        assert [network["Name"] for network in networks.get_unused_resources()] == ["frontend"]
+
+    def test_prunable(self, graph):
+        """Тест: что удалит очистка (висячие неиспользуемые образы, пользовательские сети)"""
+        _, containers, images, _, networks = graph
+
+        assert images.get_dangling_images_count() == 2
+        assert images.get_prunable_images_count() == 1
+        assert networks.get_prunable_networks_count() == 1
+        assert containers.get_prunable_containers_count() == 2
+
+    def test_follows_container_snapshot(self, graph):
+        """Тест: связи обновляются вместе со снимком контейнеров"""
+        _, containers, images, volumes, _ = graph
+
+        _load(containers, "get_containers", [
+            ContainerRecord("c1", "web", "redis:7", "running", image_id="bbbbbbbbbbbb", volumes=("cache",)),
+        ])
+
+        assert not images.is_used("aaaaaaaaaaaa")
+        assert images.is_used("bbbbbbbbbbbb")
+        assert volumes.is_used("cache") and not volumes.is_used("data")
+        assert images.get_prunable_images_count() == 2
+
+    def test_volume_status(self, graph):
+        """Тест: статус тома в представлении и фильтр по использованию"""
+        _, _, _, volumes, _ = graph
+
+        assert volumes.format_volume_data(volumes.get_resource("data"))["status_display"] == "Используется (2)"
+        assert volumes.filter({"status": "unused"}) == (volumes.get_resource("cache"),)
+
+    def test_no_graph_reports_nothing_unused(self):
+        """Тест: без графа связей ничего не считается неиспользуемым"""
+        images = ImageManager(MagicMock())
+        volumes = VolumeManager(MagicMock())
+        networks = NetworkManager(MagicMock())
+        _load(images, "get_images", [ImageRecord("cccccccccccc", "<none>", "<none>", 10, "")])
+        _load(volumes, "get_volumes", [VolumeRecord("data", "local", "/var/lib/docker/volumes/data")])
+        _load(networks, "get_networks", [NetworkRecord("222222222222", "backend", "bridge", "local")])
+
+        assert images.get_unused_resources() == []
+        assert images.get_unused_images_count() == 0
+        assert images.get_prunable_images_count() == 0
+        assert volumes.get_unused_volumes_count() == 0
+        assert networks.get_prunable_networks_count() == 0
@@ -0,0 +1,551 @@
+"""
+Unit тесты для базового менеджера ресурсов
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.cache_policy import CachePolicy
+from docker_records import ContainerRecord, ImageRecord, NetworkRecord
+from resources.containers import ContainerManager
+from resources.images import ImageManager
+from resources.networks import NetworkManager
+
+
+def _containers(count, status="running"):
+    return [
+        ContainerRecord(id=f"c{i:011d}", name=f"app-{i}", image="nginx:latest", status=status)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def manager():
+    manager = ContainerManager(MagicMock())
+    events = []
+    manager.add_callback(lambda event_type, data: events.append((event_type, data)))
+    return manager, events
+
+
+def _load(manager, resources):
+    """Загружает снимок так же, как поток обновления, и доставляет события"""
+    manager.docker_api.get_containers.return_value = resources
+    manager._run_refresh()
+    manager._on_refresh_complete()
+
+
+class TestResourceManagerDiff:
+    """Тесты для инкрементального сравнения снимков"""
+
+    def test_first_load_adds_everything(self, manager):
+        """Тест: первая загрузка сообщает обо всех ресурсах как о добавленных"""
+        manager, events = manager
+        containers = _containers(3)
+
+        _load(manager, containers)
+
+        assert events == [("items_added", containers), ("loading_complete", None)]
+
+    def test_one_change_touches_one_item(self, manager):
+        """Тест: изменение одного из 5000 контейнеров даёт одно событие на одну запись"""
+        manager, events = manager
+        containers = _containers(5000)
+        _load(manager, containers)
+        events.clear()
+
+        updated = list(containers)
+        updated[42] = updated[42].replace(status="exited")
+        _load(manager, updated)
+
+        assert events == [("items_changed", [updated[42]]), ("loading_complete", None)]
+        assert manager.change_count == 1  # Первая загрузка изменением не считается
+
+    def test_added_and_removed(self, manager):
+        """Тест: добавленные и удалённые ресурсы определяются по ID"""
+        manager, events = manager
+        containers = _containers(3)
+        _load(manager, containers)
+        events.clear()
+
+        new = ContainerRecord(id="c99999999999", name="new", image="redis", status="created")
+        _load(manager, containers[1:] + [new])
+
+        assert events == [
+            ("items_removed", [containers[0]["Id"]]),
+            ("items_added", [new]),
+            ("loading_complete", None),
+        ]
+
+    def test_unchanged_snapshot_is_silent(self, manager):
+        """Тест: равный снимок из новых объектов не порождает событий изменения"""
+        manager, events = manager
+        _load(manager, _containers(10))
+        events.clear()
+
+        _load(manager, _containers(10))
+
+        assert events == [("loading_complete", None)]
+
+    def test_is_resource_visible(self, manager):
+        """Тест: видимость ресурса учитывает текущий поиск и фильтры"""
+        manager, _ = manager
+        web, db = _containers(2)
+        manager.current_search = "APP-0"
+
+        assert manager.is_resource_visible(web)
+        assert not manager.is_resource_visible(db)
+
+
+class TestResourceManagerIndexes:
+    """Тесты для индексов менеджера ресурсов"""
+
+    def test_lookup_and_counters(self, manager):
+        """Тест: поиск по ID и счётчики берутся из индексов"""
+        manager, _ = manager
+        containers = _containers(3) + [ContainerRecord(id="e00000000001", name="old", image="redis", status="exited")]
+        _load(manager, containers)
+
+        assert manager.get_resource("c00000000001") is containers[1]
+        assert manager.get_resource("missing") is None
+        assert manager.get_running_containers_count() == 3
+        assert manager.get_stopped_containers_count() == 1
+        assert manager.get_containers_by_image("redis") == [containers[-1]]
+        assert manager.get_index_counts('image') == {"nginx:latest": 3, "redis": 1}
+
+    def test_indexes_follow_changes(self, manager):
+        """Тест: индексы обновляются по изменениям между снимками"""
+        manager, _ = manager
+        containers = _containers(3)
+        _load(manager, containers)
+
+        _load(manager, [containers[0].replace(status="exited"), containers[2]])
+
+        assert manager.get_running_containers_count() == 1
+        assert manager.get_stopped_containers_count() == 1
+        assert manager.get_resource(containers[1]["Id"]) is None
+        assert manager.get_resource(containers[0]["Id"])["status"] == "exited"
+
+    def test_label_index(self, manager):
+        """Тест: ключи меток индексируются для каждого ресурса"""
+        manager, _ = manager
+        _load(manager, [
+            {"Id": "a", "State": "running", "Labels": {"com.docker.compose.project": "web", "tier": "front"}},
+            {"Id": "b", "State": "running", "Labels": {"tier": "back"}},
+            {"Id": "c", "State": "created", "Labels": None},
+        ])
+
+        assert [c["Id"] for c in manager.get_indexed_resources('label', "tier")] == ["a", "b"]
+        assert manager.count_indexed_resources('label', "com.docker.compose.project") == 1
+        assert manager.count_indexed_resources('status', "created") == 1
+
+
+class TestImageManagerIndexes:
+    """Тесты для индексов менеджера образов"""
+
+    def test_dangling_and_total_size(self):
+        """Тест: образы без тегов и общий размер считаются без прохода по списку"""
+        manager = ImageManager(MagicMock())
+        manager.docker_api.get_images.return_value = [
+            ImageRecord(id="i1", repository="nginx", tag="latest", size=100, created="", repo_tags=("nginx:latest",)),
+            ImageRecord(id="i2", repository="<none>", tag="<none>", size=50, created=""),
+        ]
+        manager._run_refresh()
+
+        assert manager.get_dangling_images_count() == 1
+        assert manager.get_total_size() == 150
+
+        manager.docker_api.get_images.return_value = manager.resources[:1]
+        manager._run_refresh()
+
+        assert manager.get_dangling_images_count() == 0
+        assert manager.get_total_size() == 100
+
+
+class TestNetworkManagerIndexes:
+    """Тесты для индексов менеджера сетей"""
+
+    def test_builtin_networks_by_name(self):
+        """Тест: встроенные сети определяются по имени"""
+        manager = NetworkManager(MagicMock())
+        manager.docker_api.get_networks.return_value = [
+            NetworkRecord("n1", "bridge", "bridge", "local"),
+            NetworkRecord("n2", "host", "host", "local"),
+            NetworkRecord("n3", "backend", "bridge", "local"),
+        ]
+        manager._run_refresh()
+
+        assert manager.get_builtin_networks_count() == 2
+        assert manager.get_custom_networks_count() == 1
+        assert [n["Name"] for n in manager.filter({"type": "custom"})] == ["backend"]
+        assert [n["Name"] for n in manager.filter({"type": "builtin"})] == ["bridge", "host"]
+        assert manager.format_network_data(manager.get_resource("n1"))["type_display"] == "Встроенная"
+
+
+class TestResourceManagerSearch:
+    """Тесты для поиска по индексу снимка"""
+
+    def test_search_uses_snapshot_index(self, manager):
+        """Тест: поиск идёт по индексу, построенному при загрузке снимка"""
+        manager, _ = manager
+        containers = _containers(30)
+        _load(manager, containers)
+        index = manager._search_index
+
+        assert index is not None and index.resources is manager.resources
+        assert list(manager.search("APP-1")) == [containers[1]] + containers[10:20]
+        assert list(manager.search("app-12")) == [containers[12]]
+        assert manager._search_index is index
+
+    def test_search_matches_labels(self, manager):
+        """Тест: поиск находит ресурсы по меткам"""
+        manager, _ = manager
+        _load(manager, [
+            {"Id": "a", "Names": ["web"], "Labels": {"com.docker.compose.project": "shop"}},
+            {"Id": "b", "Names": ["db"], "Labels": {}},
+        ])
+
+        assert [c["Id"] for c in manager.search("project=shop")] == ["a"]
+
+
+class TestResourceManagerQuery:
+    """Тесты для запросов с полями"""
+
+    def test_query_filters_snapshot(self, manager):
+        """Тест: запрос с полями фильтрует снимок и видимость ресурса"""
+        manager, _ = manager
+        _load(manager, [
+            {"Id": "a", "Names": ["web"], "State": "running", "Labels": {"team": "core"}},
+            {"Id": "b", "Names": ["web-old"], "State": "exited", "Labels": {"team": "core"}},
+            {"Id": "c", "Names": ["db"], "State": "running", "Labels": {}},
+        ])
+
+        assert [c["Id"] for c in manager.search("status:running label:team=core")] == ["a"]
+        assert [c["Id"] for c in manager.search("web -status:running")] == ["b"]
+        assert manager.is_resource_visible(manager.get_resource("b"))
+        assert not manager.is_resource_visible(manager.get_resource("a"))
+        assert [c["Id"] for c in manager.search("label:=core")] == []
+
+    def test_expired_snapshot_refreshed_before_search(self, manager):
+        """Тест: без снимка и без термов для демона сначала загружается список"""
+        manager, _ = manager
+        manager.docker_api.get_containers.return_value = [
+            {"Id": "a", "Names": ["web"], "Image": "nginx:latest", "State": "running"},
+            {"Id": "b", "Names": ["api"], "Image": "python:3", "State": "running"},
+        ]
+
+        with patch("core.resource_manager.GLib.idle_add"):
+            resources, filtered = manager._run_search_request("image:nginx*", {}, lambda: False)
+
+        manager.docker_api.get_containers.assert_called_once_with()
+        assert resources is manager.resources
+        assert [c["Id"] for c in resources] == ["a", "b"]
+        assert [c["Id"] for c in filtered] == ["a"]
+        assert filtered[0] is resources[0]
+
+    def test_push_down_merges_candidates(self, manager):
+        """Тест: без снимка термы передаются демону, кандидаты входят в снимок"""
+        manager, _ = manager
+        _load(manager, [
+            {"Id": "a", "Names": ["web"], "Image": "nginx:1", "State": "exited"},
+            {"Id": "c", "Names": ["db"], "Image": "postgres", "State": "exited"},
+        ])
+        manager.docker_api.is_live.return_value = False
+        manager.set_cache_policy(CachePolicy(revalidate_interval=15, max_staleness=60))
+        manager.last_cache_time -= 120  # Снимок устарел сверх max_staleness
+        manager.docker_api.get_containers.reset_mock()
+        manager.docker_api.get_containers.return_value = [
+            {"Id": "a", "Names": ["web"], "Image": "nginx:1", "State": "running"},
+            {"Id": "b", "Names": ["api"], "Image": "python:3", "State": "running"},
+        ]
+
+        with patch("core.resource_manager.GLib.idle_add"):
+            resources, filtered = manager._run_search_request("status:running image:nginx*", {}, lambda: False)
+
+        manager.docker_api.get_containers.assert_called_once_with(filters={"status": ["running"]})
+        assert resources is manager.resources
+        assert [c["Id"] for c in resources] == ["a", "c", "b"]
+        assert [c["Id"] for c in filtered] == ["a"]
+        assert filtered[0] is resources[0]
+        assert manager.get_indexed_resources("status", "running") == [resources[0], resources[2]]
+
+        with patch.object(manager, "refresh") as refresh:
+            manager._on_search_request_done((resources, filtered))
+        refresh.assert_called_once_with()
+
+    def test_snapshot_is_filtered_locally(self, manager):
+        """Тест: при наличии свежего снимка демон не опрашивается"""
+        manager, _ = manager
+        _load(manager, [{"Id": "a", "Names": ["web"], "State": "running"}])
+        manager.docker_api.get_containers.reset_mock()
+
+        _, filtered = manager._run_search_request("status:running", {}, lambda: False)
+
+        manager.docker_api.get_containers.assert_not_called()
+        assert [c["Id"] for c in filtered] == ["a"]
+
+
+class TestResourceManagerSnapshot:
+    """Тесты для неизменяемых версионных снимков"""
+
+    def test_getters_return_snapshot_without_copy(self, manager):
+        """Тест: геттеры отдают неизменяемый снимок без копирования"""
+        manager, _ = manager
+        _load(manager, _containers(3))
+
+        resources = manager.get_resources()
+        assert isinstance(resources, tuple)
+        assert resources is manager.get_resources() is manager.snapshot.resources
+        assert manager.get_filtered_resources() is resources  # Без поиска и фильтров
+
+    def test_readers_keep_their_snapshot(self, manager):
+        """Тест: новый снимок публикуется заменой ссылки, старый не меняется"""
+        manager, _ = manager
+        containers = _containers(3)
+        _load(manager, containers)
+        before = manager.snapshot
+
+        _load(manager, containers[:2])
+        manager.apply_local_change("c99999999999", ContainerRecord(
+            id="c99999999999", name="new", image="redis", status="created"
+        ))
+
+        assert len(before.resources) == 3 and len(before.filtered) == 3
+        assert manager.snapshot.version > before.version
+        assert [c["Id"] for c in manager.get_resources()] == ["c00000000000", "c00000000001", "c99999999999"]
+        with pytest.raises(AttributeError):
+            manager.snapshot.resources = ()
+
+    def test_removing_missing_resource_is_noop(self, manager):
+        """Тест: удаление отсутствующего ресурса не меняет снимок"""
+        manager, events = manager
+        _load(manager, _containers(2))
+        snapshot = manager.snapshot
+        events.clear()
+
+        assert manager.apply_local_change("c99999999999", None) is None
+
+        assert manager.snapshot is snapshot
+        assert events == []
+
+    def test_refresh_publishes_filtered_view(self, manager):
+        """Тест: снимок публикуется сразу с отфильтрованным представлением"""
+        manager, _ = manager
+        _load(manager, _containers(3))
+        manager.search("app-1")
+
+        manager.docker_api.get_containers.return_value = _containers(12)
+        manager._run_refresh()  # Без доставки событий в главный цикл
+
+        snapshot = manager.snapshot
+        assert len(snapshot.resources) == 12
+        assert [c["Id"] for c in snapshot.filtered] == ["c00000000001", "c00000000010", "c00000000011"]
+
+
+class TestResourceManagerGenerations:
+    """Тесты для поколений обновлений"""
+
+    def _start_slow_refresh(self, manager, resources):
+        """Запускает обновление, список которого возвращается по сигналу"""
+        release = threading.Event()
+        listed = threading.Event()
+
+        def slow_listing():
+            listed.set()
+            release.wait(5)
+            return resources
+
+        manager.docker_api.get_containers.side_effect = slow_listing
+        thread = threading.Thread(target=manager._run_refresh)
+        thread.start()
+        listed.wait(5)
+        manager.docker_api.get_containers.side_effect = None
+        return thread, release
+
+    def test_older_refresh_discarded(self, manager):
+        """Тест: обновление, начатое раньше, не перезаписывает более новое"""
+        manager, _ = manager
+        _load(manager, _containers(2))
+        thread, release = self._start_slow_refresh(manager, _containers(2))
+
+        _load(manager, _containers(4))
+        published = manager.snapshot
+        release.set()
+        thread.join(5)
+
+        assert manager.snapshot is published
+        assert len(manager.get_resources()) == 4
+        status = manager.get_cache_status()
+        assert status['generation'] == published.generation == 3
+        assert status['latest_generation'] == 3
+        assert status['discarded_refreshes'] == 1
+
+    def test_local_change_not_rolled_back(self, manager):
+        """Тест: список, полученный до действия, не откатывает его результат"""
+        manager, _ = manager
+        containers = _containers(2)
+        _load(manager, containers)
+        thread, release = self._start_slow_refresh(manager, containers)
+
+        manager.apply_local_change("c00000000000", containers[0].replace(status="exited"))
+        release.set()
+        thread.join(5)
+
+        assert manager.get_resource("c00000000000")["Status"] == "exited"
+        assert manager.get_indexed_resources("status", "running") == [containers[1]]
+
+        _load(manager, containers)  # Более новое обновление применяется
+        assert manager.get_resource("c00000000000")["Status"] == "running"
+
+    def test_listing_merged_around_local_changes(self, manager):
+        """Тест: список применяется целиком, кроме ресурсов, изменённых после его начала"""
+        manager, _ = manager
+        containers = _containers(3)
+        _load(manager, containers)
+        manager.last_cache_time = 1
+        listing = [containers[0], containers[1].replace(status="exited"), containers[2]] + _containers(4)[3:]
+        thread, release = self._start_slow_refresh(manager, listing)
+
+        manager.apply_local_change("c00000000000", containers[0].replace(status="paused"))
+        manager.apply_local_change("c00000000002", None)
+        release.set()
+        thread.join(5)
+
+        assert [c["Id"] for c in manager.get_resources()] == ["c00000000000", "c00000000001", "c00000000003"]
+        assert manager.get_resource("c00000000000")["Status"] == "paused"
+        assert manager.get_resource("c00000000001")["Status"] == "exited"
+        status = manager.get_cache_status()
+        assert status['kept_local_changes'] == 2
+        assert status['discarded_refreshes'] == 0
+        assert manager.last_cache_time > 1
+
+        _load(manager, listing)  # Более новый список снова полностью от демона
+        assert manager.get_resource("c00000000002") is not None
+
+
+class TestResourceManagerSort:
+    """Тесты для сортировки в менеджере"""
+
+    def test_sort_by_toggles_and_keeps_tie_breakers(self, manager):
+        """Тест: повторный клик меняет направление, прежняя колонка остаётся вторичной"""
+        manager, events = manager
+        _load(manager, [
+            {"Id": "a", "Names": ["web"], "Image": "nginx", "Status": "running"},
+            {"Id": "b", "Names": ["api"], "Image": "python", "Status": "exited"},
+            {"Id": "c", "Names": ["db"], "Image": "postgres", "Status": "running"},
+        ])
+        events.clear()
+
+        manager.sort_by("name")
+        assert [c["Id"] for c in manager.get_filtered_resources()] == ["b", "c", "a"]
+        manager.sort_by("status")
+        assert manager.current_sort == [("status", False), ("name", False)]
+        assert [c["Id"] for c in manager.get_filtered_resources()] == ["b", "c", "a"]
+        manager.sort_by("status")
+        assert [c["Id"] for c in manager.get_filtered_resources()] == ["c", "a", "b"]
+        assert events == [("ui_update", None)] * 3
+
+        assert [c["Id"] for c in manager.search("running")] == ["c", "a"]
+
+    def test_sorted_view_rebuilds_on_added_items(self, manager):
+        """Тест: при сортировке новые ресурсы приходят полным обновлением по порядку"""
+        manager, events = manager
+        _load(manager, [{"Id": "b", "Names": ["b"]}])
+        manager.sort_by("name")
+        events.clear()
+
+        _load(manager, [{"Id": "b", "Names": ["b"]}, {"Id": "a", "Names": ["a"]}])
+
+        assert [event for event, _ in events] == ["ui_update", "loading_complete"]
+        assert [c["Id"] for c in manager.get_filtered_resources()] == ["a", "b"]
+
+
+@pytest.fixture
+def operations():
+    """Выполняет операции сразу: задача планировщика и idle_add вызываются синхронно"""
+    with patch("resources.containers.scheduler") as scheduler, patch("resources.containers.GLib") as glib:
+        scheduler.submit_with_priority.side_effect = lambda priority, func, *args: func(*args)
+        glib.idle_add.side_effect = lambda func, *args: func(*args)
+        yield
+
+
+class TestContainerOperations:
+    """Тесты для оптимистичных операций с контейнерами"""
+
+    def _manager(self):
+        manager = ContainerManager(MagicMock())
+        manager.docker_api.is_live.return_value = False
+        containers = [
+            ContainerRecord(id="c1", name="web", image="nginx", status="exited"),
+            ContainerRecord(id="c2", name="db", image="postgres", status="running"),
+        ]
+        _load(manager, containers)
+        events = []
+        manager.add_callback(lambda event_type, data: events.append((event_type, data)))
+        manager.docker_api.get_containers.reset_mock()
+        return manager, events
+
+    def test_start_applies_expected_then_confirmed_state(self, operations):
+        """Тест: ожидаемое состояние показывается сразу, затем заменяется ответом демона"""
+        manager, events = self._manager()
+        confirmed = ContainerRecord(id="c1", name="web", image="nginx", status="running", ports=("80:80/tcp",))
+        seen = []
+        manager.docker_api.start_container.side_effect = lambda container_id: (
+            seen.append(manager.get_resource("c1")["State"]) or confirmed
+        )
+
+        manager.start_container("c1")
+
+        assert seen == ["running"]
+        assert manager.get_resource("c1") is confirmed
+        assert manager.get_running_containers_count() == 2
+        assert [event for event, _ in events] == ["items_changed", "items_changed"]
+        manager.docker_api.get_containers.assert_not_called()
+
+    def test_failed_action_rolls_back(self, operations):
+        """Тест: при ошибке возвращается прежнее состояние"""
+        manager, events = self._manager()
+        previous = manager.get_resource("c2")
+        manager.docker_api.stop_container.side_effect = RuntimeError("daemon down")
+
+        manager.stop_container("c2")
+
+        assert manager.get_resource("c2") is previous
+        assert manager.get_stopped_containers_count() == 1
+        assert [data[0]["State"] for _, data in events] == ["exited", "running"]
+
+    def test_delete_removes_row_and_restores_on_error(self, operations):
+        """Тест: удаление убирает строку сразу и возвращает её при ошибке"""
+        manager, events = self._manager()
+
+        manager.delete_container("c1")
+        assert manager.get_resource("c1") is None
+        assert [c["Id"] for c in manager.get_filtered_resources()] == ["c2"]
+        assert events == [("items_removed", ["c1"])]
+
+        manager.docker_api.delete_container.side_effect = RuntimeError("in use")
+        manager.delete_container("c2")
+        assert [c["Id"] for c in manager.resources] == ["c2"]
+        assert [event for event, _ in events] == ["items_removed", "items_removed", "items_added"]
+        manager.docker_api.get_containers.assert_not_called()
+
+    def test_live_updates_leave_reconcile_to_events(self, operations):
+        """Тест: при живых обновлениях подтверждение приходит из события"""
+        manager, _ = self._manager()
+        manager.docker_api.is_live.return_value = True
+        manager.docker_api.stop_container.return_value = None
+
+        manager.stop_container("c2")
+
+        assert manager.get_resource("c2")["State"] == "exited"
+
+    def test_unread_container_refreshes_instead_of_removing(self, operations):
+        """Тест: если контейнер не удалось перечитать, он остаётся, а список обновляется"""
+        manager, _ = self._manager()
+        manager.docker_api.start_container.return_value = None
+
+        with patch.object(manager, "refresh") as refresh:
+            manager.start_container("c1")
+
+        assert manager.get_resource("c1")["State"] == "running"
+        refresh.assert_called_once_with(force=True)
@@ -0,0 +1,114 @@
+"""
+Unit тесты для общего планировщика задач
+"""
+import threading
+
+import pytest
+
+from core.scheduler import Priority, TaskScheduler
+
+
+@pytest.fixture
+def task_scheduler():
+    task_scheduler = TaskScheduler(max_workers=2, name="test-scheduler")
+    yield task_scheduler
+    task_scheduler.shutdown(wait=True, cancel_futures=True)
+
+
+def _block_workers(task_scheduler):
+    """Занимает все потоки планировщика до вызова release.set()"""
+    release = threading.Event()
+    started = threading.Barrier(task_scheduler.max_workers + 1)
+
+    def hold():
+        started.wait(5)
+        release.wait(5)
+
+    futures = [task_scheduler.submit(hold) for _ in range(task_scheduler.max_workers)]
+    started.wait(5)
+    return release, futures
+
+
+class TestTaskScheduler:
+    """Тесты для класса TaskScheduler"""
+
+    def test_submit_returns_result(self, task_scheduler):
+        """Тест: задача выполняется и возвращает результат через Future"""
+        assert task_scheduler.submit(lambda a, b: a + b, 2, b=3).result(5) == 5
+
+    def test_exception_propagates(self, task_scheduler):
+        """Тест: исключение задачи передаётся через Future"""
+        future = task_scheduler.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            future.result(5)
+        assert task_scheduler.get_metrics()['lanes']['normal']['failed'] == 1
+
+    def test_lanes_served_by_priority(self, task_scheduler):
+        """Тест: видимый раздел обслуживается раньше фоновой работы"""
+        release, blockers = _block_workers(task_scheduler)
+        order = []
+        futures = [
+            task_scheduler.submit_with_priority(Priority.BACKGROUND, order.append, "prefetch"),
+            task_scheduler.submit_with_priority(Priority.NORMAL, order.append, "hidden"),
+            task_scheduler.submit_with_priority(Priority.FOREGROUND, order.append, "visible"),
+        ]
+        release.set()
+        for future in blockers + futures:
+            future.result(5)
+
+        assert order == ["visible", "hidden", "prefetch"]
+
+    def test_worker_count_is_bounded(self, task_scheduler):
+        """Тест: 500 задач не создают 500 потоков"""
+        threads = set()
+        futures = [
+            task_scheduler.submit(lambda: threads.add(threading.current_thread().name))
+            for _ in range(500)
+        ]
+        for future in futures:
+            future.result(5)
+
+        assert len(threads) <= 2
+        assert task_scheduler.get_metrics()['workers'] <= 2
+
+    def test_queue_depth_metrics(self, task_scheduler):
+        """Тест: глубина очереди и задержки собираются по полосам"""
+        release, blockers = _block_workers(task_scheduler)
+        futures = [task_scheduler.submit_with_priority(Priority.BACKGROUND, lambda: None) for _ in range(5)]
+
+        assert task_scheduler.get_queue_depth() == 5
+        release.set()
+        for future in blockers + futures:
+            future.result(5)
+
+        lane = task_scheduler.get_metrics()['lanes']['background']
+        assert lane['queue_depth'] == 0
+        assert lane['max_queue_depth'] == 5
+        assert lane['completed'] == 5
+        assert lane['max_wait'] > 0
+
+    def test_shutdown_cancels_pending(self, task_scheduler):
+        """Тест: при остановке невыполненные задачи отменяются"""
+        release, blockers = _block_workers(task_scheduler)
+        pending = task_scheduler.submit(lambda: None)
+
+        threading.Timer(0.1, release.set).start()
+        task_scheduler.shutdown(wait=True, cancel_futures=True)
+
+        assert pending.cancelled()
+        assert all(future.done() for future in blockers)
+        with pytest.raises(RuntimeError):
+            task_scheduler.submit(lambda: None)
+
+    def test_has_capacity(self, task_scheduler):
+        """Тест: свободный поток без очереди означает, что задача начнётся сразу"""
+        assert task_scheduler.has_capacity()
+
+        release, blockers = _block_workers(task_scheduler)
+        assert not task_scheduler.has_capacity()
+        release.set()
+        for future in blockers:
+            future.result(5)
+
+        task_scheduler.submit(lambda: None).result(5)
+        assert task_scheduler.has_capacity()
@@ -0,0 +1,47 @@
+"""
+Unit тесты для индекса поиска подстрок
+"""
+import random
+import string
+
+from core.search_index import SearchIndex, build_search_text
+
+
+def _index(texts):
+    return SearchIndex(texts, lambda text: text.lower())
+
+
+class TestSearchIndex:
+    """Тесты для класса SearchIndex"""
+
+    def test_build_search_text(self):
+        """Тест: поля разворачиваются, приводятся к нижнему регистру и не склеиваются"""
+        text = build_search_text([["web", "API"], None, "Nginx", 42])
+
+        assert text == "web\x00api\x00nginx\x0042"
+        assert "bapi" not in text
+
+    def test_short_and_long_queries(self):
+        """Тест: короткие запросы сканируют, длинные идут через триграммы"""
+        index = _index(["nginx:latest", "redis:7", "postgres:16", "NGINX:alpine"])
+
+        assert index.search("") == index.resources
+        assert index.search("s") == ["nginx:latest", "redis:7", "postgres:16"]
+        assert index.search("Nginx") == ["nginx:latest", "NGINX:alpine"]
+        assert index.search("ngx") == []
+        assert index.search("redis:7") == ["redis:7"]
+
+    def test_trigrams_are_verified(self):
+        """Тест: наличие всех триграмм ещё не означает совпадения"""
+        index = _index(["abcxbcd", "abcd"])
+
+        assert index.search("abcd") == ["abcd"]
+
+    def test_narrowing_matches_full_search(self):
+        """Тест: сужение по предыдущему запросу даёт тот же результат, что и полный поиск"""
+        rng = random.Random(7)
+        texts = ["".join(rng.choice("abcde") for _ in range(12)) for _ in range(500)]
+        index = _index(texts)
+
+        for query in ["a", "ab", "abc", "abca", "bca", "b", "", "cde", "cdea"]:
+            assert index.search(query) == [text for text in texts if query in text], query
@@ -0,0 +1,99 @@
+"""
+Unit тесты для конвейера отложенного поиска
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core.search_pipeline import SearchPipeline
+
+
+def _wait_for(predicate, timeout=5):
+    """Ждёт, пока рабочий поток планировщика отдаст результат"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def main_loop():
+    """Подменяет GLib: таймеры копятся до явного срабатывания, idle_add выполняется сразу"""
+    timers = {}
+
+    def timeout_add(delay, func, *args):
+        source_id = len(timers) + 1
+        timers[source_id] = (func, args)
+        return source_id
+
+    def fire():
+        for source_id in list(timers):
+            func, args = timers.pop(source_id)
+            func(*args)
+
+    with patch("core.search_pipeline.GLib") as glib:
+        glib.timeout_add.side_effect = timeout_add
+        glib.source_remove.side_effect = lambda source_id: timers.pop(source_id)
+        glib.idle_add.side_effect = lambda func, *args: func(*args)
+        yield fire
+
+
+class TestSearchPipeline:
+    """Тесты для класса SearchPipeline"""
+
+    def test_burst_runs_once(self, main_loop):
+        """Тест: серия нажатий клавиш даёт один проход фильтрации"""
+        runs, delivered = [], []
+        pipeline = SearchPipeline(
+            lambda query, filters, is_cancelled: runs.append(query) or query.upper(),
+            delivered.append
+        )
+
+        for query in ["n", "ng", "ngi", "ngin", "nginx"]:
+            pipeline.request(query, {})
+        main_loop()
+
+        assert _wait_for(lambda: delivered)
+        assert runs == ["nginx"]
+        assert delivered == ["NGINX"]
+
+    def test_stale_result_dropped(self, main_loop):
+        """Тест: результат устаревшего запроса не доставляется"""
+        release = threading.Event()
+        started = threading.Event()
+        cancelled = []
+        delivered = []
+
+        def run(query, filters, is_cancelled):
+            if query == "slow":
+                started.set()
+                release.wait(5)
+                cancelled.append(is_cancelled())
+            return query
+
+        pipeline = SearchPipeline(run, delivered.append)
+        pipeline.request("slow", {})
+        main_loop()
+        assert started.wait(5)
+
+        pipeline.request("fast", {"status": "running"})
+        release.set()
+        main_loop()
+
+        assert _wait_for(lambda: delivered)
+        assert _wait_for(lambda: cancelled)
+        assert delivered == ["fast"]
+        assert cancelled == [True]
+
+    def test_cancel(self, main_loop):
+        """Тест: отменённый запрос не выполняется"""
+        runs = []
+        pipeline = SearchPipeline(lambda query, filters, is_cancelled: runs.append(query), print)
+
+        pipeline.request("web", {})
+        pipeline.cancel()
+        main_loop()
+
+        assert runs == []
@@ -0,0 +1,121 @@
+"""
+Unit тесты для объединения одновременных запросов (single-flight)
+"""
+import threading
+import time
+
+import pytest
+
+from core.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Тесты для класса SingleFlight"""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Тест: одновременные вызовы получают один и тот же Future"""
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return ["container"]
+
+        flights = SingleFlight()
+        futures = [flights.submit("containers", load) for _ in range(10)]
+        release.set()
+
+        assert all(future is futures[0] for future in futures)
+        assert futures[0].result(5) == ["container"]
+        assert len(calls) == 1
+
+    def test_new_flight_after_completion(self):
+        """Тест: после завершения следующий вызов идёт к источнику заново"""
+        calls = []
+        flights = SingleFlight()
+
+        assert flights.do("images", lambda: calls.append(1) or len(calls)) == 1
+        assert flights.do("images", lambda: calls.append(1) or len(calls)) == 2
+        assert not flights.in_flight("images")
+
+    def test_keys_are_independent(self):
+        """Тест: разные ключи не объединяются"""
+        release = threading.Event()
+        flights = SingleFlight()
+
+        containers = flights.submit("containers", lambda: release.wait(5) and "containers")
+        volumes = flights.submit("volumes", lambda: "volumes")
+
+        assert volumes.result(5) == "volumes"
+        release.set()
+        assert containers.result(5) == "containers"
+
+    def test_fresh_callers_share_trailing_flight(self):
+        """Тест: принудительные вызовы ждут один запуск после текущего"""
+        release = threading.Event()
+        started = threading.Event()
+        versions = []
+
+        def load():
+            versions.append(len(versions) + 1)
+            started.set()
+            release.wait(5)
+            return versions[-1]
+
+        flights = SingleFlight()
+        current = flights.submit("containers", load)
+        started.wait(5)
+        trailing = [flights.submit("containers", load, fresh=True) for _ in range(5)]
+        release.set()
+
+        assert current.result(5) == 1
+        assert all(future is trailing[0] for future in trailing)
+        assert trailing[0].result(5) == 2
+        assert versions == [1, 2]
+        assert not flights.in_flight("containers")
+
+    def test_error_reaches_every_caller(self):
+        """Тест: ошибка общего вызова передаётся всем ожидающим"""
+        release = threading.Event()
+
+        def load():
+            release.wait(5)
+            raise ConnectionError("daemon down")
+
+        flights = SingleFlight()
+        futures = [flights.submit("networks", load) for _ in range(3)]
+        release.set()
+
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result(5)
+        assert not flights.in_flight("networks")
+
+    def test_do_joins_running_flight(self):
+        """Тест: синхронный вызов присоединяется к выполняющемуся"""
+        release = threading.Event()
+        started = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "images"
+
+        flights = SingleFlight()
+        future = flights.submit("images", load)
+        started.wait(5)
+
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(flights.do("images", load)))
+        waiter.start()
+        # Даём ожидающему потоку присоединиться к текущему вызову
+        time.sleep(0.1)
+        release.set()
+        waiter.join(5)
+
+        assert future.result(5) == "images"
+        assert results == ["images"]
+        assert len(calls) == 1
@@ -0,0 +1,70 @@
+"""
+Unit тесты для кэша сортировки снимка
+"""
+import random
+
+from core.sorting import SortCache, number_key, sort_resources, text_key
+
+
+SORT_KEYS = {
+    "name": text_key(lambda row: row.get("Name")),
+    "size": number_key(lambda row: row.get("Size")),
+}
+
+
+def _rows():
+    return [
+        {"Name": "b", "Size": 10},
+        {"Name": "A", "Size": 20},
+        {"Name": "c", "Size": None},
+        {"Name": "a", "Size": 10},
+    ]
+
+
+class TestSortCache:
+    """Тесты для класса SortCache"""
+
+    def test_typed_keys(self):
+        """Тест: размеры сравниваются как числа, имена — без учёта регистра"""
+        rows = _rows()
+        cache = SortCache(rows, SORT_KEYS)
+
+        assert [row["Size"] for row in cache.sort(rows, (("size", False),))] == [None, 10, 10, 20]
+        assert [row["Name"] for row in cache.sort(rows, (("name", True),))] == ["c", "b", "A", "a"]
+
+    def test_multi_column_is_stable(self):
+        """Тест: сортировка по нескольким колонкам совпадает с сортировкой по кортежу"""
+        rng = random.Random(3)
+        rows = [{"Name": rng.choice("abc"), "Size": rng.randrange(5)} for _ in range(300)]
+        cache = SortCache(rows, SORT_KEYS)
+        spec = (("size", True), ("name", False))
+
+        expected = sorted(rows, key=lambda row: (-row["Size"], row["Name"]))
+        assert cache.sort(rows, spec) == expected
+        assert sort_resources(rows, spec, SORT_KEYS) == expected
+
+    def test_permutations_are_cached(self):
+        """Тест: повторная сортировка берёт готовую перестановку"""
+        rows = _rows()
+        cache = SortCache(rows, SORT_KEYS)
+        spec = (("name", False), ("size", False))
+
+        permutation = cache.get_permutation(spec)
+        assert cache.get_permutation(spec) is permutation
+        assert (("size", False),) in cache._permutations
+        assert list(permutation) == [3, 1, 0, 2]
+
+    def test_selection_and_foreign_rows(self):
+        """Тест: выборка из снимка сортируется по его перестановке, чужие строки — напрямую"""
+        rows = [{"Name": f"n{index:03d}", "Size": index % 7} for index in range(100)]
+        cache = SortCache(rows, SORT_KEYS)
+        spec = (("size", False), ("name", True))
+        expected = sort_resources(rows, spec, SORT_KEYS)
+
+        small = rows[::10]
+        large = rows[::2]
+        assert cache.sort(small, spec) == [row for row in expected if row in small]
+        assert cache.sort(large, spec) == [row for row in expected if row in large]
+
+        foreign = [{"Name": "x", "Size": 3}, {"Name": "y", "Size": 1}]
+        assert cache.sort(foreign, spec) == foreign[::-1]
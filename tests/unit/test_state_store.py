@@ -0,0 +1,196 @@
+"""
+Unit тесты для хранилища состояния на потоке событий Docker
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from services.state_store import LiveStateStore
+
+
+def _event(event_type, action, actor_id, time_nano=1704067200_000000000):
+    return {
+        "Type": event_type,
+        "Action": action,
+        "Actor": {"ID": actor_id, "Attributes": {}},
+        "time": time_nano // 1_000_000_000,
+        "timeNano": time_nano,
+    }
+
+
+@pytest.fixture
+def fake_api():
+    """Мок DockerAPI с начальными списками и точечными запросами"""
+    api = MagicMock()
+    api.get_containers.return_value = [
+        {"Id": "c0ffee000001", "name": "web", "status": "running"},
+        {"Id": "c0ffee000002", "name": "db", "status": "running"},
+    ]
+    api.get_images.return_value = [{"Id": "a" * 12, "RepoTags": ["app:latest"]}]
+    api.get_networks.return_value = [{"Id": "0e7e00000001", "Name": "bridge"}]
+    api.get_volumes.return_value = [{"Name": "data"}]
+    return api
+
+
+def _run_with_streams(store, api, *streams):
+    """Прогоняет цикл событий по заданным потокам и останавливается на последнем"""
+    calls = []
+    streams = list(streams)
+
+    def get_events(since=None):
+        calls.append(since)
+        if not streams:
+            store._stop_event.set()
+            raise ConnectionError("stopped")
+        stream = streams.pop(0)
+        if isinstance(stream, Exception):
+            raise stream
+        return iter(stream)
+
+    api.get_events.side_effect = get_events
+    store._run()
+    return calls
+
+
+class TestLiveStateStore:
+    """Тесты для класса LiveStateStore"""
+
+    def test_initial_listing(self, fake_api):
+        """Тест: начальное состояние строится одним списком на тип"""
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+        _run_with_streams(store, fake_api, [])
+
+        assert [c["Id"] for c in store.get("containers")] == ["c0ffee000001", "c0ffee000002"]
+        assert store.get("volumes") == [{"Name": "data"}]
+        fake_api.get_containers.assert_called_once()
+        fake_api.get_images.assert_called_once()
+
+    def test_container_events_use_targeted_lookups(self, fake_api):
+        """Тест: события контейнеров обновляют только затронутый контейнер"""
+        fake_api.get_container.return_value = {"Id": "c0ffee000001", "name": "web", "status": "exited"}
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+
+        _run_with_streams(store, fake_api, [
+            _event("container", "die", "c0ffee000001" + "0" * 52),
+            _event("container", "destroy", "c0ffee000002" + "0" * 52),
+            _event("container", "exec_start: sh -c true", "c0ffee000001" + "0" * 52),
+        ])
+
+        assert store.get("containers") == [{"Id": "c0ffee000001", "name": "web", "status": "exited"}]
+        fake_api.get_container.assert_called_once_with("c0ffee000001" + "0" * 52)
+        fake_api.get_containers.assert_called_once()
+
+    def test_resource_create_and_delete(self, fake_api):
+        """Тест: pull/delete образов и create/destroy сетей и томов"""
+        fake_api.get_image.return_value = {"Id": "b" * 12, "RepoTags": ["nginx:latest"]}
+        fake_api.get_network.return_value = {"Id": "0e7e00000002", "Name": "backend"}
+        fake_api.get_volume.return_value = {"Name": "cache"}
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+
+        _run_with_streams(store, fake_api, [
+            _event("image", "pull", "nginx:latest"),
+            _event("image", "delete", "sha256:" + "a" * 64),
+            _event("network", "create", "0e7e00000002" + "0" * 52),
+            _event("network", "destroy", "0e7e00000001" + "0" * 52),
+            _event("volume", "create", "cache"),
+            _event("volume", "destroy", "data"),
+        ])
+
+        assert [i["Id"] for i in store.get("images")] == ["b" * 12]
+        assert [n["Name"] for n in store.get("networks")] == ["backend"]
+        assert [v["Name"] for v in store.get("volumes")] == ["cache"]
+
+    def test_missing_resource_is_removed(self, fake_api):
+        """Тест: если ресурс исчез до точечного запроса, он удаляется"""
+        fake_api.get_container.return_value = None
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+
+        _run_with_streams(store, fake_api, [_event("container", "start", "c0ffee000002" + "0" * 52)])
+
+        assert [c["Id"] for c in store.get("containers")] == ["c0ffee000001"]
+
+    def test_prune_resyncs_kind(self, fake_api):
+        """Тест: prune без ID ресурса перечитывает тип целиком"""
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+        fake_api.get_volumes.return_value = []
+
+        _run_with_streams(store, fake_api, [_event("volume", "prune", "")])
+
+        assert store.get("volumes") == []
+        assert fake_api.get_volumes.call_count == 2
+
+    def test_reconnect_resumes_from_last_event(self, fake_api):
+        """Тест: переподключение передаёт since последнего события"""
+        fake_api.get_container.return_value = {"Id": "c0ffee000001", "status": "running"}
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+
+        calls = _run_with_streams(store, fake_api, [
+            _event("container", "start", "c0ffee000001" + "0" * 52, time_nano=1704067260_123456789),
+        ])
+
+        assert calls[1] == "1704067260.123456789"
+
+    def test_ended_stream_triggers_resync(self, fake_api):
+        """Тест: поток, закончившийся без остановки, перечитывает состояние"""
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+
+        calls = _run_with_streams(store, fake_api, [], [])
+
+        assert len(calls) == 3
+        assert fake_api.get_containers.call_count == 2
+
+    def test_failed_lookup_keeps_record(self, fake_api):
+        """Тест: ошибка точечного запроса не удаляет ресурс, а вызывает пересинхронизацию"""
+        fake_api.get_container.side_effect = RuntimeError("timeout")
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+        seen = []
+
+        def stream():
+            yield _event("container", "start", "c0ffee000002" + "0" * 52)
+            seen.append("next")
+            yield _event("container", "stop", "c0ffee000001" + "0" * 52)
+
+        _run_with_streams(store, fake_api, stream(), [])
+
+        assert [c["Id"] for c in store.get("containers")] == ["c0ffee000001", "c0ffee000002"]
+        # Поток переподключается сразу после ошибки и перечитывает список
+        assert seen == []
+        assert fake_api.get_containers.call_count == 2
+
+    def test_network_connect_refreshes_container(self, fake_api):
+        """Тест: подключение к сети перечитывает контейнер из Actor.Attributes"""
+        fake_api.get_container.return_value = {"Id": "c0ffee000001", "networks": ["0e7e00000001"]}
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+        event = _event("network", "connect", "0e7e00000001" + "0" * 52)
+        event["Actor"]["Attributes"] = {"container": "c0ffee000001" + "0" * 52, "name": "bridge"}
+
+        _run_with_streams(store, fake_api, [event])
+
+        fake_api.get_container.assert_called_once_with("c0ffee000001" + "0" * 52)
+        fake_api.get_network.assert_not_called()
+        assert store.get("containers")[0]["networks"] == ["0e7e00000001"]
+
+    def test_unreachable_daemon_triggers_resync(self, fake_api):
+        """Тест: после недоступности демона состояние перечитывается"""
+        store = LiveStateStore(fake_api, reconnect_delay=0)
+
+        _run_with_streams(store, fake_api, ConnectionError("daemon down"), [])
+
+        assert fake_api.get_containers.call_count == 2
+
+    def test_live_status_and_notifications(self, fake_api):
+        """Тест: статус live и уведомления об изменениях через dispatch"""
+        fake_api.get_volume.return_value = {"Name": "cache"}
+        dispatched = []
+        store = LiveStateStore(fake_api, dispatch=lambda func, *args: dispatched.append(args), reconnect_delay=0)
+        live_during_stream = []
+
+        def stream():
+            live_during_stream.append(store.is_live("volumes"))
+            yield _event("volume", "create", "cache")
+
+        _run_with_streams(store, fake_api, stream())
+
+        assert live_during_stream == [True]
+        assert not store.is_live()
+        assert ("volumes_changed", {"action": "create", "id": "cache"}) in dispatched
+        assert ("state_store_connected", None) in dispatched
@@ -0,0 +1,113 @@
+"""
+Unit тесты для переиспользования строк виртуального списка
+"""
+from ui.components.virtual_list import RowRecycler
+
+
+class Row:
+    """Строка-заглушка: запоминает элемент, позицию и видимость"""
+
+    def __init__(self):
+        self.item = None
+        self.offset = None
+        self.visible = False
+
+
+def _recycler(count, item_height=10, buffer_size=2, **kwargs):
+    def place(row, offset):
+        row.offset = offset
+        row.visible = True
+
+    def hide(row):
+        row.visible = False
+
+    def bind(row, item):
+        row.item = item
+
+    recycler = RowRecycler(Row, bind, place, hide, item_height, buffer_size, **kwargs)
+    recycler.set_items(tuple(range(count)))
+    return recycler
+
+
+def _shown(recycler):
+    return sorted((row.item, row.offset) for row in recycler.get_rows() if row.visible)
+
+
+class TestRowRecycler:
+    """Тесты для класса RowRecycler"""
+
+    def test_binds_window_at_absolute_offsets(self):
+        """Тест: связываются строки окна, каждая на смещении своего элемента"""
+        recycler = _recycler(1000)
+        recycler.update(500, 50)
+
+        assert recycler.visible_range == (48, 58)
+        assert _shown(recycler) == [(index, index * 10) for index in range(48, 58)]
+        assert recycler.total_height == 10000
+
+    def test_scrolling_recycles_rows(self):
+        """Тест: прокрутка переиспользует строки, а не создаёт новые"""
+        recycler = _recycler(1000)
+        recycler.update(500, 50)  # Полное окно с запасом с обеих сторон
+        created = recycler.get_stats()['created']
+
+        for value in range(0, 9950, 7):
+            recycler.update(value, 50)
+
+        stats = recycler.get_stats()
+        assert stats['created'] == created == stats['pool']
+        assert _shown(recycler)[-1] == (999, 9990)
+
+    def test_only_entering_rows_bound(self):
+        """Тест: сдвиг на одну строку связывает одну строку"""
+        recycler = _recycler(1000)
+        recycler.update(100, 50)
+        bound = recycler.get_stats()['bound']
+
+        recycler.update(110, 50)
+        assert recycler.get_stats()['bound'] == bound + 1
+        assert not recycler.update(110, 50)
+
+    def test_shrinking_list_hides_rows(self):
+        """Тест: лишние строки пула скрываются при коротком списке"""
+        recycler = _recycler(1000)
+        recycler.update(0, 50)
+        recycler.set_items((10, 11))
+        recycler.update(0, 50)
+
+        assert _shown(recycler) == [(10, 0), (11, 10)]
+        rows = [row for row in recycler.get_rows() if row.visible]
+        assert sorted(recycler.get_item(row) for row in rows) == [10, 11]
+
+    def test_variable_heights_measured(self):
+        """Тест: строки разной высоты стоят вплотную по измеренным высотам"""
+        recycler = _recycler(1000, measure_row=lambda row: 10 + row.item % 3 * 10)
+        recycler.update(0, 100)
+
+        shown = _shown(recycler)
+        for (item, offset), (_, following) in zip(shown, shown[1:]):
+            assert following - offset == 10 + item % 3 * 10
+        # Окно покрывает видимую область по измеренным, а не оценочным высотам
+        assert shown[-1][1] >= 100
+        assert recycler.get_stats()['measured'] >= len(shown)
+
+    def test_measuring_above_corrects_scroll(self):
+        """Тест: изменение высоты строк выше видимой области компенсируется прокруткой"""
+        recycler = _recycler(1000, measure_row=lambda row: 20)
+        recycler.update(5000, 100)  # По оценке это строка 500
+
+        correction = recycler.take_scroll_correction()
+        assert correction == 2 * (20 - 10)  # Две строки буфера выше стали выше
+        assert recycler.get_index_at(5000 + correction) == 500
+        assert recycler.take_scroll_correction() == 0
+
+    def test_heights_follow_items_by_key(self):
+        """Тест: измеренные высоты переносятся на новые элементы по ключу"""
+        recycler = _recycler(100, measure_row=lambda row: 30, get_key=lambda item: item)
+        recycler.update(0, 60)
+        measured = recycler.get_stats()['measured']
+
+        recycler.set_items(tuple(range(-5, 100)))
+        assert recycler.heights.get(5) == 30  # Элемент 0 сдвинулся на 5 позиций
+        assert recycler.heights.get(0) == 30  # Оценка для новых — средняя измеренная
+        assert recycler.heights.measured_count == measured
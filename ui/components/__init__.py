@@ -10,6 +10,9 @@ from .notifications import NotificationManager
 from .search import SearchBar, FilterBar, ResourceFilter
 from .dashboard import Dashboard
 from .loading_indicator import LoadingIndicator, ProgressIndicator, StatusIndicator
+from .column_list import ColumnList, KeyedListModel
+from .card_grid import CardGrid
+from .sort_headers import SortHeaders
 
 __all__ = [
     'ResourceCard',
@@ -22,5 +25,9 @@ __all__ = [
     'Dashboard',
     'LoadingIndicator',
     'ProgressIndicator',
-    'StatusIndicator'
+    'StatusIndicator',
+    'ColumnList',
+    'KeyedListModel',
+    'CardGrid',
+    'SortHeaders'
 ] 
\ No newline at end of file
@@ -4,23 +4,145 @@ Card Components
 This module provides card-based UI components for displaying Docker resources.
 """
 
+from datetime import datetime
+
 import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GObject, Pango, Gdk
 
 
+# Detail lines of each card type, in display order
+DETAIL_FIELDS = {
+    "image": ("id", "size", "created", "repo"),
+    "container": ("image", "state", "ports"),
+    "network": ("driver", "scope"),
+    "volume": ("driver", "mount"),
+}
+
+# CSS class of the container status label by state
+STATUS_CLASSES = {
+    "running": "status-running",
+    "stopped": "status-stopped",
+    "exited": "status-exited",
+}
+
+
+def format_size(size_bytes):
+    """Format size in bytes to human readable format."""
+    if size_bytes == 0:
+        return "0 B"
+    
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    while size_bytes >= 1024 and i < len(size_names) - 1:
+        size_bytes /= 1024.0
+        i += 1
+    
+    return f"{size_bytes:.1f} {size_names[i]}"
+
+
+def get_card_fields(resource_type, resource_data):
+    """
+    Get what a card shows for a resource.
+
+    Args:
+        resource_type: Card type ("image", "container", "network", "volume")
+        resource_data: Resource record or dict
+
+    Returns:
+        Dictionary with the title, the status text and CSS class (containers),
+        the text of every detail line (None hides the line) and, for
+        containers, whether the container runs (Stop or Start button)
+    """
+    get = resource_data.get
+    fields = {"title": "Unknown Resource"}
+    
+    if resource_type == "image":
+        repo = get("Repository", "")
+        tag = get("Tag", "")
+        fields["title"] = f"{repo}:{tag}" if tag else repo
+        fields["id"] = f"ID: {get('Id', get('id', ''))[:12]}"
+        fields["size"] = f"Size: {format_size(get('Size', get('size', 0)))}"
+        
+        created = get("Created", "")
+        fields["created"] = None
+        if created:
+            try:
+                dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
+                fields["created"] = f"Created: {dt.strftime('%Y-%m-%d %H:%M')}"
+            except ValueError:
+                fields["created"] = f"Created: {created[:10]}"
+        
+        repo = get("Repository", get("repository", ""))
+        tag = get("Tag", get("tag", ""))
+        fields["repo"] = f"Repo: {repo}:{tag}" if repo and repo != "<none>" else None
+    
+    elif resource_type == "container":
+        fields["title"] = get("Names", [""])[0] if get("Names") else "Unknown"
+        state = get("State", "unknown")
+        fields["status"] = state.upper()
+        fields["status_class"] = STATUS_CLASSES.get(state, "status-unknown")
+        fields["running"] = state == "running"
+        
+        fields["image"] = f"Image: {get('Image', get('image', ''))}"
+        fields["state"] = f"Status: {get('State', get('Status', get('status', '')))}"
+        
+        ports = get("Ports", [])
+        ports_str = get("ports", "")
+        if ports:
+            ports_str = ", ".join(ports) if isinstance(ports, list) else str(ports)
+        elif not ports_str:
+            ports_str = "No ports"
+        fields["ports"] = f"Ports: {ports_str}"
+    
+    elif resource_type == "network":
+        fields["title"] = get("Name", "Unknown")
+        fields["driver"] = f"Driver: {get('Driver', get('driver', ''))}"
+        scope = get("Scope", "")
+        fields["scope"] = f"Scope: {scope}" if scope else None
+    
+    elif resource_type == "volume":
+        fields["title"] = get("Name", "Unknown")
+        fields["driver"] = f"Driver: {get('Driver', get('driver', ''))}"
+        mountpoint = get("Mountpoint", "")
+        if mountpoint and len(mountpoint) > 50:
+            mountpoint = mountpoint[:47] + "..."
+        fields["mount"] = f"Mount: {mountpoint}" if mountpoint else None
+    
+    return fields
+
+
 class ResourceCard(Gtk.Box):
     """
     A card component for displaying Docker resources (images, containers, networks, volumes).
+
+    The labels and buttons are built once; bind() shows new data by updating
+    only the labels and CSS classes whose values changed.
     """
     
-    def __init__(self, resource_type, resource_data, **kwargs):
+    def __init__(self, resource_type, resource_data, selectable=True, **kwargs):
+        """
+        Initialize the card.
+        
+        Args:
+            resource_type: Card type ("container", "image", "network", "volume")
+            resource_data: Resource shown by the card
+            selectable: Toggle the selection on click and Space; False when a
+                list view's selection model selects the card
+        """
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8, **kwargs)
         
         self.resource_type = resource_type
         self.resource_data = resource_data
         self.selected = False
         
+        # Shown values by field name, to update only what changed
+        self._fields = {}
+        self._detail_labels = {}
+        self._status_label = None
+        self._start_btn = None
+        self._stop_btn = None
+        
         # Apply card styling
         self.add_css_class("resource-card")
         self.set_margin_start(8)
@@ -29,35 +151,41 @@ class ResourceCard(Gtk.Box):
         self.set_margin_bottom(8)
         
         # Make card clickable
-        self.set_can_focus(True)
         self.add_css_class("clickable")
         
-        # Connect click events
-        gesture = Gtk.GestureClick()
-        gesture.connect("pressed", self._on_card_clicked)
-        self.add_controller(gesture)
-        
-        key_controller = Gtk.EventControllerKey()
-        key_controller.connect("key-pressed", self._on_card_key_pressed)
-        self.add_controller(key_controller)
+        if selectable:
+            self.set_can_focus(True)
+            
+            # Connect click events
+            gesture = Gtk.GestureClick()
+            gesture.connect("pressed", self._on_card_clicked)
+            self.add_controller(gesture)
+            
+            key_controller = Gtk.EventControllerKey()
+            key_controller.connect("key-pressed", self._on_card_key_pressed)
+            self.add_controller(key_controller)
         
         self._build_card()
+        self.bind(resource_data)
     
     def _build_card(self):
-        """Build the card content based on resource type."""
+        """Build the card widgets; their content is set by bind()."""
         
         # Header with title and status
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         
         # Title
-        title_label = Gtk.Label(label=self._get_title())
-        title_label.add_css_class("card-title")
-        title_label.set_halign(Gtk.Align.START)
-        title_label.set_hexpand(True)
-        header_box.append(title_label)
+        self._title_label = Gtk.Label()
+        self._title_label.add_css_class("card-title")
+        self._title_label.set_halign(Gtk.Align.START)
+        self._title_label.set_hexpand(True)
+        header_box.append(self._title_label)
         
         # Status indicator
-        status_box = self._create_status_indicator()
+        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        if self.resource_type == "container":
+            self._status_label = Gtk.Label()
+            status_box.append(self._status_label)
         header_box.append(status_box)
         
         self.append(header_box)
@@ -65,177 +193,65 @@ class ResourceCard(Gtk.Box):
         # Content area
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         content_box.add_css_class("card-content")
-        
-        # Add resource-specific content
-        self._add_content(content_box)
-        
+        for name in DETAIL_FIELDS.get(self.resource_type, ()):
+            label = Gtk.Label()
+            label.add_css_class("card-detail")
+            content_box.append(label)
+            self._detail_labels[name] = label
         self.append(content_box)
         
         # Footer with actions
         footer_box = self._create_footer()
         self.append(footer_box)
     
-    def _get_title(self):
-        """Get the title for the card based on resource type."""
-        if self.resource_type == "image":
-            repo = self.resource_data.get("Repository", "")
-            tag = self.resource_data.get("Tag", "")
-            return f"{repo}:{tag}" if tag else repo
-        elif self.resource_type == "container":
-            return self.resource_data.get("Names", [""])[0] if self.resource_data.get("Names") else "Unknown"
-        elif self.resource_type == "network":
-            return self.resource_data.get("Name", "Unknown")
-        elif self.resource_type == "volume":
-            return self.resource_data.get("Name", "Unknown")
-        return "Unknown Resource"
-    
-    def _create_status_indicator(self):
-        """Create status indicator based on resource type."""
-        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        
-        if self.resource_type == "container":
-            status = self.resource_data.get("State", "unknown")
-            status_label = Gtk.Label(label=status.upper())
-            
-            if status == "running":
-                status_label.add_css_class("status-running")
-            elif status == "stopped":
-                status_label.add_css_class("status-stopped")
-            elif status == "exited":
-                status_label.add_css_class("status-exited")
+    def bind(self, resource_data):
+        """Show new data, updating only the labels and CSS classes that changed."""
+        self.resource_data = resource_data
+        fields = get_card_fields(self.resource_type, resource_data)
+        previous = self._fields
+        
+        for name, value in fields.items():
+            if name in previous and previous[name] == value:
+                continue
+            if name == "title":
+                self._title_label.set_label(value)
+            elif name == "status":
+                self._status_label.set_label(value)
+            elif name == "status_class":
+                if name in previous:
+                    self._status_label.remove_css_class(previous[name])
+                self._status_label.add_css_class(value)
+            elif name == "running":
+                self._stop_btn.set_visible(value)
+                self._start_btn.set_visible(not value)
             else:
-                status_label.add_css_class("status-unknown")
-                
-            status_box.append(status_label)
+                label = self._detail_labels[name]
+                label.set_visible(value is not None)
+                if value is not None:
+                    label.set_label(value)
         
-        return status_box
-    
-    def _add_content(self, content_box):
-        """Add resource-specific content to the card."""
-        if self.resource_type == "image":
-            self._add_image_content(content_box)
-        elif self.resource_type == "container":
-            self._add_container_content(content_box)
-        elif self.resource_type == "network":
-            self._add_network_content(content_box)
-        elif self.resource_type == "volume":
-            self._add_volume_content(content_box)
+        self._fields = fields
     
-    def _add_image_content(self, content_box):
-        """Add content specific to Docker images."""
-        image_id = self.resource_data.get("Id", self.resource_data.get("id", ""))[:12]
-        id_label = Gtk.Label(label=f"ID: {image_id}")
-        id_label.add_css_class("card-detail")
-        content_box.append(id_label)
-        
-        size = self.resource_data.get("Size", self.resource_data.get("size", 0))
-        size_str = self._format_size(size)
-        size_label = Gtk.Label(label=f"Size: {size_str}")
-        size_label.add_css_class("card-detail")
-        content_box.append(size_label)
-        
-        created = self.resource_data.get("Created", "")
-        if created:
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                formatted_date = dt.strftime("%Y-%m-%d %H:%M")
-                created_label = Gtk.Label(label=f"Created: {formatted_date}")
-            except:
-                created_label = Gtk.Label(label=f"Created: {created[:10]}")
-            created_label.add_css_class("card-detail")
-            content_box.append(created_label)
-        
-        repo = self.resource_data.get("Repository", self.resource_data.get("repository", ""))
-        tag = self.resource_data.get("Tag", self.resource_data.get("tag", ""))
-        if repo and repo != "<none>":
-            repo_label = Gtk.Label(label=f"Repo: {repo}:{tag}")
-            repo_label.add_css_class("card-detail")
-            content_box.append(repo_label)
-    
-    def _add_container_content(self, content_box):
-        """Add content specific to Docker containers."""
-        image = self.resource_data.get("Image", self.resource_data.get("image", ""))
-        image_label = Gtk.Label(label=f"Image: {image}")
-        image_label.add_css_class("card-detail")
-        content_box.append(image_label)
-        
-        status = self.resource_data.get("State", self.resource_data.get("Status", self.resource_data.get("status", "")))
-        status_label = Gtk.Label(label=f"Status: {status}")
-        status_label.add_css_class("card-detail")
-        content_box.append(status_label)
-        
-        ports = self.resource_data.get("Ports", [])
-        ports_str = self.resource_data.get("ports", "")
-        if ports:
-            if isinstance(ports, list):
-                ports_str = ", ".join(ports)
-            else:
-                ports_str = str(ports)
-        elif ports_str:
-            pass
-        else:
-            ports_str = "No ports"
-            
-        ports_label = Gtk.Label(label=f"Ports: {ports_str}")
-        ports_label.add_css_class("card-detail")
-        content_box.append(ports_label)
-    
-    def _add_network_content(self, content_box):
-        """Add content specific to Docker networks."""
-        driver = self.resource_data.get("Driver", self.resource_data.get("driver", ""))
-        driver_label = Gtk.Label(label=f"Driver: {driver}")
-        driver_label.add_css_class("card-detail")
-        content_box.append(driver_label)
-        
-        scope = self.resource_data.get("Scope", "")
-        if scope:
-            scope_label = Gtk.Label(label=f"Scope: {scope}")
-            scope_label.add_css_class("card-detail")
-            content_box.append(scope_label)
-    
-    def _add_volume_content(self, content_box):
-        """Add content specific to Docker volumes."""
-        driver = self.resource_data.get("Driver", self.resource_data.get("driver", ""))
-        driver_label = Gtk.Label(label=f"Driver: {driver}")
-        driver_label.add_css_class("card-detail")
-        content_box.append(driver_label)
-        
-        mountpoint = self.resource_data.get("Mountpoint", "")
-        if mountpoint:
-            if len(mountpoint) > 50:
-                mountpoint_display = mountpoint[:47] + "..."
-            else:
-                mountpoint_display = mountpoint
-            mountpoint_label = Gtk.Label(label=f"Mount: {mountpoint_display}")
-            mountpoint_label.add_css_class("card-detail")
-            content_box.append(mountpoint_label)
+    def rebind(self, resource_data):
+        """Show another resource, keeping the card widget and its controllers."""
+        self.bind(resource_data)
     
     def _create_footer(self):
         """Create footer with action buttons."""
         footer_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         footer_box.add_css_class("card-footer")
         
-        if self.resource_type == "image":
-            delete_btn = Gtk.Button(label="Delete")
-            delete_btn.add_css_class("destructive-action")
-            footer_box.append(delete_btn)
-            
-        elif self.resource_type == "container":
-            if self.resource_data.get("State") == "running":
-                stop_btn = Gtk.Button(label="Stop")
-                stop_btn.add_css_class("warning-action")
-                footer_box.append(stop_btn)
-            else:
-                start_btn = Gtk.Button(label="Start")
-                start_btn.add_css_class("success-action")
-                footer_box.append(start_btn)
-            
-            delete_btn = Gtk.Button(label="Delete")
-            delete_btn.add_css_class("destructive-action")
-            footer_box.append(delete_btn)
+        if self.resource_type == "container":
+            # Both are built once; bind() shows the one matching the state
+            self._stop_btn = Gtk.Button(label="Stop")
+            self._stop_btn.add_css_class("warning-action")
+            footer_box.append(self._stop_btn)
             
-        elif self.resource_type in ["network", "volume"]:
+            self._start_btn = Gtk.Button(label="Start")
+            self._start_btn.add_css_class("success-action")
+            footer_box.append(self._start_btn)
+        
+        if self.resource_type in ["image", "container", "network", "volume"]:
             delete_btn = Gtk.Button(label="Delete")
             delete_btn.add_css_class("destructive-action")
             footer_box.append(delete_btn)
@@ -244,16 +260,7 @@ class ResourceCard(Gtk.Box):
     
     def _format_size(self, size_bytes):
         """Format size in bytes to human readable format."""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        
-        return f"{size_bytes:.1f} {size_names[i]}"
+        return format_size(size_bytes)
     
     def set_selected(self, selected):
         """Set the selection state of the card."""
@@ -0,0 +1,97 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import gi
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+
+from .card import ResourceCard
+from .column_list import KeyedListModel, RowItem
+
+
+class CardGrid:
+    """
+    Card mode of a resource view: Gtk.GridView over a KeyedListModel.
+
+    Cards exist only for the cells on screen. A cell scrolled in is rebound
+    to its row and its card shows the new resource with ResourceCard.rebind,
+    so scrolling and refreshes neither create cards nor attach controllers;
+    a bound card follows its row's 'changed' signal with ResourceCard.bind
+    until it is unbound. Selection belongs to the grid's MultiSelection, and
+    each card shows the selected state of its cell.
+    """
+
+    def __init__(self, rows: KeyedListModel, resource_type: str,
+                 on_card_pressed: Optional[Callable[..., None]] = None,
+                 min_columns: int = 2, max_columns: int = 4):
+        """
+        Initialize the grid.
+
+        Args:
+            rows: Model of the grid (values are the resources)
+            resource_type: Card type ("container", "image", "network", "volume")
+            on_card_pressed: Handler of a press on a card, called as
+                handler(gesture, n_press, x, y, resource)
+            min_columns: Minimum cards per line
+            max_columns: Maximum cards per line
+        """
+        self.rows = rows
+        self.resource_type = resource_type
+        self._on_card_pressed = on_card_pressed
+        self._handlers: Dict[Any, Tuple[RowItem, int]] = {}
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("bind", self._on_bind)
+        factory.connect("unbind", self._on_unbind)
+
+        self.selection = Gtk.MultiSelection.new(rows.list_store)
+        self.grid_view = Gtk.GridView(model=self.selection, factory=factory)
+        self.grid_view.set_min_columns(min_columns)
+        self.grid_view.set_max_columns(max_columns)
+        self.grid_view.set_enable_rubberband(True)
+        self.grid_view.add_css_class(f"{resource_type}s-grid")
+
+        self.widget = Gtk.ScrolledWindow()
+        self.widget.set_vexpand(True)
+        self.widget.set_child(self.grid_view)
+
+    def get_selected(self) -> List[Any]:
+        """
+        Get the selected resources.
+
+        Returns:
+            List of resources
+        """
+        return self.rows.get_selected(self.selection)
+
+    def _create_card(self, list_item, resource: Any) -> ResourceCard:
+        """Create the card of a cell, once per recycled cell."""
+        card = ResourceCard(resource_type=self.resource_type, resource_data=resource, selectable=False)
+        list_item.connect("notify::selected", lambda item, pspec: card.set_selected(item.get_selected()))
+        if self._on_card_pressed is not None:
+            gesture = Gtk.GestureClick()
+            gesture.set_button(0)
+            # The card may show another resource by the time it is pressed
+            gesture.connect(
+                "pressed",
+                lambda gesture, n_press, x, y: self._on_card_pressed(gesture, n_press, x, y, card.resource_data)
+            )
+            card.add_controller(gesture)
+        return card
+
+    def _on_bind(self, factory, list_item):
+        item = list_item.get_item()
+        card = list_item.get_child()
+        if card is None:
+            card = self._create_card(list_item, item.resource)
+            list_item.set_child(card)
+        elif card.resource_data is not item.resource:
+            card.rebind(item.resource)
+        card.set_selected(list_item.get_selected())
+        # Same resource, new data: only the changed fields are updated
+        handler = item.connect("changed", lambda row: card.bind(row.resource))
+        self._handlers[list_item] = (item, handler)
+
+    def _on_unbind(self, factory, list_item):
+        item, handler = self._handlers.pop(list_item, (None, None))
+        if item is not None:
+            item.disconnect(handler)
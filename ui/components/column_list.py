@@ -0,0 +1,319 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import gi
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gio, GObject, Gtk, Pango
+
+
+def plan_splices(old_keys: Sequence[str], new_keys: Sequence[str]) -> List[Tuple[int, int, range]]:
+    """
+    Plan the splices turning one keyed order into another.
+
+    Keys present in both orders keep their rows where their relative order
+    is unchanged (the longest increasing run of their old positions); the
+    other rows are removed and the new or moved ones inserted, one splice
+    per gap between kept rows.
+
+    Args:
+        old_keys: Keys in the current model order
+        new_keys: Keys in the new order
+
+    Returns:
+        List of (position, removals, indexes into new_keys to insert), to
+        apply in order
+    """
+    start = 0
+    limit = min(len(old_keys), len(new_keys))
+    while start < limit and old_keys[start] == new_keys[start]:
+        start += 1
+    old_end, new_end = len(old_keys), len(new_keys)
+    while old_end > start and new_end > start and old_keys[old_end - 1] == new_keys[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    if old_end == start and new_end == start:
+        return []
+
+    old_positions = {key: index for index, key in enumerate(old_keys[start:old_end])}
+    common = [
+        (index, old_positions[key])
+        for index, key in enumerate(new_keys[start:new_end])
+        if key in old_positions
+    ]
+    kept = _longest_increasing(common)
+
+    splices = []
+    position = start
+    old_index = new_index = 0
+    for new_anchor, old_anchor in kept + [(new_end - start, old_end - start)]:
+        removals = old_anchor - old_index
+        inserted = range(start + new_index, start + new_anchor)
+        if removals or inserted:
+            splices.append((position, removals, inserted))
+        position += len(inserted) + 1
+        old_index, new_index = old_anchor + 1, new_anchor + 1
+    return splices
+
+
+def _longest_increasing(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Longest subsequence of (new, old) position pairs with increasing old positions."""
+    tails: List[int] = []
+    tail_pairs: List[int] = []
+    previous = [-1] * len(pairs)
+    for index, (_, old_position) in enumerate(pairs):
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if tails[middle] < old_position:
+                low = middle + 1
+            else:
+                high = middle
+        if low:
+            previous[index] = tail_pairs[low - 1]
+        if low == len(tails):
+            tails.append(old_position)
+            tail_pairs.append(index)
+        else:
+            tails[low] = old_position
+            tail_pairs[low] = index
+
+    result = []
+    index = tail_pairs[-1] if tail_pairs else -1
+    while index >= 0:
+        result.append(pairs[index])
+        index = previous[index]
+    result.reverse()
+    return result
+
+
+def _identity(resource: Any) -> Any:
+    return resource
+
+
+class RowItem(GObject.Object):
+    """Row of a list model: resource ID, displayed values and the resource."""
+
+    __gtype_name__ = 'RowItem'
+    __gsignals__ = {
+        'changed': (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
+
+    def __init__(self, key: str, values: Any, resource: Any):
+        super().__init__()
+        self.key = key
+        self.values = values
+        self.resource = resource
+
+    def update(self, values: Any, resource: Any):
+        """
+        Show new data; the bound cells follow through 'changed'.
+
+        Args:
+            values: Displayed values (column texts, or the resource)
+            resource: Resource of the row
+        """
+        self.resource = resource
+        if values != self.values:
+            self.values = values
+            self.emit('changed')
+
+
+class KeyedListModel:
+    """
+    Gio.ListStore of RowItems keyed by resource ID.
+
+    Applies the 'items_added' / 'items_removed' / 'items_changed' events of a
+    ResourceManager to the affected rows only, so one changed resource
+    touches one row instead of rebuilding the whole view. A reset diffs the
+    keys against the model and applies the difference with splice(), so rows
+    that stay keep their items (and their selection), and rows whose columns
+    changed only notify their bound cells.
+    """
+
+    def __init__(self, get_key: Callable[[Any], str],
+                 get_row: Optional[Callable[[Any], List[str]]] = None):
+        """
+        Initialize the model.
+
+        Args:
+            get_key: Function returning the ID of a resource
+            get_row: Function returning the column texts of a resource; if
+                None the resource itself is the value, so a row changes
+                whenever any field of its resource does (cards)
+        """
+        self._get_key = get_key
+        self._rows: Dict[str, RowItem] = {}
+        self.list_store = Gio.ListStore(item_type=RowItem)
+        self._get_row = get_row if get_row is not None else _identity
+        # Keys in model order
+        self._keys: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def reset(self, resources: Sequence[Any]):
+        """
+        Show resources in a new order, splicing in only the differences.
+
+        Args:
+            resources: Resources to show, in display order
+        """
+        keys = []
+        items: Dict[str, RowItem] = {}
+        for resource in resources:
+            key = self._get_key(resource)
+            item = self._rows.get(key)
+            if item is None:
+                item = RowItem(key, self._get_row(resource), resource)
+            else:
+                item.update(self._get_row(resource), resource)
+            keys.append(key)
+            items[key] = item
+
+        for position, removals, inserted in plan_splices(self._keys, keys):
+            self.list_store.splice(position, removals, [items[keys[index]] for index in inserted])
+        self._keys = keys
+        self._rows = items
+
+    def apply(self, event_type: str, data: Any, is_visible: Optional[Callable[[Any], bool]] = None):
+        """
+        Apply a keyed change event.
+
+        Args:
+            event_type: 'items_added', 'items_removed' or 'items_changed'
+            data: Resources (IDs for 'items_removed')
+            is_visible: Function telling if a resource passes the current
+                search and filters (all resources are shown if None)
+        """
+        if event_type == 'items_removed':
+            for key in data:
+                self.remove(key)
+            return
+
+        for resource in data:
+            if is_visible is None or is_visible(resource):
+                self.upsert(resource)
+            else:
+                # A changed resource may no longer match the search
+                self.remove(self._get_key(resource))
+
+    def upsert(self, resource: Any):
+        """
+        Update the row of a resource, appending it if it is not shown.
+
+        Args:
+            resource: Resource to show
+        """
+        key = self._get_key(resource)
+        item = self._rows.get(key)
+        if item is None:
+            item = RowItem(key, self._get_row(resource), resource)
+            self.list_store.append(item)
+            self._keys.append(key)
+            self._rows[key] = item
+        else:
+            item.update(self._get_row(resource), resource)
+
+    def remove(self, key: str):
+        """
+        Remove the row of a resource.
+
+        Args:
+            key: ID of the resource
+        """
+        if self._rows.pop(key, None) is not None:
+            position = self._keys.index(key)
+            self.list_store.remove(position)
+            del self._keys[position]
+
+    def get_selected(self, selection: Gtk.SelectionModel) -> List[Any]:
+        """
+        Get the selected resources.
+
+        Args:
+            selection: Selection model over the list store
+
+        Returns:
+            Resources of the selected rows, in model order
+        """
+        selected = selection.get_selection()
+        return [
+            self.list_store.get_item(selected.get_nth(index)).resource
+            for index in range(selected.get_size())
+        ]
+
+
+class ColumnList:
+    """
+    List mode of a resource view: Gtk.ColumnView over a KeyedListModel.
+
+    Cells are labels created by a SignalListItemFactory for the visible
+    rows only and rebound as rows scroll in; a bound cell listens to its
+    row's 'changed' signal until it is unbound.
+    """
+
+    def __init__(self, rows: KeyedListModel, columns: Sequence[Tuple[str, int, int, Optional[str]]],
+                 sort_headers=None):
+        """
+        Initialize the list.
+
+        Args:
+            rows: Model of the list
+            columns: (title, column index, width, sort key) of every column;
+                a column with the sort key None does not sort
+            sort_headers: SortHeaders making the column headers sort (none if None)
+        """
+        self.rows = rows
+        self._handlers: Dict[Any, Tuple[RowItem, int]] = {}
+
+        self.selection = Gtk.MultiSelection.new(rows.list_store)
+        self.column_view = Gtk.ColumnView(model=self.selection)
+        self.column_view.set_show_column_separators(True)
+
+        for title, column_id, width, sort_key in columns:
+            factory = Gtk.SignalListItemFactory()
+            factory.connect("setup", self._on_setup)
+            factory.connect("bind", self._on_bind, column_id)
+            factory.connect("unbind", self._on_unbind)
+
+            column = Gtk.ColumnViewColumn(title=title, factory=factory)
+            column.set_fixed_width(width)
+            column.set_resizable(True)
+            if sort_headers is not None and sort_key is not None:
+                sort_headers.attach_view_column(column, sort_key)
+            self.column_view.append_column(column)
+
+        if sort_headers is not None:
+            sort_headers.attach_column_view(self.column_view)
+
+        self.widget = Gtk.ScrolledWindow()
+        self.widget.set_vexpand(True)
+        self.widget.set_child(self.column_view)
+
+    def get_selected(self) -> List[Any]:
+        """
+        Get the selected resources.
+
+        Returns:
+            List of resources
+        """
+        return self.rows.get_selected(self.selection)
+
+    def _on_setup(self, factory, list_item):
+        label = Gtk.Label(xalign=0)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        list_item.set_child(label)
+
+    def _on_bind(self, factory, list_item, column_id: int):
+        label = list_item.get_child()
+        item = list_item.get_item()
+        label.set_text(item.values[column_id])
+        handler = item.connect("changed", lambda row: label.set_text(row.values[column_id]))
+        self._handlers[list_item] = (item, handler)
+
+    def _on_unbind(self, factory, list_item):
+        item, handler = self._handlers.pop(list_item, (None, None))
+        if item is not None:
+            item.disconnect(handler)
@@ -3,7 +3,9 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
 
 from ui.components.search import SearchBar
-from ui.components.card import ResourceCard
+from ui.components.card_grid import CardGrid
+from ui.components.column_list import KeyedListModel, ColumnList
+from ui.components.sort_headers import SortHeaders
 
 
 class ContainersView(Gtk.Box):
@@ -76,49 +78,26 @@ class ContainersView(Gtk.Box):
     
     def _create_list_view(self):
         """Create the list view."""
-        self.list_store = Gtk.ListStore(str, str, str, str, str)
+        self.list_rows = KeyedListModel(self.container_manager.get_resource_id, self._get_container_row)
         
-        self.tree_view = Gtk.TreeView(model=self.list_store)
-        self.tree_view.set_headers_visible(True)
-        
-        selection = self.tree_view.get_selection()
-        selection.set_mode(Gtk.SelectionMode.MULTIPLE)
-        
-        # Колонки
         columns = [
-            ("Имя", 0, 200),
-            ("Образ", 1, 200),
-            ("Статус", 2, 100),
-            ("Порты", 3, 150),
-            ("Размер", 4, 100)
+            ("Имя", 0, 200, 'name'),
+            ("Образ", 1, 200, 'image'),
+            ("Статус", 2, 100, 'status'),
+            ("Порты", 3, 150, 'ports'),
+            ("Размер", 4, 100, None)
         ]
         
-        for title, column_id, width in columns:
-            renderer = Gtk.CellRendererText()
-            column = Gtk.TreeViewColumn(title, renderer, text=column_id)
-            column.set_min_width(width)
-            column.set_resizable(True)
-            self.tree_view.append_column(column)
-        
-        list_container = Gtk.ScrolledWindow()
-        list_container.set_vexpand(True)
-        list_container.set_child(self.tree_view)
-        
-        self.list_container = list_container
+        self.sort_headers = SortHeaders(self.container_manager)
+        self.column_list = ColumnList(self.list_rows, columns, self.sort_headers)
+        self.list_container = self.column_list.widget
     
     def _create_cards_view(self):
         """Create the cards view."""
-        self.containers_grid = Gtk.FlowBox()
-        self.containers_grid.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
-        self.containers_grid.set_max_children_per_line(4)
-        self.containers_grid.set_min_children_per_line(2)
-        self.containers_grid.add_css_class("containers-grid")
-        
-        grid_container = Gtk.ScrolledWindow()
-        grid_container.set_vexpand(True)
-        grid_container.set_child(self.containers_grid)
-        
-        self.grid_container = grid_container
+        self.card_rows = KeyedListModel(self.container_manager.get_resource_id)
+        self.card_grid = CardGrid(self.card_rows, "container", self._on_card_clicked)
+        self.containers_grid = self.card_grid.grid_view
+        self.grid_container = self.card_grid.widget
     
     def _show_list_view(self):
         """Show the list view."""
@@ -145,7 +124,7 @@ class ContainersView(Gtk.Box):
     def _load_data(self):
         """Load the data."""
         self.containers = self.container_manager.get_resources()
-        self.filtered_containers = self.containers.copy()
+        self.filtered_containers = self.containers
         self._update_view()
     
     def _update_view(self):
@@ -157,61 +136,43 @@ class ContainersView(Gtk.Box):
     
     def _update_list_view(self):
         """Update the list view."""
-        self.list_store.clear()
-        
-        for container in self.filtered_containers:
-            ports = container.get('Ports', [])
-            ports_str = container.get('ports', '')
-            if isinstance(ports, list):
-                ports_display = ', '.join(ports) if ports else ''
-            elif ports_str:
-                ports_display = ports_str
-            else:
-                ports_display = ''
-            
-            self.list_store.append([
-                container.get('Names', [''])[0] if container.get('Names') else '',
-                container.get('Image', ''),
-                container.get('Status', ''),
-                ports_display,
-                container.get('Size', '')
-            ])
+        self.list_rows.reset(self.filtered_containers)
+    
+    def _get_container_row(self, container):
+        """Get the list view columns of a container."""
+        ports = container.get('Ports', [])
+        ports_str = container.get('ports', '')
+        if isinstance(ports, list):
+            ports_display = ', '.join(ports) if ports else ''
+        elif ports_str:
+            ports_display = ports_str
+        else:
+            ports_display = ''
+        
+        return [
+            container.get('Names', [''])[0] if container.get('Names') else '',
+            container.get('Image', ''),
+            container.get('Status', ''),
+            ports_display,
+            container.get('Size', '')
+        ]
     
     def _update_cards_view(self):
         """Update the cards view."""
-        for child in self.containers_grid:
-            self.containers_grid.remove(child)
-        
-        for container in self.filtered_containers:
-            card = self._create_container_card(container)
-            self.containers_grid.append(card)
-    
-    def _create_container_card(self, container):
-        """Create the container card."""
-        card = ResourceCard(
-            resource_type="container",
-            resource_data=container
-        )
-        
-        gesture = Gtk.GestureClick()
-        gesture.connect("pressed", self._on_card_clicked, container)
-        card.add_controller(gesture)
-        
-        return card
+        self.card_rows.reset(self.filtered_containers)
     
     def _on_search_changed(self, search_bar, query):
         """Handler for search change."""
         self.current_search_text = query
-        self.container_manager.search(query)
-        self._apply_filters()
+        self.container_manager.request_search(query, self.current_filters)
     
     def _apply_filters(self):
         """Apply filters."""
-        self.container_manager.filter(self.current_filters)
+        self.container_manager.request_search(filters=self.current_filters)
     
     def _on_refresh(self, button):
         """Handler for refresh."""
-        self.container_manager.refresh(self._on_data_updated)
+        self.container_manager.refresh()  # Changed rows arrive as items_* events
     
     def _on_toggle_view(self, button):
         """Handler for toggle view."""
@@ -280,33 +241,27 @@ class ContainersView(Gtk.Box):
     def _on_select_all(self, button):
         """Select all containers."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().select_all()
+            self.column_list.selection.select_all()
         else:
-            self.containers_grid.select_all()
+            self.card_grid.selection.select_all()
     
     def _on_deselect_all(self, button):
         """Deselect all containers."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().unselect_all()
+            self.column_list.selection.unselect_all()
         else:
-            self.containers_grid.unselect_all()
+            self.card_grid.selection.unselect_all()
     
     def _on_delete_selected(self, button):
         """Delete selected containers."""
         if self.view_mode == "list":
-            selection = self.tree_view.get_selection()
-            model, paths = selection.get_selected_rows()
-            selected_containers = []
-            for path in paths:
-                iter = model.get_iter(path)
-                container_name = model.get_value(iter, 0)
-                selected_containers.append(container_name)
+            selected_containers = [
+                container.get('Names', [''])[0] for container in self.column_list.get_selected()
+            ]
         else:
-            selected_containers = []
-            for child in self.containers_grid.get_selected_children():
-                card = child.get_child()
-                if hasattr(card, 'resource_data'):
-                    selected_containers.append(card.resource_data.get('Names', [''])[0])
+            selected_containers = [
+                container.get('Names', [''])[0] for container in self.card_grid.get_selected()
+            ]
         
         if selected_containers:
             print(f"Удаление выбранных контейнеров: {selected_containers} - не реализовано")
@@ -315,11 +270,19 @@ class ContainersView(Gtk.Box):
     
     def _on_container_manager_event(self, event_type, data):
         """Handler for container manager events."""
-        if event_type == 'loading_complete':
-            GLib.idle_add(self._on_data_updated)
+        if event_type in ('items_added', 'items_removed', 'items_changed'):
+            GLib.idle_add(self._on_items_changed, event_type, data)
         elif event_type == 'ui_update':
             GLib.idle_add(self._on_data_updated)
     
+    def _on_items_changed(self, event_type, data):
+        """Handler for keyed changes: patch only the affected rows."""
+        rows = self.list_rows if self.view_mode == "list" else self.card_rows
+        rows.apply(event_type, data, self.container_manager.is_resource_visible)
+        self.containers = self.container_manager.get_resources()
+        self.filtered_containers = self.container_manager.get_filtered_resources()
+        return False
+    
     def _on_data_updated(self):
         """Handler for data update."""
         self.containers = self.container_manager.get_resources()
@@ -105,25 +105,26 @@ class Dashboard(Gtk.Box):
     
     def refresh_data(self):
         """Refresh dashboard data."""
-        def _refresh():
-            try:
-                if self.container_manager:
-                    self.container_manager.refresh()
-                if self.image_manager:
-                    self.image_manager.refresh()
-                if self.network_manager:
-                    self.network_manager.refresh()
-                if self.volume_manager:
-                    self.volume_manager.refresh()
-                
+        managers = [
+            manager for manager in (
+                self.container_manager, self.image_manager,
+                self.network_manager, self.volume_manager
+            ) if manager
+        ]
+        
+        try:
+            # Joins refreshes already in flight instead of starting new ones
+            futures = [manager.refresh() for manager in managers]
+        except Exception as e:
+            self._show_error(str(e))
+            return
+        
+        def _on_done(_future):
+            if all(future.done() for future in futures):
                 GLib.idle_add(self._update_ui)
-                
-            except Exception as e:
-                GLib.idle_add(self._show_error, str(e))
         
-        import threading
-        thread = threading.Thread(target=_refresh, daemon=True)
-        thread.start()
+        for future in futures:
+            future.add_done_callback(_on_done)
     
     def _update_ui(self):
         """Update UI with current data."""
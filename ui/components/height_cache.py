@@ -0,0 +1,151 @@
+from typing import Dict, Optional
+
+
+class HeightCache:
+    """
+    Heights of list items with O(log n) mapping between offset and index.
+
+    Unmeasured items count as the estimate. Measured heights are kept as
+    deviations from it in a Fenwick (binary indexed) tree, so a list of
+    estimates costs one zero-filled array and measuring an item updates
+    O(log n) nodes; the estimates are corrected one item at a time as rows
+    are measured, never by a full rebuild.
+    """
+
+    def __init__(self, estimate: int = 60):
+        """
+        Initialize an empty cache.
+
+        Args:
+            estimate: Height of an item that was not measured yet
+        """
+        self.estimate = estimate
+        self._count = 0
+        self._tree = [0]
+        self._heights: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def reset(self, count: int, heights: Optional[Dict[int, int]] = None,
+              estimate: Optional[int] = None):
+        """
+        Start over with a new number of items.
+
+        Args:
+            count: Number of items
+            heights: Known heights by item index
+            estimate: New estimate for the unmeasured items (kept if None)
+        """
+        if estimate is not None:
+            self.estimate = max(1, estimate)
+        self._count = count
+        self._tree = [0] * (count + 1)
+        self._heights = {}
+        for index, height in (heights or {}).items():
+            self.set(index, height)
+
+    def get(self, index: int) -> int:
+        """
+        Get the height of an item.
+
+        Args:
+            index: Item index
+
+        Returns:
+            Measured height, or the estimate
+        """
+        return self._heights.get(index, self.estimate)
+
+    def is_measured(self, index: int) -> bool:
+        return index in self._heights
+
+    @property
+    def measured_count(self) -> int:
+        return len(self._heights)
+
+    def get_measured_mean(self) -> Optional[int]:
+        """
+        Get the mean measured height.
+
+        Returns:
+            Rounded mean, or None if nothing was measured
+        """
+        if not self._heights:
+            return None
+        return round(sum(self._heights.values()) / len(self._heights))
+
+    def set(self, index: int, height: int) -> int:
+        """
+        Record the measured height of an item.
+
+        Args:
+            index: Item index
+            height: Height in pixels (at least 1)
+
+        Returns:
+            Change of the item's height
+        """
+        height = max(1, int(height))
+        change = height - self.get(index)
+        self._heights[index] = height
+        if change:
+            tree = self._tree
+            position = index + 1
+            while position <= self._count:
+                tree[position] += change
+                position += position & -position
+        return change
+
+    def get_offset(self, index: int) -> int:
+        """
+        Get the offset of an item (the sum of the heights before it).
+
+        Args:
+            index: Item index (len() for the end of the list)
+
+        Returns:
+            Offset in pixels
+        """
+        index = min(index, self._count)
+        total = index * self.estimate
+        if not self._heights:
+            return total
+        tree = self._tree
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    @property
+    def total(self) -> int:
+        return self.get_offset(self._count)
+
+    def get_index_at(self, offset: float) -> int:
+        """
+        Get the item covering an offset.
+
+        Args:
+            offset: Offset in pixels
+
+        Returns:
+            Item index, clamped to the list
+        """
+        if not self._count or offset <= 0:
+            return 0
+        if not self._heights:
+            return min(int(offset // self.estimate), self._count - 1)
+        tree = self._tree
+        position = 0
+        remaining = offset
+        step = 1 << (self._count.bit_length() - 1)
+        while step:
+            following = position + step
+            # Node `following` covers exactly `step` items after `position`
+            if following <= self._count:
+                span = step * self.estimate + tree[following]
+                if span <= remaining:
+                    position = following
+                    remaining -= span
+            step >>= 1
+        return min(position, self._count - 1)
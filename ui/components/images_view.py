@@ -3,7 +3,9 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
 
 from ui.components.search import SearchBar
-from ui.components.card import ResourceCard
+from ui.components.card_grid import CardGrid
+from ui.components.column_list import KeyedListModel, ColumnList
+from ui.components.sort_headers import SortHeaders
 
 
 class ImagesView(Gtk.Box):
@@ -76,48 +78,26 @@ class ImagesView(Gtk.Box):
     
     def _create_list_view(self):
         """Create the list view."""
-        self.list_store = Gtk.ListStore(str, str, str, str, str)
-        
-        self.tree_view = Gtk.TreeView(model=self.list_store)
-        self.tree_view.set_headers_visible(True)
-        
-        selection = self.tree_view.get_selection()
-        selection.set_mode(Gtk.SelectionMode.MULTIPLE)
+        self.list_rows = KeyedListModel(self.image_manager.get_resource_id, self._get_image_row)
         
         columns = [
-            ("Репозиторий", 0, 200),
-            ("Тег", 1, 100),
-            ("ID", 2, 150),
-            ("Размер", 3, 100),
-            ("Создан", 4, 150)
+            ("Репозиторий", 0, 200, 'repository'),
+            ("Тег", 1, 100, 'tag'),
+            ("ID", 2, 150, 'id'),
+            ("Размер", 3, 100, 'size'),
+            ("Создан", 4, 150, 'created')
         ]
         
-        for title, column_id, width in columns:
-            renderer = Gtk.CellRendererText()
-            column = Gtk.TreeViewColumn(title, renderer, text=column_id)
-            column.set_min_width(width)
-            column.set_resizable(True)
-            self.tree_view.append_column(column)
-        
-        list_container = Gtk.ScrolledWindow()
-        list_container.set_vexpand(True)
-        list_container.set_child(self.tree_view)
-        
-        self.list_container = list_container
+        self.sort_headers = SortHeaders(self.image_manager)
+        self.column_list = ColumnList(self.list_rows, columns, self.sort_headers)
+        self.list_container = self.column_list.widget
     
     def _create_cards_view(self):
         """Create the cards view."""
-        self.images_grid = Gtk.FlowBox()
-        self.images_grid.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
-        self.images_grid.set_max_children_per_line(4)
-        self.images_grid.set_min_children_per_line(2)
-        self.images_grid.add_css_class("images-grid")
-        
-        grid_container = Gtk.ScrolledWindow()
-        grid_container.set_vexpand(True)
-        grid_container.set_child(self.images_grid)
-        
-        self.grid_container = grid_container
+        self.card_rows = KeyedListModel(self.image_manager.get_resource_id)
+        self.card_grid = CardGrid(self.card_rows, "image", self._on_card_clicked)
+        self.images_grid = self.card_grid.grid_view
+        self.grid_container = self.card_grid.widget
     
     def _show_list_view(self):
         """Show the list view."""
@@ -144,7 +124,7 @@ class ImagesView(Gtk.Box):
     def _load_data(self):
         """Load the data."""
         self.images = self.image_manager.get_resources()
-        self.filtered_images = self.images.copy()
+        self.filtered_images = self.images
         self._update_view()
     
     def _update_view(self):
@@ -156,52 +136,34 @@ class ImagesView(Gtk.Box):
     
     def _update_list_view(self):
         """Update the list view."""
-        self.list_store.clear()
+        self.list_rows.reset(self.filtered_images)
+    
+    def _get_image_row(self, image):
+        """Get the list view columns of a image."""
+        repo = image.get('Repository', '')
+        tag = image.get('Tag', '')
+        image_id = image.get('Id', '')
+        size = str(image.get('Size', ''))
+        created = image.get('Created', '')
         
-        for image in self.filtered_images:
-            repo = image.get('Repository', '')
-            tag = image.get('Tag', '')
-            image_id = image.get('Id', '')
-            size = str(image.get('Size', ''))
-            created = image.get('Created', '')
-            
-            self.list_store.append([repo, tag, image_id, size, created])
+        return [repo, tag, image_id, size, created]
     
     def _update_cards_view(self):
         """Update the cards view."""
-        for child in self.images_grid:
-            self.images_grid.remove(child)
-        
-        for image in self.filtered_images:
-            card = self._create_image_card(image)
-            self.images_grid.append(card)
-    
-    def _create_image_card(self, image):
-        """Create the image card."""
-        card = ResourceCard(
-            resource_type="image",
-            resource_data=image
-        )
-        
-        gesture = Gtk.GestureClick()
-        gesture.connect("pressed", self._on_card_clicked, image)
-        card.add_controller(gesture)
-        
-        return card
+        self.card_rows.reset(self.filtered_images)
     
     def _on_search_changed(self, search_bar, query):
         """Handler for search change."""
         self.current_search_text = query
-        self.image_manager.search(query)
-        self._apply_filters()
+        self.image_manager.request_search(query, self.current_filters)
     
     def _apply_filters(self):
         """Apply filters."""
-        self.image_manager.filter(self.current_filters)
+        self.image_manager.request_search(filters=self.current_filters)
     
     def _on_refresh(self, button):
         """Handler for refresh."""
-        self.image_manager.refresh(self._on_data_updated)
+        self.image_manager.refresh()  # Changed rows arrive as items_* events
     
     def _on_toggle_view(self, button):
         """Handler for toggle view."""
@@ -262,36 +224,29 @@ class ImagesView(Gtk.Box):
     def _on_select_all(self, button):
         """Select all images."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().select_all()
+            self.column_list.selection.select_all()
         else:
-            self.images_grid.select_all()
+            self.card_grid.selection.select_all()
     
     def _on_deselect_all(self, button):
         """Deselect all images."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().unselect_all()
+            self.column_list.selection.unselect_all()
         else:
-            self.images_grid.unselect_all()
+            self.card_grid.selection.unselect_all()
     
     def _on_delete_selected(self, button):
         """Delete selected images."""
         if self.view_mode == "list":
-            selection = self.tree_view.get_selection()
-            model, paths = selection.get_selected_rows()
-            selected_images = []
-            for path in paths:
-                iter = model.get_iter(path)
-                image_repo = model.get_value(iter, 0)
-                image_tag = model.get_value(iter, 1)
-                selected_images.append(f"{image_repo}:{image_tag}")
+            selected_images = [
+                f"{image.get('Repository', '')}:{image.get('Tag', '')}"
+                for image in self.column_list.get_selected()
+            ]
         else:
-            selected_images = []
-            for child in self.images_grid.get_selected_children():
-                card = child.get_child()
-                if hasattr(card, 'resource_data'):
-                    repo = card.resource_data.get('Repository', '')
-                    tag = card.resource_data.get('Tag', '')
-                    selected_images.append(f"{repo}:{tag}")
+            selected_images = [
+                f"{image.get('Repository', '')}:{image.get('Tag', '')}"
+                for image in self.card_grid.get_selected()
+            ]
         
         if selected_images:
             print(f"Удаление выбранных образов: {selected_images} - не реализовано")
@@ -300,11 +255,19 @@ class ImagesView(Gtk.Box):
     
     def _on_image_manager_event(self, event_type, data):
         """Handler for image manager events."""
-        if event_type == 'loading_complete':
-            GLib.idle_add(self._on_data_updated)
+        if event_type in ('items_added', 'items_removed', 'items_changed'):
+            GLib.idle_add(self._on_items_changed, event_type, data)
         elif event_type == 'ui_update':
             GLib.idle_add(self._on_data_updated)
     
+    def _on_items_changed(self, event_type, data):
+        """Handler for keyed changes: patch only the affected rows."""
+        rows = self.list_rows if self.view_mode == "list" else self.card_rows
+        rows.apply(event_type, data, self.image_manager.is_resource_visible)
+        self.images = self.image_manager.get_resources()
+        self.filtered_images = self.image_manager.get_filtered_resources()
+        return False
+    
     def _on_data_updated(self):
         """Handler for data update."""
         self.images = self.image_manager.get_resources()
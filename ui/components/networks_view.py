@@ -3,7 +3,9 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
 
 from ui.components.search import SearchBar
-from ui.components.card import ResourceCard
+from ui.components.card_grid import CardGrid
+from ui.components.column_list import KeyedListModel, ColumnList
+from ui.components.sort_headers import SortHeaders
 
 
 class NetworksView(Gtk.Box):
@@ -76,47 +78,25 @@ class NetworksView(Gtk.Box):
     
     def _create_list_view(self):
         """Create the list view."""
-        self.list_store = Gtk.ListStore(str, str, str, str)
-        
-        self.tree_view = Gtk.TreeView(model=self.list_store)
-        self.tree_view.set_headers_visible(True)
-        
-        selection = self.tree_view.get_selection()
-        selection.set_mode(Gtk.SelectionMode.MULTIPLE)
+        self.list_rows = KeyedListModel(self.network_manager.get_resource_id, self._get_network_row)
         
         columns = [
-            ("Имя", 0, 200),
-            ("Драйвер", 1, 100),
-            ("Область", 2, 100),
-            ("Подсеть", 3, 150)
+            ("Имя", 0, 200, 'name'),
+            ("Драйвер", 1, 100, 'driver'),
+            ("Область", 2, 100, 'scope'),
+            ("Подсеть", 3, 150, None)
         ]
         
-        for title, column_id, width in columns:
-            renderer = Gtk.CellRendererText()
-            column = Gtk.TreeViewColumn(title, renderer, text=column_id)
-            column.set_min_width(width)
-            column.set_resizable(True)
-            self.tree_view.append_column(column)
-        
-        list_container = Gtk.ScrolledWindow()
-        list_container.set_vexpand(True)
-        list_container.set_child(self.tree_view)
-        
-        self.list_container = list_container
+        self.sort_headers = SortHeaders(self.network_manager)
+        self.column_list = ColumnList(self.list_rows, columns, self.sort_headers)
+        self.list_container = self.column_list.widget
     
     def _create_cards_view(self):
         """Create the cards view."""
-        self.networks_grid = Gtk.FlowBox()
-        self.networks_grid.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
-        self.networks_grid.set_max_children_per_line(4)
-        self.networks_grid.set_min_children_per_line(2)
-        self.networks_grid.add_css_class("networks-grid")
-        
-        grid_container = Gtk.ScrolledWindow()
-        grid_container.set_vexpand(True)
-        grid_container.set_child(self.networks_grid)
-        
-        self.grid_container = grid_container
+        self.card_rows = KeyedListModel(self.network_manager.get_resource_id)
+        self.card_grid = CardGrid(self.card_rows, "network", self._on_card_clicked)
+        self.networks_grid = self.card_grid.grid_view
+        self.grid_container = self.card_grid.widget
     
     def _show_list_view(self):
         """Show the list view."""
@@ -143,7 +123,7 @@ class NetworksView(Gtk.Box):
     def _load_data(self):
         """Load the data."""
         self.networks = self.network_manager.get_resources()
-        self.filtered_networks = self.networks.copy()
+        self.filtered_networks = self.networks
         self._update_view()
     
     def _update_view(self):
@@ -155,51 +135,33 @@ class NetworksView(Gtk.Box):
     
     def _update_list_view(self):
         """Update the list view."""
-        self.list_store.clear()
-        
-        for network in self.filtered_networks:
-            self.list_store.append([
-                network.get('Name', ''),
-                network.get('Driver', ''),
-                network.get('Scope', ''),
-                network.get('Subnet', '')
-            ])
+        self.list_rows.reset(self.filtered_networks)
+    
+    def _get_network_row(self, network):
+        """Get the list view columns of a network."""
+        return [
+            network.get('Name', ''),
+            network.get('Driver', ''),
+            network.get('Scope', ''),
+            network.get('Subnet', '')
+        ]
     
     def _update_cards_view(self):
         """Update the cards view."""
-        for child in self.networks_grid:
-            self.networks_grid.remove(child)
-        
-        for network in self.filtered_networks:
-            card = self._create_network_card(network)
-            self.networks_grid.append(card)
-    
-    def _create_network_card(self, network):
-        """Create the network card."""
-        card = ResourceCard(
-            resource_type="network",
-            resource_data=network
-        )
-        
-        gesture = Gtk.GestureClick()
-        gesture.connect("pressed", self._on_card_clicked, network)
-        card.add_controller(gesture)
-        
-        return card
+        self.card_rows.reset(self.filtered_networks)
     
     def _on_search_changed(self, search_bar, query):
         """Handler for search change."""
         self.current_search_text = query
-        self.network_manager.search(query)
-        self._apply_filters()
+        self.network_manager.request_search(query, self.current_filters)
     
     def _apply_filters(self):
         """Apply the filters."""
-        self.network_manager.filter(self.current_filters)
+        self.network_manager.request_search(filters=self.current_filters)
     
     def _on_refresh(self, button):
         """Handler for refresh."""
-        self.network_manager.refresh(self._on_data_updated)
+        self.network_manager.refresh()  # Changed rows arrive as items_* events
     
     def _on_toggle_view(self, button):
         """Handler for toggle view."""
@@ -250,33 +212,23 @@ class NetworksView(Gtk.Box):
     def _on_select_all(self, button):
         """Select all networks."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().select_all()
+            self.column_list.selection.select_all()
         else:
-            self.networks_grid.select_all()
+            self.card_grid.selection.select_all()
     
     def _on_deselect_all(self, button):
         """Deselect all networks."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().unselect_all()
+            self.column_list.selection.unselect_all()
         else:
-            self.networks_grid.unselect_all()
+            self.card_grid.selection.unselect_all()
     
     def _on_delete_selected(self, button):
         """Delete selected networks."""
         if self.view_mode == "list":
-            selection = self.tree_view.get_selection()
-            model, paths = selection.get_selected_rows()
-            selected_networks = []
-            for path in paths:
-                iter = model.get_iter(path)
-                network_name = model.get_value(iter, 0)
-                selected_networks.append(network_name)
+            selected_networks = [network.get('Name', '') for network in self.column_list.get_selected()]
         else:
-            selected_networks = []
-            for child in self.networks_grid.get_selected_children():
-                card = child.get_child()
-                if hasattr(card, 'resource_data'):
-                    selected_networks.append(card.resource_data.get('Name', ''))
+            selected_networks = [network.get('Name', '') for network in self.card_grid.get_selected()]
         
         if selected_networks:
             print(f"Удаление выбранных сетей: {selected_networks} - не реализовано")
@@ -285,11 +237,19 @@ class NetworksView(Gtk.Box):
     
     def _on_network_manager_event(self, event_type, data):
         """Handler for network manager events."""
-        if event_type == 'loading_complete':
-            GLib.idle_add(self._on_data_updated)
+        if event_type in ('items_added', 'items_removed', 'items_changed'):
+            GLib.idle_add(self._on_items_changed, event_type, data)
         elif event_type == 'ui_update':
             GLib.idle_add(self._on_data_updated)
     
+    def _on_items_changed(self, event_type, data):
+        """Handler for keyed changes: patch only the affected rows."""
+        rows = self.list_rows if self.view_mode == "list" else self.card_rows
+        rows.apply(event_type, data, self.network_manager.is_resource_visible)
+        self.networks = self.network_manager.get_resources()
+        self.filtered_networks = self.network_manager.get_filtered_resources()
+        return False
+    
     def _on_data_updated(self):
         """Handler for data update."""
         self.networks = self.network_manager.get_resources()
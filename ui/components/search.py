@@ -2,6 +2,8 @@ import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GObject
 
+from core.search_index import SearchIndex, build_search_text
+
 
 class SearchBar(Gtk.Box):
     __gsignals__ = {
@@ -275,8 +277,11 @@ class ResourceFilter:
     A utility class for filtering Docker resources.
     """
     
+    # Fields matched by the search text
+    SEARCH_FIELDS = ("Names", "Image", "Repository", "Tag", "Id", "Status", "State", "Driver", "Scope")
+    
     @staticmethod
-    def filter_resources(resources, search_text="", filters=None):
+    def filter_resources(resources, search_text="", filters=None, search_index=None):
         """
         Filter a list of resources based on search text and filters.
         
@@ -284,6 +289,8 @@ class ResourceFilter:
             resources (list): List of resource dictionaries
             search_text (str): Search text to match against
             filters (dict): Dictionary of filters to apply
+            search_index (SearchIndex): Index built by build_search_index for
+                these resources, reused across queries
             
         Returns:
             list: Filtered list of resources
@@ -296,7 +303,7 @@ class ResourceFilter:
         # Apply search text filter
         if search_text:
             filtered_resources = ResourceFilter._apply_search_filter(
-                filtered_resources, search_text
+                filtered_resources, search_text, search_index
             )
         
         # Apply specific filters
@@ -308,38 +315,34 @@ class ResourceFilter:
         return filtered_resources
     
     @staticmethod
-    def _apply_search_filter(resources, search_text):
-        """Apply search text filter to resources."""
-        search_lower = search_text.lower()
-        filtered = []
+    def build_search_index(resources):
+        """
+        Build a search index to reuse while the resources do not change.
         
-        for resource in resources:
-            # Search in common fields
-            searchable_fields = [
-                resource.get("Names", []),
-                resource.get("Image", ""),
-                resource.get("Repository", ""),
-                resource.get("Tag", ""),
-                resource.get("Id", ""),
-                resource.get("Status", ""),
-                resource.get("State", ""),
-                resource.get("Driver", ""),
-                resource.get("Scope", "")
-            ]
-            
-            # Flatten lists and convert to strings
-            searchable_text = []
-            for field in searchable_fields:
-                if isinstance(field, list):
-                    searchable_text.extend(field)
-                else:
-                    searchable_text.append(str(field))
+        Args:
+            resources (list): List of resource dictionaries
             
-            # Check if any field contains the search text
-            if any(search_lower in text.lower() for text in searchable_text):
-                filtered.append(resource)
+        Returns:
+            SearchIndex: Index for filter_resources
+        """
+        return SearchIndex(resources, ResourceFilter._get_search_text)
+    
+    @staticmethod
+    def _get_search_text(resource):
+        """Lowercased text of the searchable fields of a resource."""
+        return build_search_text(resource.get(field, "") for field in ResourceFilter.SEARCH_FIELDS)
+    
+    @staticmethod
+    def _apply_search_filter(resources, search_text, search_index=None):
+        """Apply search text filter to resources."""
+        if search_index is not None and search_index.resources is resources:
+            return search_index.search(search_text)
         
-        return filtered
+        search_lower = search_text.lower()
+        return [
+            resource for resource in resources
+            if search_lower in ResourceFilter._get_search_text(resource)
+        ]
     
     @staticmethod
     def _apply_filter(resources, filter_name, filter_value):
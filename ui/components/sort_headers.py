@@ -0,0 +1,99 @@
+import gi
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+
+
+class SortHeaders:
+    """
+    Clickable column headers sorting through a ResourceManager.
+
+    A click sorts by the column (again to reverse it); the previous sort
+    columns are kept as tie-breakers. The manager sorts from its cached
+    permutations and announces the new order with 'ui_update'.
+
+    Gtk.TreeView columns report clicks directly. A Gtk.ColumnView sorts
+    through its sorter: the columns get sorters that are never used (the
+    model is not wrapped in a Gtk.SortListModel) and only the primary
+    column and order of the view's sorter are forwarded to the manager.
+    """
+
+    def __init__(self, manager):
+        """
+        Initialize the headers.
+
+        Args:
+            manager: ResourceManager whose SORT_KEYS the columns use
+        """
+        self.manager = manager
+        self._columns = {}
+        self._column_view = None
+        self._view_columns = {}
+
+    def attach(self, column: Gtk.TreeViewColumn, sort_key: str):
+        """
+        Make a column header sort by a key.
+
+        Args:
+            column: Tree view column
+            sort_key: Name of the sort key in the manager's SORT_KEYS
+        """
+        column.set_clickable(True)
+        column.connect("clicked", self._on_clicked, sort_key)
+        self._columns[sort_key] = column
+
+    def attach_view_column(self, column: Gtk.ColumnViewColumn, sort_key: str):
+        """
+        Make a column view header sort by a key.
+
+        Args:
+            column: Column view column
+            sort_key: Name of the sort key in the manager's SORT_KEYS
+        """
+        column.set_sorter(Gtk.CustomSorter.new(_keep_order, None))
+        self._view_columns[sort_key] = column
+
+    def attach_column_view(self, column_view: Gtk.ColumnView):
+        """
+        Forward the header clicks of a column view to the manager.
+
+        Args:
+            column_view: Column view whose columns were attached
+        """
+        self._column_view = column_view
+        column_view.get_sorter().connect("changed", self._on_sorter_changed)
+
+    def update_indicators(self):
+        """Show the direction of the primary sort column."""
+        primary = self.manager.current_sort[0] if self.manager.current_sort else None
+        for sort_key, column in self._columns.items():
+            is_primary = primary is not None and primary[0] == sort_key
+            column.set_sort_indicator(is_primary)
+            if is_primary:
+                column.set_sort_order(Gtk.SortType.DESCENDING if primary[1] else Gtk.SortType.ASCENDING)
+
+        if self._column_view is not None:
+            column = self._view_columns.get(primary[0]) if primary is not None else None
+            order = Gtk.SortType.DESCENDING if primary is not None and primary[1] else Gtk.SortType.ASCENDING
+            # Emits 'changed', which is ignored while it matches the manager
+            self._column_view.sort_by_column(column, order)
+
+    def _on_clicked(self, column: Gtk.TreeViewColumn, sort_key: str):
+        self.manager.sort_by(sort_key)
+        self.update_indicators()
+
+    def _on_sorter_changed(self, sorter: Gtk.ColumnViewSorter, change):
+        column = sorter.get_primary_sort_column()
+        if column is None:
+            return
+        sort_key = next((key for key, view_column in self._view_columns.items() if view_column == column), None)
+        if sort_key is None:
+            return
+        descending = sorter.get_primary_sort_order() == Gtk.SortType.DESCENDING
+        primary = self.manager.current_sort[0] if self.manager.current_sort else None
+        if primary != (sort_key, descending):
+            self.manager.sort_by(sort_key, descending)
+
+
+def _keep_order(first, second, user_data) -> int:
+    """Column sorter of a column view sorted by its manager: never reorders."""
+    return 0
@@ -1,56 +1,375 @@
 import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib, GObject
-from typing import List, Any, Callable, Optional
+from typing import List, Any, Callable, Dict, Optional, Sequence, Tuple
+
+from .height_cache import HeightCache
+
+
+class RowRecycler:
+    """
+    Maps the visible window of a long list onto a pool of row widgets.
+
+    Rows are created only while the pool is smaller than the window (the
+    viewport plus buffer_size rows on each side); a row scrolled out of the
+    window is rebound to an item scrolled in, so scrolling neither creates
+    nor destroys widgets. Rows are positioned absolutely at the prefix
+    offset of their item. The recycler holds no GTK state: the owner
+    supplies functions to create, bind, place and hide a row.
+
+    With measure_row, rows may differ in height: items start at the
+    estimated item_height and every bound row is measured, correcting the
+    HeightCache entry of its item. A correction above the viewport is
+    reported as a scroll correction, so the visible rows do not jump.
+    """
+
+    # Bind passes per update while measured heights change the window
+    MAX_PASSES = 3
+
+    def __init__(self, create_row: Callable[[], Any], bind_row: Callable[[Any, Any], None],
+                 place_row: Callable[[Any, float], None], hide_row: Callable[[Any], None],
+                 item_height: int = 60, buffer_size: int = 10,
+                 measure_row: Optional[Callable[[Any], int]] = None,
+                 get_key: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize the recycler.
+
+        Args:
+            create_row: Function creating an empty row
+            bind_row: Function showing an item in a row
+            place_row: Function moving a row to a vertical offset (and showing it)
+            hide_row: Function hiding a row left unused
+            item_height: Height of one row in pixels (the estimate if rows
+                are measured)
+            buffer_size: Rows kept bound above and below the viewport
+            measure_row: Function returning the height of a bound row (all
+                rows are item_height high if None)
+            get_key: Function returning a stable key of an item, so measured
+                heights survive set_items (kept by position if None)
+        """
+        self._create_row = create_row
+        self._bind_row = bind_row
+        self._place_row = place_row
+        self._hide_row = hide_row
+        self._measure_row = measure_row
+        self._get_key = get_key
+        self.item_height = item_height
+        self.buffer_size = buffer_size
+
+        self.heights = HeightCache(item_height)
+        # Measured heights by item key, carried over to the next items
+        self._measured: Dict[Any, int] = {}
+        self._layout_dirty = False
+        self._anchor = 0
+        self._scroll_correction = 0
+
+        self.items = ()
+        self.visible_range = (0, 0)
+        self._bound: Dict[int, Any] = {}
+        self._free: List[Any] = []
+        # The first _hidden rows of the free list are already off screen
+        self._hidden = 0
+        self._rows: List[Any] = []
+        self._row_index: Dict[int, int] = {}
+        self._stats = {'created': 0, 'bound': 0}
+
+    @property
+    def pool_size(self) -> int:
+        return len(self._rows)
+
+    @property
+    def total_height(self) -> int:
+        return self.heights.total
+
+    def get_offset(self, index: int) -> int:
+        """
+        Get the vertical offset of an item.
+
+        Args:
+            index: Item index (len(items) for the end of the list)
+
+        Returns:
+            Offset in pixels
+        """
+        return self.heights.get_offset(index)
+
+    def get_index_at(self, offset: float) -> int:
+        """
+        Get the item at a vertical offset.
+
+        Args:
+            offset: Offset in pixels
+
+        Returns:
+            Item index, clamped to the list
+        """
+        return self.heights.get_index_at(offset)
+
+    def set_items(self, items: Sequence[Any]):
+        """
+        Replace the items; bound rows are rebound at the next update.
+
+        Args:
+            items: Items to show, in display order
+        """
+        self.items = items
+        self.visible_range = (0, 0)
+        # Rows stay in the pool, so the next update rebinds instead of creating
+        for index in list(self._bound):
+            self._release(index)
+
+        heights = {}
+        if self._get_key is not None and self._measured:
+            measured = {}
+            for index, item in enumerate(items):
+                key = self._get_key(item)
+                height = self._measured.get(key)
+                if height is not None:
+                    heights[index] = measured[key] = height
+            # Forget the items that are gone
+            self._measured = measured
+        # Unmeasured items are estimated from what was measured so far
+        self.heights.reset(len(items), heights, self.heights.get_measured_mean())
+
+    def invalidate_heights(self):
+        """Forget the measured heights, e.g. after the row width changed."""
+        self._measured = {}
+        self.heights.reset(len(self.items))
+        self.visible_range = (0, 0)
+        for index in list(self._bound):
+            self._release(index)
+
+    def take_scroll_correction(self) -> int:
+        """
+        Get and clear the height change above the viewport since the last call.
+
+        Returns:
+            Pixels to add to the scroll position to keep the visible rows in place
+        """
+        correction = self._scroll_correction
+        self._scroll_correction = 0
+        return correction
+
+    def update(self, scroll_value: float, viewport_height: float) -> bool:
+        """
+        Bind the rows of the window around the viewport.
+
+        Only items entering the window are bound; rows that stay in it are
+        left untouched. Measuring the new rows may change the window, which
+        is then bound again (at most MAX_PASSES times).
+
+        Args:
+            scroll_value: Vertical scroll position in pixels
+            viewport_height: Height of the viewport in pixels
+
+        Returns:
+            True if any row was rebound or moved
+        """
+        self._anchor = self.get_index_at(scroll_value)
+        changed = False
+        for _ in range(self.MAX_PASSES):
+            # Measured rows above the anchor shifted it by the correction
+            value = scroll_value + self._scroll_correction
+            count = len(self.items)
+            if count:
+                start = max(0, self.get_index_at(value) - self.buffer_size)
+                end = min(count, self.get_index_at(value + viewport_height) + 1 + self.buffer_size)
+            else:
+                start = end = 0
+
+            if (start, end) == self.visible_range and len(self._bound) == end - start:
+                break
+            self.visible_range = (start, end)
+
+            released = [index for index in self._bound if index < start or index >= end]
+            for index in released:
+                self._release(index)
+            changed = changed or bool(released)
+
+            for index in range(start, end):
+                if index not in self._bound:
+                    self._bind(index)
+                    changed = True
+
+            if not self._layout_dirty:
+                break
+            # A measured row moved the rows after it
+            self._layout_dirty = False
+            for index, row in self._bound.items():
+                self._place_row(row, self.get_offset(index))
+
+        # Rows not reused for the new window leave the screen
+        for row in self._free[self._hidden:]:
+            self._hide_row(row)
+        self._hidden = len(self._free)
+        return changed
+
+    def get_item(self, row: Any) -> Optional[Any]:
+        """
+        Get the item a row currently shows.
+
+        Args:
+            row: Row widget from the pool
+
+        Returns:
+            Item, or None if the row is unused
+        """
+        index = self._row_index.get(id(row))
+        return self.items[index] if index is not None else None
+
+    def get_visible_items(self) -> List[Any]:
+        """
+        Get the items of the bound window.
+
+        Returns:
+            List of items
+        """
+        start, end = self.visible_range
+        return list(self.items[start:end])
+
+    def get_rows(self) -> List[Any]:
+        """
+        Get every row of the pool.
+
+        Returns:
+            List of row widgets, bound or not
+        """
+        return list(self._rows)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get recycling statistics.
+
+        Returns:
+            Dictionary with created rows, bind operations and pool size
+        """
+        return {**self._stats, 'pool': len(self._rows), 'measured': self.heights.measured_count}
+
+    def _bind(self, index: int):
+        if self._free:
+            row = self._free.pop()
+            self._hidden = min(self._hidden, len(self._free))
+        else:
+            row = self._create_row()
+            self._rows.append(row)
+            self._stats['created'] += 1
+        self._bound[index] = row
+        self._row_index[id(row)] = index
+        item = self.items[index]
+        self._bind_row(row, item)
+        if self._measure_row is not None:
+            self._set_height(index, item, self._measure_row(row))
+        self._place_row(row, self.get_offset(index))
+        self._stats['bound'] += 1
+
+    def _set_height(self, index: int, item: Any, height: int):
+        change = self.heights.set(index, height)
+        if self._get_key is not None:
+            self._measured[self._get_key(item)] = self.heights.get(index)
+        if change:
+            self._layout_dirty = True
+            if index < self._anchor:
+                self._scroll_correction += change
+
+    def _release(self, index: int):
+        row = self._bound.pop(index)
+        del self._row_index[id(row)]
+        self._free.append(row)
 
 
 class VirtualList(Gtk.Box):
+    """
+    Scrollable list that keeps only the visible rows as widgets.
+
+    The rows live on a Gtk.Fixed as tall as the whole list, at absolute
+    positions computed by RowRecycler, and are rebound to new items as
+    they scroll out of view. Scroll events are coalesced into one update
+    per frame with a tick callback.
+
+    With variable_height, rows take their natural height at the list
+    width (cards, rows with wrapped port lists): each bound row is
+    measured and item_height is only the estimate for rows not seen yet.
+    """
+
     __gtype_name__ = 'VirtualList'
-    def __init__(self, item_height: int = 60, buffer_size: int = 10):
+
+    def __init__(self, item_height: int = 60, buffer_size: int = 10,
+                 variable_height: bool = False, get_key: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize the list.
+
+        Args:
+            item_height: Height of one row in pixels (the estimate with
+                variable_height)
+            buffer_size: Rows kept bound above and below the viewport
+            variable_height: Measure every bound row instead of assuming item_height
+            get_key: Function returning a stable key of an item, e.g. the
+                resource ID, so measured heights survive set_items
+        """
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         
-        self.item_height = item_height
-        self.buffer_size = buffer_size
-        self.items = []
-        self.visible_range = (0, 0)
-        self.visible_widgets = {}
         self.item_factory = None
+        self.item_binder = None
         self.on_item_clicked = None
+        self.variable_height = variable_height
+        self._row_width = -1
+        self._tick_id = None
+        
+        self._recycler = RowRecycler(
+            self._create_row, self._bind_row, self._place_row, self._hide_row,
+            item_height, buffer_size,
+            measure_row=self._measure_row if variable_height else None,
+            get_key=get_key
+        )
         
         self.scrolled_window = Gtk.ScrolledWindow()
         self.scrolled_window.set_vexpand(True)
         self.scrolled_window.set_hexpand(True)
         
-        self.list_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+        self.canvas = Gtk.Fixed()
+        self.scrolled_window.set_child(self.canvas)
+        self.append(self.scrolled_window)
+        
+        adjustment = self.scrolled_window.get_vadjustment()
+        adjustment.connect('value-changed', self._on_scroll)
+        # Page size changes when the list is resized
+        adjustment.connect('changed', self._on_scroll)
         
-        self.size_widget = Gtk.Box()
-        self.size_widget.set_size_request(-1, 0)
+    @property
+    def items(self) -> Sequence[Any]:
+        return self._recycler.items
         
-        self.list_container.append(self.size_widget)
-        self.scrolled_window.set_child(self.list_container)
-        self.append(self.scrolled_window)
+    @property
+    def item_height(self) -> int:
+        return self._recycler.item_height
         
-        self.scrolled_window.get_vadjustment().connect('value-changed', self._on_scroll)
+    @property
+    def visible_range(self) -> Tuple[int, int]:
+        return self._recycler.visible_range
         
-    def set_items(self, items: List[Any]):
+    def set_items(self, items: Sequence[Any]):
         """
         Set the list items.
 
         Args:
-            items: List of items to display
+            items: Items to display (kept by reference, e.g. a snapshot tuple)
         """
-        self.items = items
+        self._recycler.set_items(items)
         self._update_size()
         self._update_visible_items()
         
-    def set_item_factory(self, factory: Callable[[Any], Gtk.Widget]):
+    def set_item_factory(self, factory: Callable[[], Gtk.Widget],
+                         binder: Callable[[Gtk.Widget, Any], None]):
         """
-        Set the item factory.
+        Set the row factory.
 
         Args:
-            factory: Function that creates a widget for an item
+            factory: Function that creates an empty row widget
+            binder: Function that shows an item in a row widget; called
+                whenever a row is reused for another item
         """
         self.item_factory = factory
+        self.item_binder = binder
         
     def set_on_item_clicked(self, callback: Callable[[Any], None]):
         """
@@ -63,92 +382,78 @@ class VirtualList(Gtk.Box):
         
     def _update_size(self):
         """Update the size of the list container."""
-        total_height = len(self.items) * self.item_height
-        self.size_widget.set_size_request(-1, total_height)
+        self.canvas.set_size_request(-1, self._recycler.total_height)
         
     def _update_visible_items(self):
-        """Update the visible items in the list."""
-        if not self.items or not self.item_factory:
+        """Rebind the rows around the viewport."""
+        if not self.item_factory:
             return
             
+        width = self.scrolled_window.get_width()
+        if width > 0 and width != self._row_width:
+            self._row_width = width
+            for row in self._recycler.get_rows():
+                row.set_size_request(width, self._get_row_height())
+            if self.variable_height:
+                # Text wraps differently at the new width
+                self._recycler.invalidate_heights()
+            
         adjustment = self.scrolled_window.get_vadjustment()
-        scroll_value = adjustment.get_value()
-        viewport_height = adjustment.get_page_size()
+        self._recycler.update(adjustment.get_value(), adjustment.get_page_size())
         
-        start_index = max(0, int(scroll_value / self.item_height) - self.buffer_size)
-        end_index = min(
-            len(self.items),
-            int((scroll_value + viewport_height) / self.item_height) + self.buffer_size
-        )
+        if self.variable_height:
+            self._update_size()
+            correction = self._recycler.take_scroll_correction()
+            if correction:
+                # Keep the visible rows in place when rows above them were measured
+                adjustment.set_value(adjustment.get_value() + correction)
         
-        if self.visible_range == (start_index, end_index):
-            return
-            
-        self.visible_range = (start_index, end_index)
+    def _get_row_height(self) -> int:
+        """Height request of a row: natural height when rows are measured."""
+        return -1 if self.variable_height else self.item_height
         
-        widgets_to_remove = []
-        for index, widget in self.visible_widgets.items():
-            if index < start_index or index >= end_index:
-                widgets_to_remove.append(index)
-                
-        for index in widgets_to_remove:
-            widget = self.visible_widgets.pop(index)
-            self.list_container.remove(widget)
-            
-        for index in range(start_index, end_index):
-            if index not in self.visible_widgets:
-                item = self.items[index]
-                widget = self._create_item_widget(item, index)
-                self.visible_widgets[index] = widget
-                
-                self._insert_widget_at_position(widget, index)
-                
-    def _create_item_widget(self, item: Any, index: int) -> Gtk.Widget:
-        """
-        Create a widget for an item.
-
-        Args:
-            item: Item data
-            index: Item index
-            
-        Returns:
-            Item widget
-        """
-        widget = self.item_factory(item)
-        widget.set_size_request(-1, self.item_height)
+    def _create_row(self) -> Gtk.Widget:
+        """Create a pooled row with its click handler."""
+        row = self.item_factory()
+        row.set_size_request(self._row_width, self._get_row_height())
         
-        if self.on_item_clicked:
-            click_controller = Gtk.GestureClick()
-            click_controller.connect('pressed', lambda controller, n_press, x, y: self._on_item_click(item))
-            widget.add_controller(click_controller)
-            
-        return widget
+        click_controller = Gtk.GestureClick()
+        click_controller.connect('pressed', lambda controller, n_press, x, y: self._on_item_click(row))
+        row.add_controller(click_controller)
         
-    def _insert_widget_at_position(self, widget: Gtk.Widget, index: int):
-        """
-        Insert a widget at the correct position.
-
-        Args:
-            widget: Widget to insert
-            index: Position index
-        """
-        insert_position = 1
+        self.canvas.put(row, 0, 0)
+        return row
         
-        for i in range(len(self.items)):
-            if i == index:
-                break
-            if i in self.visible_widgets:
-                insert_position += 1
-                
-        self.list_container.insert_child_after(widget, self.size_widget)
+    def _bind_row(self, row: Gtk.Widget, item: Any):
+        self.item_binder(row, item)
+        
+    def _measure_row(self, row: Gtk.Widget) -> int:
+        """Natural height of a bound row at the list width."""
+        minimum, natural, _, _ = row.measure(Gtk.Orientation.VERTICAL, self._row_width)
+        return natural
+        
+    def _place_row(self, row: Gtk.Widget, offset: float):
+        self.canvas.move(row, 0, offset)
+        row.set_visible(True)
+        
+    def _hide_row(self, row: Gtk.Widget):
+        row.set_visible(False)
         
     def _on_scroll(self, adjustment):
-        """Handler for scroll event."""
-        GLib.idle_add(self._update_visible_items)
+        """Handler for scroll event: update once in the next frame."""
+        if self._tick_id is None:
+            self._tick_id = self.add_tick_callback(self._on_tick)
+            
+    def _on_tick(self, widget, frame_clock):
+        """Frame callback: apply the scroll events of this frame."""
+        self._tick_id = None
+        self._update_visible_items()
+        return GLib.SOURCE_REMOVE
         
-    def _on_item_click(self, item: Any):
+    def _on_item_click(self, row: Gtk.Widget):
         """Handler for item click."""
-        if self.on_item_clicked:
+        item = self._recycler.get_item(row)
+        if self.on_item_clicked and item is not None:
             self.on_item_clicked(item)
             
     def scroll_to_item(self, index: int):
@@ -160,7 +465,7 @@ class VirtualList(Gtk.Box):
         """
         if 0 <= index < len(self.items):
             adjustment = self.scrolled_window.get_vadjustment()
-            target_value = index * self.item_height
+            target_value = self._recycler.get_offset(index)
             adjustment.set_value(target_value)
             
     def get_visible_items(self) -> List[Any]:
@@ -170,11 +475,20 @@ class VirtualList(Gtk.Box):
         Returns:
             List of visible items
         """
-        start, end = self.visible_range
-        return self.items[start:end]
+        return self._recycler.get_visible_items()
+        
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get row recycling statistics.
+
+        Returns:
+            Dictionary with created rows, bind operations and pool size
+        """
+        return self._recycler.get_stats()
         
     def refresh(self):
-        """Update the list display."""
+        """Rebind the visible rows, e.g. after the items changed in place."""
+        self._recycler.set_items(self.items)
         self._update_visible_items()
 
 
@@ -3,7 +3,9 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
 
 from ui.components.search import SearchBar
-from ui.components.card import ResourceCard
+from ui.components.card_grid import CardGrid
+from ui.components.column_list import KeyedListModel, ColumnList
+from ui.components.sort_headers import SortHeaders
 from core.base_operations import BaseOperations
 
 
@@ -19,7 +21,6 @@ class VolumesView(Gtk.Box):
         
         self.search_bar = None
         self.filter_bar = None
-        self.volumes_list = None
         self.volumes_grid = None
         self.view_mode = "list"  # "list" или "cards"
         
@@ -77,52 +78,26 @@ class VolumesView(Gtk.Box):
     
     def _create_list_view(self):
         """Create the list view."""
-        self.volumes_list = Gtk.ListBox()
-        self.volumes_list.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
-        self.volumes_list.add_css_class("volumes-list")
-        
-        self.list_store = Gtk.ListStore(str, str, str, str, str)  # Name, Driver, Mountpoint, Size, Status
-        
-        self.tree_view = Gtk.TreeView(model=self.list_store)
-        self.tree_view.set_headers_visible(True)
-        
-        selection = self.tree_view.get_selection()
-        selection.set_mode(Gtk.SelectionMode.MULTIPLE)
+        self.list_rows = KeyedListModel(self.volume_manager.get_resource_id, self._get_volume_row)
         
         columns = [
-            ("Имя", 0, 200),
-            ("Драйвер", 1, 100),
-            ("Точка монтирования", 2, 300),
-            ("Размер", 3, 100),
-            ("Статус", 4, 100)
+            ("Имя", 0, 200, 'name'),
+            ("Драйвер", 1, 100, 'driver'),
+            ("Точка монтирования", 2, 300, 'mountpoint'),
+            ("Размер", 3, 100, None),
+            ("Статус", 4, 100, None)
         ]
         
-        for title, column_id, width in columns:
-            renderer = Gtk.CellRendererText()
-            column = Gtk.TreeViewColumn(title, renderer, text=column_id)
-            column.set_min_width(width)
-            column.set_resizable(True)
-            self.tree_view.append_column(column)
-        
-        list_container = Gtk.ScrolledWindow()
-        list_container.set_vexpand(True)
-        list_container.set_child(self.tree_view)
-        
-        self.list_container = list_container
+        self.sort_headers = SortHeaders(self.volume_manager)
+        self.column_list = ColumnList(self.list_rows, columns, self.sort_headers)
+        self.list_container = self.column_list.widget
     
     def _create_cards_view(self):
         """Create the cards view."""
-        self.volumes_grid = Gtk.FlowBox()
-        self.volumes_grid.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
-        self.volumes_grid.set_max_children_per_line(4)
-        self.volumes_grid.set_min_children_per_line(2)
-        self.volumes_grid.add_css_class("volumes-grid")
-        
-        grid_container = Gtk.ScrolledWindow()
-        grid_container.set_vexpand(True)
-        grid_container.set_child(self.volumes_grid)
-        
-        self.grid_container = grid_container
+        self.card_rows = KeyedListModel(self.volume_manager.get_resource_id)
+        self.card_grid = CardGrid(self.card_rows, "volume", self._on_card_clicked)
+        self.volumes_grid = self.card_grid.grid_view
+        self.grid_container = self.card_grid.widget
     
     def _show_list_view(self):
         """Show the list view."""
@@ -148,8 +123,8 @@ class VolumesView(Gtk.Box):
     
     def _load_data(self):
         """Load the data."""
-        self.volumes = self.volume_manager.get_all_volumes_formatted()
-        self.filtered_volumes = self.volumes.copy()
+        self.volumes = self.volume_manager.get_resources()
+        self.filtered_volumes = self.volumes
         self._update_view()
     
     def _update_view(self):
@@ -161,52 +136,34 @@ class VolumesView(Gtk.Box):
     
     def _update_list_view(self):
         """Update the list view."""
-        self.list_store.clear()
-        
-        for volume in self.filtered_volumes:
-            self.list_store.append([
-                volume.get('Name', ''),
-                volume.get('Driver', ''),
-                volume.get('Mountpoint', ''),
-                volume.get('Size', ''),
-                volume.get('Status', '')
-            ])
+        self.list_rows.reset(self.filtered_volumes)
+    
+    def _get_volume_row(self, volume):
+        """Get the list view columns of a volume."""
+        return [
+            volume.get('Name', ''),
+            volume.get('Driver', ''),
+            volume.get('Mountpoint', ''),
+            volume.get('Size', ''),
+            volume.get('Status', '')
+        ]
     
     def _update_cards_view(self):
         """Update the cards view."""
-        for child in self.volumes_grid:
-            self.volumes_grid.remove(child)
-        
-        for volume in self.filtered_volumes:
-            card = self._create_volume_card(volume)
-            self.volumes_grid.append(card)
-    
-    def _create_volume_card(self, volume):
-        """Create the volume card."""
-        card = ResourceCard(
-            resource_type="volume",
-            resource_data=volume
-        )
-        
-        gesture = Gtk.GestureClick()
-        gesture.connect("pressed", self._on_card_clicked, volume)
-        card.add_controller(gesture)
-        
-        return card
+        self.card_rows.reset(self.filtered_volumes)
     
     def _on_search_changed(self, search_bar, query):
         """Handler for search change."""
         self.current_search_text = query
-        self.volume_manager.search(query)
-        self._apply_filters()
+        self.volume_manager.request_search(query, self.current_filters)
     
     def _apply_filters(self):
         """Apply the filters."""
-        self.volume_manager.filter(self.current_filters)
+        self.volume_manager.request_search(filters=self.current_filters)
     
     def _on_refresh(self, button):
         """Handler for refresh."""
-        self.volume_manager.refresh(self._on_data_updated)
+        self.volume_manager.refresh()  # Changed rows arrive as items_* events
     
     def _on_toggle_view(self, button):
         """Handler for toggle view."""
@@ -257,34 +214,23 @@ class VolumesView(Gtk.Box):
     def _on_select_all(self, button):
         """Select all volumes."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().select_all()
+            self.column_list.selection.select_all()
         else:
-            self.volumes_grid.select_all()
+            self.card_grid.selection.select_all()
     
     def _on_deselect_all(self, button):
         """Unselect all volumes."""
         if self.view_mode == "list":
-            self.tree_view.get_selection().unselect_all()
+            self.column_list.selection.unselect_all()
         else:
-            self.volumes_grid.unselect_all()
+            self.card_grid.selection.unselect_all()
     
     def _on_delete_selected(self, button):
         """Delete selected volumes."""
         if self.view_mode == "list":
-            selection = self.tree_view.get_selection()
-            model, paths = selection.get_selected_rows()
-            selected_volumes = []
-            for path in paths:
-                iter = model.get_iter(path)
-                volume_name = model.get_value(iter, 0)  # First column - name
-                selected_volumes.append(volume_name)
+            selected_volumes = [volume.get('Name', '') for volume in self.column_list.get_selected()]
         else:
-            selected_volumes = []
-            for child in self.volumes_grid.get_selected_children():
-                # Get the volume data from the card
-                card = child.get_child()
-                if hasattr(card, 'resource_data'):
-                    selected_volumes.append(card.resource_data.get('Name', ''))
+            selected_volumes = [volume.get('Name', '') for volume in self.card_grid.get_selected()]
         
         if selected_volumes:
             print(f"Удаление выбранных томов: {selected_volumes} - не реализовано")
@@ -293,14 +239,22 @@ class VolumesView(Gtk.Box):
     
     def _on_volume_manager_event(self, event_type, data):
         """Handler for volume manager events."""
-        if event_type == 'loading_complete':
-            GLib.idle_add(self._on_data_updated)
+        if event_type in ('items_added', 'items_removed', 'items_changed'):
+            GLib.idle_add(self._on_items_changed, event_type, data)
         elif event_type == 'ui_update':
             GLib.idle_add(self._on_data_updated)
     
+    def _on_items_changed(self, event_type, data):
+        """Handler for keyed changes: patch only the affected rows."""
+        rows = self.list_rows if self.view_mode == "list" else self.card_rows
+        rows.apply(event_type, data, self.volume_manager.is_resource_visible)
+        self.volumes = self.volume_manager.get_resources()
+        self.filtered_volumes = self.volume_manager.get_filtered_resources()
+        return False
+    
     def _on_data_updated(self):
         """Handler for data update."""
-        self.volumes = self.volume_manager.get_all_volumes_formatted()
+        self.volumes = self.volume_manager.get_resources()
         self.filtered_volumes = self.volume_manager.get_filtered_resources()
         self._update_view()
         return False  # Stop the idle callback